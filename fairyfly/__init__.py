@@ -1,23 +1,99 @@
 """Fairyfly core library."""
+import os
 import importlib
-import pkgutil
 import sys
 
-from fairyfly.logutil import get_logger
+from fairyfly.logutil import get_logger, _get_log_folder
 
 
 logger = get_logger(__name__)
 
 #  find and import fairyfly extensions
 #  this is a critical step to add additional functionalities to fairyfly core library.
-extensions = {}
-for finder, name, ispkg in pkgutil.iter_modules():
-    if not name.startswith('fairyfly_') or name.count('_') > 1:
-        continue
+#  extensions are imported the first time that they are needed (eg. when the
+#  fairyfly.extensions dictionary is accessed or when extension properties or
+#  writers are requested) such that scripts and processes that do not use them
+#  do not pay for their discovery and import.
+_extensions = None
+
+
+def _extension_names():
+    """Get the names of all installed fairyfly extension modules.
+
+    Scanning all of the modules on sys.path is slow in environments with many
+    installed packages. So the names are cached in a manifest file within the
+    .fairyfly user folder along with the modification time of each sys.path
+    folder. The names are only scanned again if a folder has changed (eg.
+    because a package was installed or removed) or sys.path is different.
+    """
+    import json  # imported here since it is only needed to discover the extensions
+    signature = _sys_path_signature()
+    manifest_file = os.path.join(_get_log_folder(), 'extensions.json')
     try:
-        extensions[name] = importlib.import_module(name)
-    except Exception:
-        if (sys.version_info >= (3, 0)):
-            logger.exception('Failed to import {0}!'.format(name))
-    else:
-        logger.info('Successfully imported Fairyfly plugin: {}'.format(name))
+        with open(manifest_file) as inf:
+            manifest = json.load(inf)
+        cached = manifest[sys.executable]
+        if cached['sys_path'] == signature:
+            return cached['names']
+    except Exception:  # no valid manifest for this Python; scan sys.path
+        manifest = {}
+    import pkgutil
+    names = [name for _, name, _ in pkgutil.iter_modules()
+             if name.startswith('fairyfly_') and name.count('_') == 1]
+    manifest = manifest if isinstance(manifest, dict) else {}
+    manifest[sys.executable] = {'sys_path': signature, 'names': names}
+    try:
+        with open(manifest_file, 'w') as outf:
+            json.dump(manifest, outf)
+    except Exception:  # the user folder is not writable
+        pass
+    return names
+
+
+def _sys_path_signature():
+    """Get a list with each sys.path folder and its modification time.
+
+    The modification time is None for any folders that do not exist.
+    """
+    signature = []
+    for path in sys.path:
+        path = os.path.abspath(path or os.curdir)
+        try:
+            signature.append([path, os.stat(path).st_mtime])
+        except OSError:
+            signature.append([path, None])
+    return signature
+
+
+def _load_extensions():
+    """Import all installed fairyfly extensions if they have not been imported yet.
+
+    Returns:
+        True if the extensions were imported by this call. False if they had
+        already been imported.
+    """
+    global _extensions
+    if _extensions is not None:
+        return False
+    _extensions = {}
+    for name in _extension_names():
+        try:
+            _extensions[name] = importlib.import_module(name)
+        except Exception:
+            if (sys.version_info >= (3, 0)):
+                logger.exception('Failed to import {0}!'.format(name))
+        else:
+            logger.info('Successfully imported Fairyfly plugin: {}'.format(name))
+    return True
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """Import the extensions the first time that fairyfly.extensions is accessed."""
+        if name == 'extensions':
+            _load_extensions()
+            return _extensions
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+else:  # modules cannot have lazy attributes; import the extensions now
+    _load_extensions()
+    extensions = _extensions
@@ -1,10 +1,9 @@
 # coding: utf-8
 """Base class for all geometry objects."""
 from __future__ import division
-import uuid
 
 from ladybug_geometry.geometry3d.pointvector import Point3D
-from .typing import valid_uuid, therm_id_from_uuid
+from .typing import valid_uuid, therm_id_from_uuid, generate_uuid
 
 
 class _Base(object):
@@ -45,7 +44,7 @@ class _Base(object):
     @identifier.setter
     def identifier(self, value):
         if value is None:
-            self._identifier = str(uuid.uuid4())
+            self._identifier = generate_uuid()
         else:
             self._identifier = valid_uuid(value, 'fairyfly object identifier')
 
@@ -119,6 +118,21 @@ class _Base(object):
         """Get a copy of this object."""
         return self.__copy__()
 
+    def _duplicate_base(self, new_obj):
+        """Copy the attributes of this base object to a new uninitialized object.
+
+        This is intended to be used within the __copy__ methods of objects that
+        are created with __new__, such that the identifier, which is already
+        known to be valid, is not validated again.
+
+        Args:
+            new_obj: A new object created with __new__ to which the identifier,
+                display_name and user_data of this object will be assigned.
+        """
+        new_obj._identifier = self._identifier
+        new_obj._display_name = self._display_name
+        new_obj._user_data = None if self._user_data is None else self._user_data.copy()
+
     def _validation_message(
             self, message, raise_exception=True, detailed=False,
             code='000000', extension='Core', error_type='Unknown Error'):
@@ -9,6 +9,7 @@ from ladybug_geometry.geometry3d import Point3D, LineSegment3D, Polyline3D, Plan
 from ._base import _Base
 from .search import get_attr_nested
 from .properties import BoundaryProperties
+from .spatial import unique_points
 import fairyfly.writer.boundary as writer
 
 
@@ -37,7 +38,7 @@ class Boundary(_Base):
         * center
         * user_data
     """
-    __slots__ = ('_geometry', '_parent')
+    __slots__ = ('_geo', '_parent', '_model_counters')
 
     def __init__(self, geometry, identifier=None):
         """Initialize Boundary."""
@@ -50,8 +51,9 @@ class Boundary(_Base):
         for l_geo in geometry:
             assert isinstance(l_geo, LineSegment3D), 'Expected ladybug_geometry ' \
                 'LineSegment3D. Got {}'.format(type(l_geo))
-        self._geometry = geometry
+        self._geo = geometry
         self._parent = None  # _parent will be set when Boundary is added to an object
+        self._model_counters = None  # geometry counters of Models with the Boundary
         self._properties = BoundaryProperties(self)  # properties for extensions
 
     @classmethod
@@ -124,7 +126,24 @@ class Boundary(_Base):
     @property
     def geometry(self):
         """Get a tuple of LineSegment3D objects that represent the boundary."""
-        return self._geometry
+        return self._geo
+
+    @property
+    def _geometry(self):
+        """Get or set the tuple of LineSegment3D geometry of this Boundary.
+
+        Setting this property increments the geometry counter of each Model
+        that contains this Boundary so that the cached bounding box of the
+        Model is recomputed.
+        """
+        return self._geo
+
+    @_geometry.setter
+    def _geometry(self, value):
+        self._geo = value
+        if self._model_counters is not None:
+            for counter in self._model_counters:
+                counter[0] += 1
 
     @property
     def vertices(self):
@@ -243,30 +262,43 @@ class Boundary(_Base):
         Returns:
             A string with the message or a list with a dictionary if detailed is True.
         """
+        non_planar = self._non_planar_vertex(self.geometry, tolerance)
+        if non_planar is not None:
+            _v, plane = non_planar
+            g_ms = 'Vertex {} does not lie in the same plane.\nDistance ' \
+                'to plane is {}'.format(_v, plane.distance_to_point(_v))
+            msg = 'Boundary "{}" is not planar.\n{}'.format(self.full_id, g_ms)
+            full_msg = self._validation_message(
+                msg, raise_exception, detailed, '200101',
+                error_type='Non-Planar Geometry')
+            if detailed:  # add the out-of-plane point to helper_geometry
+                full_msg[0]['helper_geometry'] = [_v.to_dict()]
+            return full_msg
+        return [] if detailed else ''
+
+    @staticmethod
+    def _non_planar_vertex(geometry, tolerance):
+        """Get the first vertex of Boundary geometry that does not lie in its plane.
+
+        Args:
+            geometry: A tuple of LineSegment3D for the geometry of a Boundary.
+            tolerance: The minimum distance between a given vertex and the
+                plane at which the vertex is said to lie in the plane.
+
+        Returns:
+            A tuple with the out-of-plane Point3D and the Plane through the first
+            three unique vertices. None if all vertices lie in the same plane.
+        """
         # collect all of the unique points
-        pts = []
-        for seg in self.geometry:
-            for pt in seg.vertices:
-                for o_pt in pts:
-                    if pt.is_equivalent(o_pt, tolerance):
-                        break
-                else:  # the point is unique
-                    pts.append(pt)
+        pts = unique_points(
+            [pt for seg in geometry for pt in seg.vertices], tolerance)
         # evaluate the points in relation to their plane
         if len(pts) > 3:
             plane = Plane.from_three_points(*pts[:3])
             for _v in pts[3:]:
                 if plane.distance_to_point(_v) >= tolerance:
-                    g_ms = 'Vertex {} does not lie in the same plane.\nDistance ' \
-                        'to plane is {}'.format(_v, plane.distance_to_point(_v))
-                    msg = 'Boundary "{}" is not planar.\n{}'.format(self.full_id, g_ms)
-                    full_msg = self._validation_message(
-                        msg, raise_exception, detailed, '200101',
-                        error_type='Non-Planar Geometry')
-                    if detailed:  # add the out-of-plane point to helper_geometry
-                        full_msg[0]['helper_geometry'] = [_v.to_dict()]
-                    return full_msg
-        return [] if detailed else ''
+                    return _v, plane
+        return None
 
     def to_dict(self, abridged=False, included_prop=None):
         """Return Boundary as a dictionary.
@@ -299,9 +331,12 @@ class Boundary(_Base):
         return writer
 
     def __copy__(self):
-        new_shd = Boundary(self._geometry, self.identifier)
-        new_shd._display_name = self._display_name
-        new_shd._user_data = None if self.user_data is None else self.user_data.copy()
+        new_shd = Boundary.__new__(Boundary)  # skip validation of the valid identifier
+        self._duplicate_base(new_shd)
+        new_shd._geo = self._geo
+        new_shd._parent = None
+        new_shd._model_counters = None
+        new_shd._properties = BoundaryProperties(new_shd)
         new_shd._properties._duplicate_extension_attr(self._properties)
         return new_shd
 
@@ -37,13 +37,8 @@ def check_duplicate_identifiers(
     if len(dup) != 0:
         if detailed:
             # find the object display names
-            dis_names = []
-            for obj_id in dup:
-                dis_name = None
-                for obj in objects_to_check:
-                    if obj.identifier == obj_id:
-                        dis_name = obj.display_name
-                dis_names.append(dis_name)
+            id_groups = _group_by_identifier(objects_to_check)
+            dis_names = [id_groups[obj_id][-1].display_name for obj_id in dup]
             err_list = []
             for dup_id, dis_name in zip(dup, dis_names):
                 msg = 'There is a duplicated {} identifier: {}'.format(obj_name, dup_id)
@@ -104,20 +99,19 @@ def check_duplicate_identifiers_parent(
     dup = [t for t, c in collections.Counter(obj_id_iter).items() if c > 1]
     if len(dup) != 0:
         # find the relevant top-level parents
+        id_groups = _group_by_identifier(objects_to_check)
         top_par, dis_names = [], []
         for obj_id in dup:
-            rel_parents, dis_name = [], None
-            for obj in objects_to_check:
-                if obj.identifier == obj_id:
-                    dis_name = obj.display_name
-                    if obj.has_parent:
-                        try:
-                            par_obj = obj.top_level_parent
-                        except AttributeError:
-                            par_obj = obj.parent
-                        rel_parents.append(par_obj)
+            rel_parents, dup_objs = [], id_groups[obj_id]
+            for obj in dup_objs:
+                if obj.has_parent:
+                    try:
+                        par_obj = obj.top_level_parent
+                    except AttributeError:
+                        par_obj = obj.parent
+                    rel_parents.append(par_obj)
             top_par.append(rel_parents)
-            dis_names.append(dis_name)
+            dis_names.append(dup_objs[-1].display_name)
         # if a detailed dictionary is requested, then create it
         if detailed:
             err_list = []
@@ -165,6 +159,22 @@ def check_duplicate_identifiers_parent(
     return [] if detailed else ''
 
 
+def _group_by_identifier(objects_to_check):
+    """Get a dictionary mapping each identifier to the objects that have it.
+
+    The objects under each identifier are in the order they appear in the input.
+    This allows the objects with duplicated identifiers to be found with a single
+    pass over the objects rather than one pass for each duplicated identifier.
+    """
+    id_groups = {}
+    for obj in objects_to_check:
+        try:
+            id_groups[obj.identifier].append(obj)
+        except KeyError:
+            id_groups[obj.identifier] = [obj]
+    return id_groups
+
+
 def is_equivalent(object_1, object_2):
     """Check if two objects are equal with an initial check for the same instance.
     """
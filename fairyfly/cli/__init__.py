@@ -59,6 +59,7 @@ import sys
 import logging
 import json
 
+from fairyfly import _load_extensions
 from ..config import folders
 from fairyfly.cli.setconfig import set_config
 
@@ -83,7 +84,8 @@ def config(output_file):
             'python_package_path': folders.python_package_path,
             'python_scripts_path': folders.python_scripts_path,
             'python_exe_path': folders.python_exe_path,
-            'python_version': folders.python_version_str
+            'python_version': folders.python_version_str,
+            'json_backend': folders.json_backend
         }
         output_file.write(json.dumps(config_dict, indent=4))
     except Exception as e:
@@ -101,6 +103,9 @@ def viz():
 
 main.add_command(set_config, name='set-config')
 
+# import the extensions such that they can add their commands to the cli
+_load_extensions()
+
 
 if __name__ == "__main__":
     main()
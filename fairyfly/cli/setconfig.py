@@ -5,6 +5,7 @@ import logging
 import json
 
 from fairyfly.config import folders
+from fairyfly.jsonutil import JSON_BACKENDS
 
 _logger = logging.getLogger(__name__)
 
@@ -41,3 +42,30 @@ def default_simulation_folder(folder_path):
         sys.exit(1)
     else:
         sys.exit(0)
+
+
+@set_config.command('json-backend')
+@click.argument('name', required=False, type=click.Choice(JSON_BACKENDS))
+def json_backend(name):
+    """Set the json-backend configuration variable.
+
+    \b
+    Args:
+        name: The name of the library used to read and write JSON. If unspecified,
+            the json-backend will be set back to the default, which uses the
+            fastest library that is installed.
+    """
+    try:
+        config_file = folders.config_file
+        with open(config_file) as inf:
+            data = json.load(inf)
+        data['json_backend'] = name if name is not None else ''
+        with open(config_file, 'w') as fp:
+            json.dump(data, fp, indent=4)
+        msg_end = 'reset to default' if name is None else 'set to: {}'.format(name)
+        print('json-backend successfully {}.'.format(msg_end))
+    except Exception as e:
+        _logger.exception('Failed to set json-backend.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
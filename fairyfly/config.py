@@ -20,6 +20,8 @@ import subprocess
 import json
 import tempfile
 
+from .jsonutil import JSON_BACKENDS, _clear_backend
+
 
 class Folders(object):
     """Fairyfly folders.
@@ -34,6 +36,7 @@ class Folders(object):
 
     Properties:
         * default_simulation_folder
+        * json_backend
         * fairyfly_core_version
         * fairyfly_core_version_str
         * python_package_path
@@ -49,19 +52,23 @@ class Folders(object):
         # set the mute value
         self.mute = bool(mute)
 
-        # load paths from the config JSON file
+        # set the config JSON file from which paths are loaded when first requested
+        self._json_backend = None
         self.config_file = config_file
 
         # set python version to only be retrieved if requested
         self._python_version = None
         self._python_version_str = None
 
-        # search for the version of fairyfly-core and fairyfly-schema
-        self._fairyfly_core_version = self._find_fairyfly_core_version()
+        # set the version of fairyfly-core to only be retrieved if requested
+        self._fairyfly_core_version = None
+        self._fairyfly_core_version_found = False
 
     @property
     def default_simulation_folder(self):
         """Get or set the path to the default simulation folder."""
+        if self._default_simulation_folder is None:  # load it from the config file
+            self._load_from_file(self._config_file)
         return self._default_simulation_folder
 
     @default_simulation_folder.setter
@@ -75,6 +82,30 @@ class Folders(object):
             print('Path to the default simulation folder is set to: '
                   '{}'.format(self._default_simulation_folder))
 
+    @property
+    def json_backend(self):
+        """Get or set text for the name of the library used to read and write JSON.
+
+        Choose from the following options (the json option is the Python standard
+        library json module). If empty, the fastest library that is installed
+        will be used.
+
+        * orjson
+        * rapidjson
+        * json
+        """
+        if self._json_backend is None:  # load it from the config file
+            self._load_from_file(self._config_file)
+        return self._json_backend
+
+    @json_backend.setter
+    def json_backend(self, name):
+        name = name.strip().lower() if name else ''
+        assert name == '' or name in JSON_BACKENDS, 'JSON backend "{}" is not ' \
+            'supported. Choose from: {}.'.format(name, ', '.join(JSON_BACKENDS))
+        self._json_backend = name
+        _clear_backend()
+
     @property
     def fairyfly_core_version(self):
         """Get a tuple for the installed version of fairyfly-core (eg. (0, 1, 0)).
@@ -82,6 +113,9 @@ class Folders(object):
         This will be None if the version could not be sensed (it was not installed
         via pip).
         """
+        if not self._fairyfly_core_version_found:
+            self._fairyfly_core_version = self._find_fairyfly_core_version()
+            self._fairyfly_core_version_found = True
         return self._fairyfly_core_version
 
     @property
@@ -90,7 +124,7 @@ class Folders(object):
 
         This will be None if the version could not be sensed.
         """
-        if self._fairyfly_core_version is not None:
+        if self.fairyfly_core_version is not None:
             return '.'.join([str(item) for item in self._fairyfly_core_version])
         return None
 
@@ -174,7 +208,8 @@ class Folders(object):
         """Get or set the path to the config.json file from which folders are loaded.
 
         Setting this to None will result in using the config.json module included
-        in this package.
+        in this package. Note that the folders are only loaded from the file
+        the first time that they are requested.
         """
         return self._config_file
 
@@ -182,11 +217,14 @@ class Folders(object):
     def config_file(self, cfg):
         if cfg is None:
             cfg = os.path.join(os.path.dirname(__file__), 'config.json')
-        self._load_from_file(cfg)
+        assert os.path.isfile(cfg), ValueError('No file found at {}'.format(cfg))
         self._config_file = cfg
+        self._default_simulation_folder = None
+        self._json_backend = None
+        _clear_backend()
 
     def _load_from_file(self, file_path):
-        """Set all of the the properties of this object from a config JSON file.
+        """Set all of the properties of this object that are not yet set from a config.
 
         Args:
             file_path: Path to a JSON file containing the file paths. A sample of this
@@ -198,7 +236,8 @@ class Folders(object):
 
         # set the default paths to be all blank
         default_path = {
-            "default_simulation_folder": r''
+            "default_simulation_folder": r'',
+            "json_backend": r''
         }
 
         with open(file_path, 'r') as cfg:
@@ -213,7 +252,12 @@ class Folders(object):
                         default_path[key] = p.strip()
 
         # set paths for the default_simulation_folder
-        self.default_simulation_folder = default_path["default_simulation_folder"]
+        if self._default_simulation_folder is None:
+            self.default_simulation_folder = default_path["default_simulation_folder"]
+
+        # set the library used to read and write JSON
+        if self._json_backend is None:
+            self.json_backend = default_path["json_backend"]
 
     def _python_version_from_cli(self):
         """Set this object's Python version by making a call to a Python command."""
@@ -254,6 +298,15 @@ class Folders(object):
 
     def _find_package_version(self, package_name):
         """Get a tuple of 3 integers for the version of a package."""
+        try:  # first, try to get the version from the installed package metadata
+            from importlib.metadata import version, PackageNotFoundError
+        except ImportError:  # older Python; search the package folder below
+            pass
+        else:
+            try:
+                return self._version_tuple(version(package_name.replace('_', '-')))
+            except PackageNotFoundError:  # no metadata; search the package folder
+                pass
         hb_info_folder = None
         for item in os.listdir(self.python_package_path):
             if item.startswith(package_name + '-') and item.endswith('.dist-info'):
@@ -262,9 +315,18 @@ class Folders(object):
                     break
         if hb_info_folder is not None:
             hb_info_folder = hb_info_folder.replace('.dist-info', '')
-            ver = ''.join(s for s in hb_info_folder if (s.isdigit() or s == '.'))
-            if ver:  # version was found in the file path name
-                return tuple(int(d) for d in ver.split('.'))
+            return self._version_tuple(hb_info_folder)
+        return None
+
+    @staticmethod
+    def _version_tuple(version_str):
+        """Get a tuple of integers from text containing a version (eg. "0.1.0")."""
+        ver = ''.join(s for s in version_str if (s.isdigit() or s == '.'))
+        if ver:  # version was found in the text
+            try:
+                return tuple(int(d) for d in ver.strip('.').split('.'))
+            except ValueError:  # not a well-formed version
+                return None
         return None
 
 
@@ -0,0 +1,684 @@
+# coding=utf-8
+"""Read and write FFbin files, which are a compact binary format for Fairyfly Models.
+
+The geometry of a Model is stored in flat arrays of 64-bit floats along with
+tables of 32-bit integers that index the arrays. All text (identifiers,
+display names and JSON for extension properties and user_data) is stored once in
+a string table and referenced from the other tables by index. This means that
+FFbin files can be read and written without creating a dictionary for every
+object of the model and much of the file can be read directly into arrays.
+
+The file is structured as follows (all values are little-endian):
+
+* header - A 8-byte magic number followed by the format version (uint32), a
+    reserved uint32 and 15 uint64 values with the counts and byte offsets
+    of the sections below (see the HEADER_FIELDS).
+* shape table - 6 int32 for each Shape (identifier, display_name, properties,
+    user_data, first_loop, loop_count). The first four are indices in the
+    string table where -1 denotes None. The first loop is the boundary of the
+    Shape geometry and any subsequent loops are holes.
+* loop table - 2 int32 for each loop (first_vertex, vertex_count).
+* plane array - 9 float64 for the plane of each Shape (n, o, x).
+* coordinate array - 3 float64 for each vertex of each loop.
+* boundary table - 6 int32 for each Boundary (identifier, display_name,
+    properties, user_data, first_segment, segment_count).
+* segment array - 6 float64 for each LineSegment3D of the Boundaries (p, v).
+* string offsets - uint64 byte offsets of each string in the string data
+    followed by the end of the last string.
+* string data - the UTF-8 encoded strings. The first string is always the JSON
+    for the Model attributes other than its geometry.
+
+Each section begins at a byte offset that is a multiple of 8, which allows the
+arrays to be used directly from a memory-mapped file.
+"""
+import io
+import sys
+import math
+import mmap
+import json
+import struct
+from array import array
+
+from ladybug_geometry.geometry3d import Vector3D, Point3D, LineSegment3D, Plane, \
+    Face3D
+
+from .shape import Shape
+from .boundary import Boundary
+from .units import UNITS_TOLERANCES
+
+MAGIC = b'\x89FFBIN\r\n'
+VERSION = 1
+HEADER_FIELDS = (
+    'shape_count', 'loop_count', 'vertex_count', 'boundary_count', 'segment_count',
+    'string_count', 'shape_table', 'loop_table', 'plane_array', 'coordinate_array',
+    'boundary_table', 'segment_array', 'string_offsets', 'string_data',
+    'string_data_size'
+)
+HEADER_STRUCT = struct.Struct('<8sII{}Q'.format(len(HEADER_FIELDS)))
+SHAPE_FIELDS = 6  # number of int32 in each row of the shape table
+LOOP_FIELDS = 2  # number of int32 in each row of the loop table
+BOUNDARY_FIELDS = 6  # number of int32 in each row of the boundary table
+_SWAP = sys.byteorder != 'little'  # whether arrays must be byte-swapped
+# array typecode of the int32 tables, which is 'l' where a C int is not 4 bytes
+INT32 = 'i' if array('i').itemsize == 4 else 'l'
+assert array(INT32).itemsize == 4, 'No array typecode has an itemsize of 4 bytes.'
+
+
+def is_ffbin(file_path):
+    """Check whether a file is a FFbin file by reading its magic number."""
+    with io.open(file_path, 'rb') as inf:
+        return inf.read(len(MAGIC)) == MAGIC
+
+
+def write_ffbin(model, file_path, included_prop=None):
+    """Write a Fairyfly Model to a FFbin file.
+
+    Args:
+        model: A Fairyfly Model to be written to the file.
+        file_path: The full path to the FFbin file to be written.
+        included_prop: List of properties to filter keys that must be included in
+            output. For example ['therm'] will include 'therm' key if
+            available in properties to_dict. By default all the keys will be
+            included. To exclude all the keys from extensions use an empty list.
+    """
+    strings, string_index = [], {}
+
+    def _str_i(value):
+        """Get the index of a string in the string table, adding it if needed."""
+        if value is None:
+            return -1
+        try:
+            return string_index[value]
+        except KeyError:
+            string_index[value] = len(strings)
+            strings.append(value)
+            return len(strings) - 1
+
+    def _json_i(value):
+        """Get the index of a JSON-serializable object in the string table."""
+        if value is None:
+            return -1
+        return _str_i(json.dumps(value, sort_keys=True, separators=(',', ':')))
+
+    # the first string is the JSON of the model attributes other than the geometry
+    header = {'type': 'Model', 'identifier': model.identifier}
+    if model._display_name is not None:
+        header['display_name'] = model.display_name
+    header['units'] = model.units
+    header['properties'] = model.properties.to_dict(included_prop)
+    if model.tolerance != 0:
+        header['tolerance'] = model.tolerance
+    if model.angle_tolerance != 0:
+        header['angle_tolerance'] = model.angle_tolerance
+    if model.user_data is not None:
+        header['user_data'] = model.user_data
+    _json_i(header)
+
+    # write the shape geometry into the arrays
+    shape_table, loop_table = array(INT32), array(INT32)
+    planes, coords = array('d'), array('d')
+    vert_count = 0
+    for shape in model.shapes:
+        geo = shape.geometry
+        loops = [geo.boundary] if not geo.has_holes else [geo.boundary] + list(geo.holes)
+        shape_table.extend((
+            _str_i(shape.identifier), _str_i(shape._display_name),
+            _json_i(shape.properties.to_dict(True, included_prop)),
+            _json_i(shape.user_data), len(loop_table) // LOOP_FIELDS, len(loops)))
+        for loop in loops:
+            loop_table.extend((vert_count, len(loop)))
+            for pt in loop:
+                coords.extend((pt.x, pt.y, pt.z))
+            vert_count += len(loop)
+        pl = geo.plane
+        planes.extend((pl.n.x, pl.n.y, pl.n.z, pl.o.x, pl.o.y, pl.o.z,
+                       pl.x.x, pl.x.y, pl.x.z))
+
+    # write the boundary geometry into the arrays
+    bound_table, segments = array(INT32), array('d')
+    seg_count = 0
+    for bound in model.boundaries:
+        bound_table.extend((
+            _str_i(bound.identifier), _str_i(bound._display_name),
+            _json_i(bound.properties.to_dict(True, included_prop)),
+            _json_i(bound.user_data), seg_count, len(bound.geometry)))
+        for seg in bound.geometry:
+            segments.extend((seg.p.x, seg.p.y, seg.p.z, seg.v.x, seg.v.y, seg.v.z))
+        seg_count += len(bound.geometry)
+
+    # encode the string table
+    str_offsets, str_data = [0], []
+    for value in strings:
+        encoded = value.encode('utf-8')
+        str_data.append(encoded)
+        str_offsets.append(str_offsets[-1] + len(encoded))
+    str_data = b''.join(str_data)
+    str_offsets = struct.pack('<{}Q'.format(len(str_offsets)), *str_offsets)
+
+    # lay out the sections of the file and write them
+    sections = [_array_bytes(a) for a in (shape_table, loop_table, planes, coords,
+                                          bound_table, segments)]
+    sections.extend([str_offsets, str_data])
+    offsets, position = [], _aligned(HEADER_STRUCT.size)
+    for section in sections:
+        offsets.append(position)
+        position = _aligned(position + len(section))
+    header_values = [
+        len(shape_table) // SHAPE_FIELDS, len(loop_table) // LOOP_FIELDS,
+        vert_count, len(bound_table) // BOUNDARY_FIELDS, seg_count, len(strings)
+    ] + offsets + [len(str_data)]
+    with io.open(file_path, 'wb') as outf:
+        outf.write(HEADER_STRUCT.pack(MAGIC, VERSION, 0, *header_values))
+        written = HEADER_STRUCT.size
+        for offset, section in zip(offsets, sections):
+            outf.write(b'\x00' * (offset - written))
+            outf.write(section)
+            written = offset + len(section)
+    return file_path
+
+
+def read_ffbin(file_path):
+    """Read the objects of a Fairyfly Model from a FFbin file.
+
+    Args:
+        file_path: The full path to a FFbin file.
+
+    Returns:
+        A tuple with three items.
+
+        -   data -- A dictionary of the Model with the attributes of the Model
+            and dictionaries for each Shape and Boundary that only contain their
+            type, identifier and properties.
+
+        -   shapes -- A list of the Shapes of the Model or None if it has no Shapes.
+
+        -   boundaries -- A list of the Boundaries of the Model or None if it has
+            no Boundaries.
+    """
+    with ModelView(file_path) as view:
+        data = view.attributes
+        shapes, boundaries = None, None
+        if view.shape_count != 0:
+            shapes = [view.shape(i) for i in range(view.shape_count)]
+            data['shapes'] = [
+                {'type': 'Shape', 'identifier': shp.identifier,
+                 'properties': view._json(view._shape_table[i * SHAPE_FIELDS + 2])}
+                for i, shp in enumerate(shapes)]
+        if view.boundary_count != 0:
+            boundaries = [view.boundary(i) for i in range(view.boundary_count)]
+            data['boundaries'] = [
+                {'type': 'Boundary', 'identifier': bnd.identifier,
+                 'properties': view._json(view._bound_table[i * BOUNDARY_FIELDS + 2])}
+                for i, bnd in enumerate(boundaries)]
+    return data, shapes, boundaries
+
+
+def read_header(content):
+    """Read the header of a FFbin file into a dictionary.
+
+    Args:
+        content: A bytes-like object (eg. bytes, mmap) with the FFbin content.
+
+    Returns:
+        A dictionary with the version of the file along with each of the
+        HEADER_FIELDS, which give the counts and byte offsets of the sections.
+    """
+    values = HEADER_STRUCT.unpack_from(content, 0)
+    assert values[0] == MAGIC, 'The file is not a valid FFbin file.'
+    assert values[1] <= VERSION, 'FFbin file version {} is not supported by ' \
+        'this version of fairyfly (max version {}).'.format(values[1], VERSION)
+    header = dict(zip(HEADER_FIELDS, values[3:]))
+    header['version'] = values[1]
+    return header
+
+
+def read_array(content, header, section, typecode):
+    """Read a section of a FFbin file into a new array.
+
+    Args:
+        content: A bytes-like object (eg. bytes, mmap) with the FFbin content.
+        header: The dictionary of the header from the read_header function.
+        section: Text for the name of the section to be read (eg. coordinate_array).
+        typecode: The array typecode of the section (either INT32, d or Q).
+    """
+    arr = array(typecode)
+    st = header[section]
+    raw = content[st:st + _section_length(header, section) * arr.itemsize]
+    try:
+        arr.frombytes(raw)
+    except AttributeError:  # Python 2 array
+        arr.fromstring(raw)
+    if _SWAP:
+        arr.byteswap()
+    return arr
+
+
+class ModelView(object):
+    """A read-only view of the Model in a FFbin file that is memory-mapped.
+
+    The view gives access to the geometry of the model without creating any
+    Shape or ladybug_geometry objects. The arrays of numbers of the file are
+    exposed directly from the memory-mapped file (without copying them) such
+    that only the parts of the file that are used are read from the disk.
+    Real Shape and Boundary objects can be created from the view one at a time
+    as they are needed.
+
+    The view should be closed when it is no longer needed, either by calling
+    the close method or by using it as a context manager.
+
+    Args:
+        ffbin_file: The full path to a FFbin file.
+
+    Properties:
+        * attributes
+        * identifier
+        * display_name
+        * units
+        * tolerance
+        * shape_count
+        * boundary_count
+        * shape_identifiers
+        * boundary_identifiers
+        * shape_area
+        * min
+        * max
+
+    Usage:
+
+    .. code-block:: python
+
+        with ModelView('./construction_detail.ffbin') as view:
+            print(view.shape_area)
+            for i in view.shapes_in_bounding_box((0, 0, 0), (100, 100, 0)):
+                shape = view.shape(i)
+    """
+    __slots__ = ('_file', '_mmap', '_buffer', '_header', '_views', '_strings',
+                 '_attributes', '_shape_table', '_loop_table',
+                 '_planes', '_coords', '_bound_table', '_segments', '_str_offsets')
+
+    def __init__(self, ffbin_file):
+        """Initialize ModelView."""
+        self._file = io.open(ffbin_file, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._header = read_header(self._mmap)
+        except Exception:
+            self.close()
+            raise
+        self._buffer = memoryview(self._mmap)
+        self._views = []
+        header = self._header
+        self._shape_table = self._section_view('shape_table', INT32)
+        self._loop_table = self._section_view('loop_table', INT32)
+        self._planes = self._section_view('plane_array', 'd')
+        self._coords = self._section_view('coordinate_array', 'd')
+        self._bound_table = self._section_view('boundary_table', INT32)
+        self._segments = self._section_view('segment_array', 'd')
+        self._str_offsets = self._section_view('string_offsets', 'Q')
+        self._strings = [None] * header['string_count']
+        self._attributes = self._json(0)
+
+    @property
+    def attributes(self):
+        """Get a dictionary of the Model attributes (other than its geometry).
+
+        This includes the type, identifier, units, properties and (if they
+        exist) the display_name, tolerance, angle_tolerance and user_data.
+        """
+        return self._json(0)
+
+    @property
+    def identifier(self):
+        """Get the identifier of the Model."""
+        return self._attributes['identifier']
+
+    @property
+    def display_name(self):
+        """Get the display_name of the Model."""
+        return self._attributes.get('display_name', self._attributes['identifier'])
+
+    @property
+    def units(self):
+        """Get text for the units system in which the model geometry exists."""
+        return self._attributes.get('units') or 'Millimeters'
+
+    @property
+    def tolerance(self):
+        """Get the tolerance of the Model."""
+        tol = self._attributes.get('tolerance')
+        return UNITS_TOLERANCES[self.units] if tol is None else tol
+
+    @property
+    def shape_count(self):
+        """Get the number of Shapes in the Model."""
+        return self._header['shape_count']
+
+    @property
+    def boundary_count(self):
+        """Get the number of Boundaries in the Model."""
+        return self._header['boundary_count']
+
+    @property
+    def shape_identifiers(self):
+        """Get a list of the identifiers of all Shapes in the Model."""
+        table = self._shape_table
+        return [self._string(table[i]) for i in range(0, len(table), SHAPE_FIELDS)]
+
+    @property
+    def boundary_identifiers(self):
+        """Get a list of the identifiers of all Boundaries in the Model."""
+        table = self._bound_table
+        return [self._string(table[i]) for i in range(0, len(table), BOUNDARY_FIELDS)]
+
+    @property
+    def shape_area(self):
+        """Get the combined area of all Shapes in the Model."""
+        return sum(self.shape_areas())
+
+    @property
+    def min(self):
+        """Get a tuple of (x, y, z) for the min bounding box vertex of the Model.
+
+        This includes the vertices of all Shapes and Boundaries.
+        """
+        return self._bounds()[0]
+
+    @property
+    def max(self):
+        """Get a tuple of (x, y, z) for the max bounding box vertex of the Model.
+
+        This includes the vertices of all Shapes and Boundaries.
+        """
+        return self._bounds()[1]
+
+    def shape_loops(self, index):
+        """Get a list of the vertex arrays of each loop of a Shape.
+
+        Args:
+            index: An integer for the index of the Shape in the Model.
+
+        Returns:
+            A list of flat arrays of float coordinates (x0, y0, z0, x1, y1, z1...)
+            for the loops of the Shape geometry. The first loop is the outer
+            boundary and any subsequent loops are holes. Where possible, these
+            are memoryviews of the file and so they should not be used after
+            the view is closed.
+        """
+        first_loop, loop_count = self._shape_row(index)[4:]
+        loop_table, coords, loops = self._loop_table, self._coords, []
+        for j in range(first_loop, first_loop + loop_count):
+            st, count = loop_table[j * LOOP_FIELDS], loop_table[j * LOOP_FIELDS + 1]
+            loops.append(coords[st * 3:(st + count) * 3])
+        return loops
+
+    def shape_plane(self, index):
+        """Get a tuple of 9 numbers for the plane (n, o, x) of a Shape's geometry.
+
+        Args:
+            index: An integer for the index of the Shape in the Model.
+        """
+        return tuple(self._planes[index * 9:index * 9 + 9])
+
+    def shape_area_at(self, index):
+        """Get the area of a Shape computed from its vertices.
+
+        Args:
+            index: An integer for the index of the Shape in the Model.
+        """
+        loops = self.shape_loops(index)
+        return _loop_area(loops[0]) - sum(_loop_area(hole) for hole in loops[1:])
+
+    def shape_areas(self):
+        """Get a list with the area of each Shape in the Model."""
+        return [self.shape_area_at(i) for i in range(self.shape_count)]
+
+    def shape_bounds(self, index):
+        """Get the bounding box around a Shape.
+
+        Args:
+            index: An integer for the index of the Shape in the Model.
+
+        Returns:
+            A tuple with two tuples of (x, y, z) values for the min and max
+            of the bounding box around the Shape.
+        """
+        return _coordinate_bounds(self.shape_loops(index)[0], 3)
+
+    def shapes_in_bounding_box(self, min_pt, max_pt):
+        """Get the indices of the Shapes with bounding boxes that overlap a box.
+
+        Args:
+            min_pt: An iterable of (x, y, z) values for the min of the bounding box.
+                This can also be a Point3D.
+            max_pt: An iterable of (x, y, z) values for the max of the bounding box.
+                This can also be a Point3D.
+        """
+        min_pt, max_pt = tuple(min_pt), tuple(max_pt)
+        indices = []
+        for i in range(self.shape_count):
+            s_min, s_max = self.shape_bounds(i)
+            for a, b, c, d in zip(min_pt, max_pt, s_min, s_max):
+                if a > d or c > b:
+                    break
+            else:
+                indices.append(i)
+        return indices
+
+    def boundary_segments(self, index):
+        """Get a flat array of the (p, v) coordinates of the segments of a Boundary.
+
+        Args:
+            index: An integer for the index of the Boundary in the Model.
+
+        Returns:
+            A flat array of float values with 6 values for each LineSegment3D
+            of the Boundary (px, py, pz, vx, vy, vz). Where possible, this is a
+            memoryview of the file and so it should not be used after the view
+            is closed.
+        """
+        first_seg, seg_count = self._boundary_row(index)[4:]
+        return self._segments[first_seg * 6:(first_seg + seg_count) * 6]
+
+    def shape(self, index):
+        """Create a Shape object from the view.
+
+        Args:
+            index: An integer for the index of the Shape in the Model.
+        """
+        id_i, name_i, prop_i, data_i = self._shape_row(index)[:4]
+        loops = []
+        for loop_c in self.shape_loops(index):
+            loops.append(tuple(Point3D(loop_c[k], loop_c[k + 1], loop_c[k + 2])
+                               for k in range(0, len(loop_c), 3)))
+        pl = self.shape_plane(index)
+        plane = Plane(Vector3D(pl[0], pl[1], pl[2]), Point3D(pl[3], pl[4], pl[5]),
+                      Vector3D(pl[6], pl[7], pl[8]))
+        holes = tuple(loops[1:]) if len(loops) > 1 else None
+        # vertices were written from a Face3D and so they are already oriented
+        face = Face3D(loops[0], plane, holes, enforce_right_hand=False)
+        shape = Shape(face, self._string(id_i))
+        self._assign_attributes(shape, name_i, prop_i, data_i)
+        return shape
+
+    def boundary(self, index):
+        """Create a Boundary object from the view.
+
+        Args:
+            index: An integer for the index of the Boundary in the Model.
+        """
+        id_i, name_i, prop_i, data_i = self._boundary_row(index)[:4]
+        seg_c = self.boundary_segments(index)
+        geometry = tuple(
+            LineSegment3D(Point3D(seg_c[k], seg_c[k + 1], seg_c[k + 2]),
+                          Vector3D(seg_c[k + 3], seg_c[k + 4], seg_c[k + 5]))
+            for k in range(0, len(seg_c), 6))
+        bound = Boundary(geometry, self._string(id_i))
+        self._assign_attributes(bound, name_i, prop_i, data_i)
+        return bound
+
+    def close(self):
+        """Close the view and the file that it has mapped into memory."""
+        # if arrays from the view are still referenced, the memory map cannot be
+        # closed now and it will be closed once the arrays are garbage collected
+        buffers = getattr(self, '_views', []) + [getattr(self, '_buffer', None)]
+        for view in buffers:
+            if view is not None:
+                try:
+                    view.release()
+                except BufferError:
+                    pass
+        self._views, self._buffer = [], None
+        if getattr(self, '_mmap', None) is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def _section_view(self, section, typecode):
+        """Get a section of the file as a memoryview, falling back to an array copy.
+        """
+        st = self._header[section]
+        end = st + _section_length(self._header, section) * array(typecode).itemsize
+        if not _SWAP:
+            try:
+                view = self._buffer[st:end].cast(typecode)
+                self._views.append(view)
+                return view
+            except (AttributeError, TypeError):  # memoryview.cast is not available
+                pass
+        return read_array(self._mmap, self._header, section, typecode)
+
+    def _shape_row(self, index):
+        """Get the row of the shape table for a Shape."""
+        if not 0 <= index < self.shape_count:
+            raise IndexError('Shape index {} is out of range.'.format(index))
+        return self._shape_table[index * SHAPE_FIELDS:(index + 1) * SHAPE_FIELDS]
+
+    def _boundary_row(self, index):
+        """Get the row of the boundary table for a Boundary."""
+        if not 0 <= index < self.boundary_count:
+            raise IndexError('Boundary index {} is out of range.'.format(index))
+        return self._bound_table[index * BOUNDARY_FIELDS:(index + 1) * BOUNDARY_FIELDS]
+
+    def _string(self, index):
+        """Get a string from the string table, decoding it only once."""
+        value = self._strings[index]
+        if value is None:
+            offsets, st = self._str_offsets, self._header['string_data']
+            value = self._mmap[st + offsets[index]:st + offsets[index + 1]]
+            value = self._strings[index] = value.decode('utf-8')
+        return value
+
+    def _json(self, index):
+        """Get an object decoded from JSON in the string table.
+
+        The object is decoded with each call such that objects sharing the same
+        string (eg. identical properties) each get their own copy, which can be
+        mutated without affecting the others.
+        """
+        return json.loads(self._string(index))
+
+    def _assign_attributes(self, obj, name_i, prop_i, data_i):
+        """Assign the display_name, user_data and properties to an object."""
+        if name_i != -1:
+            obj.display_name = self._string(name_i)
+        if data_i != -1:
+            obj.user_data = self._json(data_i)
+        props = self._json(prop_i)
+        if props['type'] == '{}Properties'.format(obj.__class__.__name__):
+            obj.properties._load_extension_attr_from_dict(props)
+
+    def _bounds(self):
+        """Get the min and max around all of the coordinates in the file."""
+        bounds = []
+        if self._header['vertex_count'] != 0:
+            bounds.extend(_coordinate_bounds(self._coords, 3))
+        if self._header['segment_count'] != 0:
+            segs = self._segments
+            bounds.extend(_coordinate_bounds(segs, 6))  # start points of segments
+            end_pts = [segs[k] + segs[k + 3] for k in range(len(segs)) if k % 6 < 3]
+            bounds.extend(_coordinate_bounds(end_pts, 3))
+        assert len(bounds) != 0, 'The Model has no geometry.'
+        mins, maxs = bounds[0::2], bounds[1::2]
+        return tuple(min(v) for v in zip(*mins)), tuple(max(v) for v in zip(*maxs))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.shape_count + self.boundary_count
+
+    def __repr__(self):
+        return 'ModelView: {} [{} shapes] [{} boundaries]'.format(
+            self.display_name, self.shape_count, self.boundary_count)
+
+
+def _section_length(header, section):
+    """Get the number of values in a section of a FFbin file."""
+    if section == 'shape_table':
+        return header['shape_count'] * SHAPE_FIELDS
+    if section == 'loop_table':
+        return header['loop_count'] * LOOP_FIELDS
+    if section == 'plane_array':
+        return header['shape_count'] * 9
+    if section == 'coordinate_array':
+        return header['vertex_count'] * 3
+    if section == 'boundary_table':
+        return header['boundary_count'] * BOUNDARY_FIELDS
+    if section == 'segment_array':
+        return header['segment_count'] * 6
+    if section == 'string_offsets':
+        return header['string_count'] + 1
+    raise ValueError('Unknown FFbin section "{}".'.format(section))
+
+
+def _loop_area(coords):
+    """Get the area of a planar loop from a flat array of its coordinates.
+
+    The area is half the magnitude of the sum of the cross products of the
+    vertices (Newell's method), which are taken relative to the first vertex
+    to avoid a loss of precision far from the origin.
+    """
+    x0, y0, z0 = coords[0], coords[1], coords[2]
+    nx = ny = nz = 0
+    px, py, pz = 0, 0, 0
+    for k in range(3, len(coords), 3):
+        x, y, z = coords[k] - x0, coords[k + 1] - y0, coords[k + 2] - z0
+        nx += py * z - pz * y
+        ny += pz * x - px * z
+        nz += px * y - py * x
+        px, py, pz = x, y, z
+    return math.sqrt(nx ** 2 + ny ** 2 + nz ** 2) / 2
+
+
+def _coordinate_bounds(coords, stride):
+    """Get the min and max (x, y, z) of the points in a flat array of coordinates.
+
+    Args:
+        coords: A flat array of coordinates.
+        stride: The number of values for each point in the array. The first
+            three values of each point are the x, y, z.
+    """
+    xs, ys, zs = coords[0::stride], coords[1::stride], coords[2::stride]
+    return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+
+def _array_bytes(arr):
+    """Get the little-endian bytes of an array."""
+    if _SWAP:
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    try:
+        return arr.tobytes()
+    except AttributeError:  # Python 2 array
+        return arr.tostring()
+
+
+def _aligned(position):
+    """Get the first multiple of 8 that is greater than or equal to a position."""
+    return (position + 7) // 8 * 8
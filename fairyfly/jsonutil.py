@@ -0,0 +1,315 @@
+# coding=utf-8
+"""Utilities to read and write the JSON of large models.
+
+This includes a reader for large JSON files that does not load the entire file into
+memory, which is primarily used to read FFJSON files of large models such that
+the shapes and boundaries of the model can be parsed and converted to Python
+objects one at a time.
+
+It also includes functions to read and write JSON with the fastest installed
+JSON library (orjson or python-rapidjson), falling back to the standard
+library json module if neither is installed. All of these libraries write numbers
+such that they are read back as exactly the same floats but the whitespace
+and escaping of non-ASCII characters in their output may differ.
+"""
+import json
+import math
+import importlib
+
+try:  # check if we are in Python 3 with a JSONDecodeError
+    _DecodeError = json.JSONDecodeError
+except AttributeError:  # we are in Python 2
+    _DecodeError = ValueError
+
+# names of the supported JSON libraries in order of preference
+JSON_BACKENDS = ('orjson', 'rapidjson', 'json')
+_backend_modules = {'json': json}  # imported JSON libraries
+_auto_backend = []  # name of the fastest installed library once it is found
+_resolved_backend = []  # name and module of the library in use once it is resolved
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789.eE+-'
+
+
+class _JSONStream(object):
+    """A buffered reader that decodes JSON values from a text file as they are needed.
+
+    Args:
+        file_obj: A file-like object opened in text mode.
+        chunk_size: An integer for the minimum number of characters read from
+            the file each time that the buffer is refilled.
+    """
+    __slots__ = ('_file', '_chunk_size', '_buf', '_pos', '_eof', '_decoder')
+
+    def __init__(self, file_obj, chunk_size=65536):
+        self._file = file_obj
+        self._chunk_size = chunk_size
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def peek(self):
+        """Get the next non-whitespace character without consuming it.
+
+        An empty string is returned if the end of the file has been reached.
+        """
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, characters):
+        """Consume the next non-whitespace character, ensuring it is in characters.
+        """
+        char = self.peek()
+        if char == '' or char not in characters:
+            raise ValueError(
+                'Expected one of "{}" in JSON but got "{}".'.format(characters, char))
+        self._pos += 1
+        return char
+
+    def decode(self):
+        """Decode the next complete JSON value from the stream."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except _DecodeError:
+                if not self._fill(len(self._buf) - self._pos):
+                    raise
+                continue
+            # a number at the end of the buffer may be truncated (eg. 1.5 as 1.)
+            if (end >= len(self._buf) or self._buf[end] in _NUMBER_CHARS) \
+                    and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _fill(self, min_size=0):
+        """Read more text into the buffer, returning False if at the end of the file.
+
+        Args:
+            min_size: The minimum number of characters to be read. Reading at
+                least as much as the unparsed part of the buffer ensures that
+                large values are decoded with a number of attempts that grows
+                with the log of their size.
+        """
+        if self._eof:
+            return False
+        chunk = self._file.read(max(self._chunk_size, min_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+
+def stream_json_object(file_obj, array_keys=(), chunk_size=65536):
+    """Iterate over the members of the top-level object in a JSON file.
+
+    Only one member value is decoded at a time, and the arrays under the
+    array_keys are decoded one item at a time. This means that the memory
+    needed to read the file is proportional to its largest member (or array
+    item) rather than the entire file.
+
+    Args:
+        file_obj: A file-like object opened in text mode, which contains a
+            JSON object.
+        array_keys: A list of keys for members whose values are arrays that
+            should be decoded one item at a time. (Default: ()).
+        chunk_size: An integer for the number of characters to be read from
+            the file at a time. (Default: 65536).
+
+    Returns:
+        An iterator of tuples with two values (key, value). For any members
+        that are under the array_keys, a tuple is yielded for each item in the
+        array, where the value is the array item. Note that this means no
+        tuple is yielded for empty arrays under the array_keys.
+    """
+    stream = _JSONStream(file_obj, chunk_size)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.decode()
+        stream.expect(':')
+        if key in array_keys and stream.peek() == '[':
+            stream.expect('[')
+            if stream.peek() != ']':
+                while True:
+                    yield key, stream.decode()
+                    if stream.expect(',]') == ']':
+                        break
+            else:
+                stream.expect(']')
+        else:
+            yield key, stream.decode()
+        if stream.expect(',}') == '}':
+            break
+
+
+def dump_json_object(members, file_obj, indent=None):
+    """Write a JSON object to a file one member at a time.
+
+    This is the counterpart of stream_json_object for writing large models,
+    where the shapes and boundaries of the model can be converted to dictionaries
+    and written to the file one at a time. When the standard library json
+    module is the json_backend, the file contents are identical to those
+    written by json.dump for a dictionary of all of the members.
+
+    Args:
+        members: An iterable of tuples with two values (key, value) for the members
+            of the object. Values that are iterators (eg. generators) are written
+            as arrays with one item of the iterator converted to JSON at a time.
+            All other values are converted to JSON with json_dumps.
+        file_obj: A file-like object opened in binary mode to which the UTF-8
+            encoded JSON will be written.
+        indent: A positive integer to set the indentation of the JSON. If None,
+            the most compact representation will be used. (Default: None).
+    """
+    name, module = _resolve_backend()  # resolve the library once for all members
+    if indent is None:
+        item_sep, key_sep = (', ', ': ') if name == 'json' else (',', ':')
+        member_start = array_start = ''
+        member_end = array_end = ''
+    else:
+        item_sep, key_sep = ',', ': '
+        member_start = '\n' + ' ' * indent
+        array_start = '\n' + ' ' * (indent * 2)
+        member_end, array_end = '\n', '\n' + ' ' * indent
+    write = file_obj.write
+    write(b'{')
+    first_member = True
+    for key, value in members:
+        write(((member_start if first_member else item_sep + member_start) +
+               _dumps(key, None, name, module) + key_sep).encode('utf-8'))
+        first_member = False
+        if hasattr(value, '__next__') or hasattr(value, 'next'):  # stream the array
+            write(b'[')
+            first_item = True
+            for item in value:
+                item_str = _dumps(item, indent, name, module)
+                if indent is not None:  # indent the item inside of the array
+                    item_str = item_str.replace('\n', array_start)
+                write(((array_start if first_item else item_sep + array_start) +
+                       item_str).encode('utf-8'))
+                first_item = False
+            write(b']' if first_item else (array_end + ']').encode('utf-8'))
+        else:
+            value_str = _dumps(value, indent, name, module)
+            if indent is not None:  # indent the value inside of the object
+                value_str = value_str.replace('\n', member_start)
+            write(value_str.encode('utf-8'))
+    write(b'}' if first_member else (member_end + '}').encode('utf-8'))
+
+
+def json_backend():
+    """Get the name of the JSON library used by json_dumps and json_loads.
+
+    This is the json_backend of the fairyfly config if it has been set.
+    Otherwise, it is the first of the JSON_BACKENDS that is installed.
+    """
+    return _resolve_backend()[0]
+
+
+def json_dumps(obj, indent=None):
+    """Get a JSON string of a Python object using the fastest JSON library.
+
+    Args:
+        obj: A JSON-serializable Python object (eg. the dictionary of a Model).
+        indent: A positive integer to set the indentation of the JSON. If None,
+            the most compact representation will be used. (Default: None).
+
+    Returns:
+        A JSON string. If the library is not the standard library json module,
+        this may contain non-ASCII characters, which should be written to
+        files with UTF-8 encoding. Objects containing NaN or Infinity are
+        always written as NaN and Infinity like the json module does.
+    """
+    name, module = _resolve_backend()
+    return _dumps(obj, indent, name, module)
+
+
+def json_loads(text):
+    """Get a Python object from a JSON string using the fastest JSON library.
+
+    Args:
+        text: A JSON string.
+    """
+    return _resolve_backend()[1].loads(text)
+
+
+def _dumps(obj, indent, name, module):
+    """Get a JSON string of a Python object using a given JSON library."""
+    try:
+        if name == 'orjson' and indent in (None, 2):
+            option = module.OPT_INDENT_2 if indent == 2 else None
+            json_str = module.dumps(obj, option=option)
+            # orjson writes NaN and Infinity as null; use the json module for them
+            if b'null' not in json_str or not _has_non_finite(obj):
+                return json_str.decode('utf-8')
+        elif name == 'rapidjson':
+            return module.dumps(obj, indent=indent, ensure_ascii=False)
+    except (TypeError, ValueError, OverflowError):
+        pass  # object not supported by the library; use the json module
+    return json.dumps(obj, indent=indent)
+
+
+def _resolve_backend():
+    """Get a tuple with the name and module of the JSON library that is in use.
+
+    The library is only looked up in the fairyfly config the first time that
+    this function is called after the json_backend of the config was changed.
+    """
+    if not _resolved_backend:
+        from .config import folders
+        name = folders.json_backend
+        if not name:
+            if not _auto_backend:
+                for auto_name in JSON_BACKENDS:
+                    try:
+                        _import_backend(auto_name)
+                    except ImportError:
+                        continue
+                    _auto_backend.append(auto_name)
+                    break
+            name = _auto_backend[0]
+        _resolved_backend.append((name, _import_backend(name)))
+    return _resolved_backend[0]
+
+
+def _clear_backend():
+    """Clear the resolved JSON library so that it is looked up again in the config.
+
+    This is called by the fairyfly config whenever its json_backend changes.
+    """
+    del _resolved_backend[:]
+
+
+def _has_non_finite(obj):
+    """Check whether a JSON-serializable object contains any NaN or Infinity floats.
+    """
+    if isinstance(obj, float):
+        return math.isinf(obj) or math.isnan(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(val) for val in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(val) for val in obj)
+    return False
+
+
+def _import_backend(name):
+    """Import a JSON library by name, raising an error if it is not available."""
+    if name not in _backend_modules:
+        if name not in JSON_BACKENDS:
+            raise ValueError('JSON backend "{}" is not supported. Choose from: '
+                             '{}.'.format(name, ', '.join(JSON_BACKENDS)))
+        _backend_modules[name] = importlib.import_module(name)
+    return _backend_modules[name]
@@ -5,6 +5,7 @@ import os
 import io
 import json
 import math
+from array import array
 try:  # check if we are in IronPython
     import cPickle as pickle
 except ImportError:  # wea are in cPython
@@ -20,10 +21,93 @@ from .properties import ModelProperties
 from .shape import Shape
 from .boundary import Boundary
 from .typing import clean_string, float_positive, invalid_dict_error
+from .jsonutil import stream_json_object, dump_json_object, json_loads
+from .spatial import equivalent_point_pairs, BoundingBoxGrid
+from .transform import GeometryBatch
+from .parallel import worker_count, map_chunks
+from .ffbin import is_ffbin, read_ffbin, write_ffbin
 from .config import folders
 import fairyfly.writer.model as writer
 
 
+def _non_planar_faces(faces, tolerance):
+    """Get a list of booleans for whether each Face3D in a list is not planar."""
+    return [not face.check_planar(tolerance, raise_exception=False) for face in faces]
+
+
+def _non_planar_boundaries(geometries, tolerance):
+    """Get a list of booleans for whether the geometry of each Boundary is not planar.
+    """
+    return [Boundary._non_planar_vertex(geo, tolerance) is not None
+            for geo in geometries]
+
+
+def _self_intersecting_faces(faces, tolerance):
+    """Get a list of booleans for whether each Face3D in a list is self-intersecting.
+
+    Faces that are only self-intersecting because of duplicate vertices are
+    still included since Shape.check_self_intersecting handles these cases.
+    """
+    return [face.is_self_intersecting for face in faces]
+
+
+def _faces_from_dicts(face_dicts):
+    """Load a list of Face3D dictionaries using a flat array of their coordinates.
+
+    The result is identical to loading each dictionary with Face3D.from_dict.
+    However, the vertex orientation of all Face3Ds is evaluated in a single pass
+    over the array instead of building a 2D polygon for each Face3D.
+
+    Args:
+        face_dicts: A list of Face3D dictionaries.
+
+    Returns:
+        A list with a Face3D for each dictionary. This will be None for any
+        dictionaries with holes or that are not valid, which should be loaded
+        with Face3D.from_dict (such that any error message is the same).
+    """
+    faces, starts, coords = [], [], array('d')
+    for data in face_dicts:
+        try:
+            if data.get('holes'):
+                raise ValueError('Face3D has holes.')
+            plane = data.get('plane')
+            plane = Plane.from_dict(plane) if plane is not None else None
+            boundary = tuple(Point3D.from_array(pt) for pt in data['boundary'])
+            face = Face3D(boundary, plane, enforce_right_hand=False)
+        except Exception:  # load the dictionary with Face3D.from_dict
+            faces.append(None)
+            starts.append(None)
+            continue
+        faces.append(face)
+        starts.append(len(coords))
+        for pt in boundary:
+            coords.extend(pt)
+    # reverse clockwise faces using the same arithmetic as Face3D.is_clockwise
+    for i, face in enumerate(faces):
+        if face is None:
+            continue
+        start = starts[i]
+        end = start + len(face.boundary) * 3
+        plane = face.plane
+        o, x, y = plane.o, plane.x, plane.y
+        ox, oy, oz = o.x, o.y, o.z
+        xx, xy, xz = x.x, x.y, x.z
+        yx, yy, yz = y.x, y.y, y.z
+        dx, dy, dz = coords[end - 3] - ox, coords[end - 2] - oy, coords[end - 1] - oz
+        pu, pv = xx * dx + xy * dy + xz * dz, yx * dx + yy * dy + yz * dz
+        area = 0
+        for j in range(start, end, 3):
+            dx, dy, dz = coords[j] - ox, coords[j + 1] - oy, coords[j + 2] - oz
+            u, v = xx * dx + xy * dy + xz * dz, yx * dx + yy * dy + yz * dz
+            area += pu * v - pv * u
+            pu, pv = u, v
+        if area / 2 < 0:
+            faces[i] = Face3D(tuple(reversed(face.boundary)), plane,
+                              enforce_right_hand=False)
+    return faces
+
+
 class Model(_Base):
     """A collection of Shapes and Boundaries representing a model.
 
@@ -65,7 +149,8 @@ class Model(_Base):
         * user_data
     """
     __slots__ = (
-        '_shapes', '_boundaries', '_units', '_tolerance', '_angle_tolerance'
+        '_shapes', '_boundaries', '_units', '_tolerance', '_angle_tolerance',
+        '_shape_index', '_boundary_index', '_bounding_box', '_geo_counter'
     )
 
     # dictionary mapping validation error codes to a corresponding check function
@@ -87,6 +172,7 @@ class Model(_Base):
         self.tolerance = tolerance
         self.angle_tolerance = angle_tolerance
 
+        self._geo_counter = [0]  # incremented whenever an object's geometry changes
         self.shapes = shapes
         self.boundaries = boundaries
         self._properties = ModelProperties(self)
@@ -102,21 +188,14 @@ class Model(_Base):
         assert data['type'] == 'Model', 'Expected Model dictionary. ' \
             'Got {}.'.format(data['type'])
 
-        # import the units and tolerance values
-        units = 'Millimeters' if 'units' not in data or data['units'] is None \
-            else data['units']
-        tol = cls.UNITS_TOLERANCES[units] if 'tolerance' not in data or \
-            data['tolerance'] is None else data['tolerance']
-        angle_tol = 1.0 if 'angle_tolerance' not in data or \
-            data['angle_tolerance'] is None else data['angle_tolerance']
-
         # import all of the geometry
         shapes = None  # import shapes
         if 'shapes' in data and data['shapes'] is not None:
             shapes = []
-            for s in data['shapes']:
+            geometries = cls._shape_geometries_from_dicts(data['shapes'])
+            for s, geo in zip(data['shapes'], geometries):
                 try:
-                    shapes.append(Shape.from_dict(s))
+                    shapes.append(Shape._from_dict(s, geo))
                 except Exception as e:
                     invalid_dict_error(s, e)
         boundaries = None  # import boundaries
@@ -129,24 +208,18 @@ class Model(_Base):
                     invalid_dict_error(b, e)
 
         # build the model object
-        model = Model(shapes, boundaries, units, tol, angle_tol)
-        model.identifier = data['identifier']
-        if 'display_name' in data and data['display_name'] is not None:
-            model.display_name = data['display_name']
-        if 'user_data' in data and data['user_data'] is not None:
-            model.user_data = data['user_data']
-
-        # assign extension properties to the model
-        model.properties.apply_properties_from_dict(data)
-        return model
+        return cls._from_dict_and_objects(data, shapes, boundaries)
 
     @classmethod
     def from_file(cls, hb_file):
-        """Initialize a Model from a FFJSON or FFpkl file, auto-sensing the type.
+        """Initialize a Model from a FFJSON, FFpkl or FFbin file, auto-sensing the type.
 
         Args:
-            hb_file: Path to either a FFJSON or FFpkl file.
+            hb_file: Path to either a FFJSON, FFpkl or FFbin file.
         """
+        # FFbin files can be identified from the magic number at the start of the file
+        if is_ffbin(hb_file):
+            return cls.from_ffbin(hb_file)
         # sense the file type from the first character to avoid maxing memory with JSON
         with io.open(hb_file, encoding='utf-8') as inf:
             first_char = inf.read(1)
@@ -161,6 +234,11 @@ class Model(_Base):
     def from_ffjson(cls, ffjson_file):
         """Initialize a Model from a FFJSON file.
 
+        The file is read incrementally such that each Shape and Boundary is
+        created from its dictionary as soon as it is parsed. So the full
+        dictionary of the Model never exists in memory and the memory needed
+        to load the file is not much more than that of the resulting Model.
+
         Args:
             ffjson_file: Path to FFJSON file.
         """
@@ -168,11 +246,33 @@ class Model(_Base):
         with io.open(ffjson_file, encoding='utf-8') as inf:
             inf.read(1)
             second_char = inf.read(1)
+        data, shapes, boundaries = {}, None, None
         with io.open(ffjson_file, encoding='utf-8') as inf:
             if second_char == '{':
                 inf.read(1)
-            data = json.load(inf)
-        return cls.from_dict(data)
+            members = stream_json_object(inf, ('shapes', 'boundaries'))
+            for key, value in members:
+                if key == 'shapes' and value is not None:
+                    if shapes is None:
+                        shapes, data['shapes'] = [], []
+                    try:
+                        shapes.append(Shape.from_dict(value))
+                    except Exception as e:
+                        invalid_dict_error(value, e)
+                    data['shapes'].append(cls._properties_dict(value))
+                elif key == 'boundaries' and value is not None:
+                    if boundaries is None:
+                        boundaries, data['boundaries'] = [], []
+                    try:
+                        boundaries.append(Boundary.from_dict(value))
+                    except Exception as e:
+                        invalid_dict_error(value, e)
+                    data['boundaries'].append(cls._properties_dict(value))
+                else:
+                    data[key] = value
+        assert data['type'] == 'Model', 'Expected Model dictionary. ' \
+            'Got {}.'.format(data['type'])
+        return cls._from_dict_and_objects(data, shapes, boundaries)
 
     @classmethod
     def from_ffpkl(cls, ffpkl_file):
@@ -186,6 +286,17 @@ class Model(_Base):
             data = pickle.load(inf)
         return cls.from_dict(data)
 
+    @classmethod
+    def from_ffbin(cls, ffbin_file):
+        """Initialize a Model from a FFbin file.
+
+        Args:
+            ffbin_file: Path to FFbin file.
+        """
+        assert os.path.isfile(ffbin_file), 'Failed to find %s' % ffbin_file
+        data, shapes, boundaries = read_ffbin(ffbin_file)
+        return cls._from_dict_and_objects(data, shapes, boundaries)
+
     @classmethod
     def from_objects(cls, objects, units='Millimeters',
                      tolerance=None, angle_tolerance=1.0):
@@ -330,7 +441,11 @@ class Model(_Base):
 
     @shapes.setter
     def shapes(self, value):
+        for shape in getattr(self, '_shapes', ()):
+            self._release_object(shape)
         self._shapes = []
+        self._shape_index = {}
+        self._bounding_box = None
         if value is not None:
             for shape in value:
                 self.add_shape(shape)
@@ -342,7 +457,11 @@ class Model(_Base):
 
     @boundaries.setter
     def boundaries(self, value):
+        for bound in getattr(self, '_boundaries', ()):
+            self._release_object(bound)
         self._boundaries = []
+        self._boundary_index = {}
+        self._bounding_box = None
         if value is not None:
             for bound in value:
                 self.add_boundary(bound)
@@ -360,12 +479,12 @@ class Model(_Base):
     @property
     def min(self):
         """Get a Point3D for the min bounding box vertex in the world XY plane."""
-        return self._calculate_min(self._all_objects())
+        return self._model_bounding_box()[1]
 
     @property
     def max(self):
         """Get a Point3D for the max bounding box vertex in the world XY plane."""
-        return self._calculate_max(self._all_objects())
+        return self._model_bounding_box()[2]
 
     @property
     def center(self):
@@ -380,15 +499,14 @@ class Model(_Base):
         These may not cause holes or extra regions in the model but they can
         nevertheless cause simulation failures.
         """
+        # only shapes with equivalent bounding box centers can be centered adjacent
+        shapes, tol = self._shapes, self.tolerance
+        centers = [shape.center for shape in shapes]
         duplicates = []
-        for i, shape_1 in enumerate(self._shapes):
-            try:
-                for shape_2 in self._shapes[i + 1:]:
-                    if shape_1.geometry.is_centered_adjacent(
-                            shape_2.geometry, self.tolerance):
-                        duplicates.append(shape_2.geometry)
-            except IndexError:
-                pass  # we have reached the end of the list of shapes
+        for i, j in equivalent_point_pairs(centers, tol):
+            geo_j = shapes[j].geometry
+            if shapes[i].geometry.is_centered_adjacent(geo_j, tol):
+                duplicates.append(geo_j)
         return duplicates
 
     @property
@@ -399,17 +517,21 @@ class Model(_Base):
         lines = []
         for bound in self._boundaries:
             lines.extend(bound.geometry)
+        # index the segments so that only those with nearby bounding boxes are tested
+        tol = self.tolerance
+        grid = BoundingBoxGrid.from_boxes(
+            [line.min for line in lines], [line.max for line in lines], tol * 2)
         # evaluate the line segments for equivalency
-        duplicates = []
-        for i, line_1 in enumerate(lines):
-            try:
-                for line_2 in lines[i + 1:]:
-                    if line_1.distance_to_point(line_2.p1) <= self.tolerance and \
-                            line_1.distance_to_point(line_2.p2) <= self.tolerance:
-                        duplicates.append(line_2)
-            except IndexError:
-                pass  # we have reached the end of the list of boundaries
-        return duplicates
+        pairs = []
+        for j, line_2 in enumerate(lines):
+            for i in grid.query(line_2.min, line_2.max):
+                if i < j:
+                    line_1 = lines[i]
+                    if line_1.distance_to_point(line_2.p1) <= tol and \
+                            line_1.distance_to_point(line_2.p2) <= tol:
+                        pairs.append((i, j))
+        pairs.sort()
+        return [lines[j] for _, j in pairs]
 
     def add_model(self, other_model):
         """Add another Model object to this model."""
@@ -419,8 +541,12 @@ class Model(_Base):
             other_model.convert_to_units(self.units)
         for shape in other_model._shapes:
             self._shapes.append(shape)
+            self._shape_index.setdefault(shape.identifier, shape)
+            self._track_object(shape)
         for boundary in other_model._boundaries:
             self._boundaries.append(boundary)
+            self._boundary_index.setdefault(boundary.identifier, boundary)
+            self._track_object(boundary)
 
     def add_shape(self, obj):
         """Add a Shape object to the model."""
@@ -428,6 +554,8 @@ class Model(_Base):
         assert not obj.has_parent, 'Shape "{}"" has a parent GlazingSystem. Add the ' \
             'GlazingSystem to the model instead of the Shape.'.format(obj.display_name)
         self._shapes.append(obj)
+        self._shape_index.setdefault(obj.identifier, obj)
+        self._track_object(obj)
 
     def add_shapes(self, objs):
         """Add a list of Shape objects to the model."""
@@ -440,6 +568,8 @@ class Model(_Base):
         assert not obj.has_parent, 'Boundary "{}"" has a parent GlazingSystem. Add the ' \
             'GlazingSystem to the model instead of the Boundary.'.format(obj.display_name)
         self._boundaries.append(obj)
+        self._boundary_index.setdefault(obj.identifier, obj)
+        self._track_object(obj)
 
     def add_boundaries(self, objs):
         """Add a list of Boundary objects to the model."""
@@ -454,7 +584,11 @@ class Model(_Base):
                 certain shapes from the model. If None, all Shapes will be
                 removed. (Default: None).
         """
-        self._shapes = self._remove_by_ids(self.shapes, shape_ids)
+        shapes = self._remove_by_ids(self._shapes, shape_ids)
+        self._release_removed(self._shapes, shapes)
+        self._shapes = shapes
+        self._shape_index = self._identifier_index(self._shapes)
+        self._bounding_box = None
 
     def remove_boundaries(self, boundary_ids=None):
         """Remove Boundaries from the model.
@@ -464,20 +598,15 @@ class Model(_Base):
                 certain boundaries from the model. If None, all Boundaries will be
                 removed. (Default: None).
         """
-        self._boundaries = self._remove_by_ids(self.boundaries, boundary_ids)
+        boundaries = self._remove_by_ids(self._boundaries, boundary_ids)
+        self._release_removed(self._boundaries, boundaries)
+        self._boundaries = boundaries
+        self._boundary_index = self._identifier_index(self._boundaries)
+        self._bounding_box = None
 
     def shapes_by_identifier(self, identifiers):
         """Get a list of Shape objects in the model given the Shape identifiers."""
-        shapes, missing_ids = [], []
-        model_shapes = self._shapes
-        for obj_id in identifiers:
-            obj_id = str(obj_id)  # in case UUID objects were used instead of str
-            for shape in model_shapes:
-                if shape.identifier == obj_id:
-                    shapes.append(shape)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        shapes, missing_ids = self._objects_by_identifier(identifiers, '_shape_index')
         if len(missing_ids) != 0:
             all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -486,17 +615,9 @@ class Model(_Base):
         return shapes
 
     def boundaries_by_identifier(self, identifiers):
-        """Get a list of Face objects in the model given the Face identifiers."""
-        boundaries, missing_ids = [], []
-        model_boundaries = self.boundaries
-        for obj_id in identifiers:
-            obj_id = str(obj_id)  # in case UUID objects were used instead of str
-            for bnd in model_boundaries:
-                if bnd.identifier == obj_id:
-                    boundaries.append(bnd)
-                    break
-            else:
-                missing_ids.append(obj_id)
+        """Get a list of Boundary objects in the model given the Boundary identifiers."""
+        boundaries, missing_ids = \
+            self._objects_by_identifier(identifiers, '_boundary_index')
         if len(missing_ids) != 0:
             all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
             raise ValueError(
@@ -511,11 +632,7 @@ class Model(_Base):
             moving_vec: A ladybug_geometry Vector3D with the direction and distance
                 to move the Model.
         """
-        for shape in self._shapes:
-            shape.move(moving_vec)
-        for boundary in self._boundaries:
-            boundary.move(moving_vec)
-        self.properties.move(moving_vec)
+        self._transform_objects('move', (moving_vec,), (moving_vec,))
 
     def rotate(self, axis, angle, origin):
         """Rotate this Model by a certain angle around an axis and origin.
@@ -526,11 +643,8 @@ class Model(_Base):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for shape in self._shapes:
-            shape.rotate(axis, angle, origin)
-        for boundary in self._boundaries:
-            boundary.rotate(axis, angle, origin)
-        self.properties.rotate(axis, angle, origin)
+        self._transform_objects(
+            'rotate', (axis, angle, origin), (axis, math.radians(angle), origin))
 
     def rotate_xy(self, angle, origin):
         """Rotate this Model counterclockwise in the world XY plane by a certain angle.
@@ -540,11 +654,8 @@ class Model(_Base):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for shape in self._shapes:
-            shape.rotate_xy(angle, origin)
-        for boundary in self._boundaries:
-            boundary.rotate_xy(angle, origin)
-        self.properties.rotate_xy(angle, origin)
+        self._transform_objects(
+            'rotate_xy', (angle, origin), (math.radians(angle), origin))
 
     def reflect(self, plane):
         """Reflect this Model across a plane with the input normal vector and origin.
@@ -553,11 +664,7 @@ class Model(_Base):
             plane: A ladybug_geometry Plane across which the object will
                 be reflected.
         """
-        for shape in self._shapes:
-            shape.reflect(plane)
-        for boundary in self._boundaries:
-            boundary.reflect(plane)
-        self.properties.reflect(plane)
+        self._transform_objects('reflect', (plane,), (plane.n, plane.o))
 
     def scale(self, factor, origin=None):
         """Scale this Model by a factor from an origin point.
@@ -571,11 +678,7 @@ class Model(_Base):
             origin: A ladybug_geometry Point3D representing the origin from which
                 to scale. If None, it will be scaled from the World origin (0, 0, 0).
         """
-        for shape in self._shapes:
-            shape.scale(factor, origin)
-        for boundary in self._boundaries:
-            boundary.scale(factor, origin)
-        self.properties.scale(factor, origin)
+        self._transform_objects('scale', (factor, origin), (factor, origin))
 
     def convert_to_units(self, units='Millimeters'):
         """Convert all of the geometry in this model to certain units.
@@ -642,7 +745,10 @@ class Model(_Base):
             except ValueError:  # degenerate shape found!
                 i_to_remove.append(i)
         for i in reversed(i_to_remove):
-            self._shapes.pop(i)
+            self._release_object(self._shapes.pop(i))
+        if i_to_remove:
+            self._shape_index = self._identifier_index(self._shapes)
+            self._bounding_box = None
 
     def remove_duplicate_vertices(self, tolerance=None):
         """Remove any duplicate vertices from the model.
@@ -663,9 +769,92 @@ class Model(_Base):
             except ValueError:  # degenerate shape found!
                 i_to_remove.append(i)
         for i in reversed(i_to_remove):
-            self._shapes.pop(i)
+            self._release_object(self._shapes.pop(i))
+        if i_to_remove:
+            self._shape_index = self._identifier_index(self._shapes)
+            self._bounding_box = None
+
+    def pack_geometry(self):
+        """Store the vertices of all Shapes in a single compact array of numbers.
+
+        By default, each Shape holds a ladybug_geometry Face3D with a Point3D
+        for each vertex, which uses several times more memory than the vertex
+        coordinates alone. After this method is run, the coordinates of all
+        Shapes are stored in one array('d') that is shared among the Shapes and
+        the Face3D of each Shape is built from the array whenever its geometry
+        is requested. This greatly reduces the memory used by large models
+        but it makes each request for Shape geometry slower.
+
+        Shapes that are assigned new geometry after this method is run (eg. by
+        transforming them) will hold a Face3D of their new geometry until this
+        method is run again.
+        """
+        coords = array('d')
+        for shape in self._shapes:
+            shape._pack_geometry(coords)
+
+    def insert_vertices(self, points, tolerance=None):
+        """Insert Point3Ds into the geometry of all Shapes with segments that they lie on.
 
-    def check_all(self, raise_exception=True, detailed=False, all_ext_checks=False):
+        This has the same result as calling Shape.insert_vertex with each point
+        for every Shape of the Model. However, the segments of all Shapes are
+        indexed once such that each point is only evaluated against the segments
+        near it and the geometry of each Shape is only rebuilt once after all of
+        the points have been evaluated. This makes it suitable for conforming
+        many points (eg. the end points of Boundaries) to the edges of the Shapes.
+
+        Args:
+            points: A list of Point3D to be inserted into the Shape geometries if
+                they lie within the tolerance of the Shape's existing segments.
+                Each point is inserted into the first segment of a given Shape
+                that it lies on, with the boundary evaluated before the holes.
+            tolerance: The minimum distance between a vertex and the boundary segments
+                at which point the vertex is considered colinear. If None, the
+                Model's tolerance will be used. (Default: None).
+        """
+        tolerance = self.tolerance if tolerance is None else tolerance
+        # gather all of the shape segments and index them by their bounding boxes
+        segments = []
+        for s_i, shape in enumerate(self._shapes):
+            geo = shape.geometry
+            loops = [geo.boundary_segments]
+            if geo.has_holes:
+                loops.extend(geo.hole_segments)
+            for l_i, segs in enumerate(loops):
+                for i, seg in enumerate(segs):
+                    segments.append((s_i, (l_i, i), seg))
+        grid = BoundingBoxGrid.from_boxes(
+            [seg[2].min for seg in segments], [seg[2].max for seg in segments],
+            tolerance)
+        # find the segment of each shape into which each point will be inserted
+        insertions = {}
+        for pt in points:
+            pt_segs = {}
+            for k in grid.query(pt, pt):
+                s_i, loc, seg = segments[k]
+                if seg.distance_to_point(pt) <= tolerance:
+                    if s_i not in pt_segs or loc < pt_segs[s_i]:
+                        pt_segs[s_i] = loc
+            for s_i, loc in pt_segs.items():
+                try:
+                    insertions[s_i][loc].append(pt)
+                except KeyError:
+                    insertions.setdefault(s_i, {})[loc] = [pt]
+        # rebuild the geometry of each shape with all of its new vertices
+        for s_i, shape_ins in insertions.items():
+            shape = self._shapes[s_i]
+            geo = shape.geometry
+            loops = [list(geo.boundary)]
+            if geo.has_holes:
+                loops.extend(list(hole) for hole in geo.holes)
+            for (l_i, i), pts in sorted(shape_ins.items(), reverse=True):
+                st_pt = loops[l_i][i]
+                loops[l_i][i + 1:i + 1] = sorted(pts, key=st_pt.distance_to_point)
+            holes = loops[1:] if geo.has_holes else None
+            shape._geometry = Face3D(loops[0], geo.plane, holes)
+
+    def check_all(self, raise_exception=True, detailed=False, all_ext_checks=False,
+                  workers=None):
         """Check all of the aspects of the Model for validation errors.
 
         This includes basic geometry checks. Furthermore, all extension attributes
@@ -684,6 +873,10 @@ class Model(_Base):
                 cases should be run (False). Examples of checks that are skipped
                 include DOE2's lack of support for courtyards and floor plates
                 with holes. (Default: False).
+            workers: An optional integer for the number of processes across which
+                the geometry checks of the Shapes are distributed. Zero or a
+                negative number will use all CPUs of the machine. None will run
+                all checks in the current process. (Default: None).
 
         Returns:
             A text string with all errors that were found or a list if detailed is True.
@@ -703,8 +896,8 @@ class Model(_Base):
         msgs.append(self.check_all_duplicate_identifiers(False, detailed))
 
         # perform several checks for the fairyfly schema geometry rules
-        msgs.append(self.check_planar(tol, False, detailed))
-        msgs.append(self.check_self_intersecting(tol, False, detailed))
+        msgs.append(self.check_planar(tol, False, detailed, workers))
+        msgs.append(self.check_self_intersecting(tol, False, detailed, workers))
 
         # check the extension attributes
         ext_msgs = self._properties._check_all_extension_attr(detailed, all_ext_checks)
@@ -784,7 +977,8 @@ class Model(_Base):
             self.boundaries, raise_exception, 'Boundary', detailed, '200002', 'Core',
             'Duplicate Boundary Identifier')
 
-    def check_planar(self, tolerance=None, raise_exception=True, detailed=False):
+    def check_planar(self, tolerance=None, raise_exception=True, detailed=False,
+                     workers=None):
         """Check that all of the Model's geometry components are planar.
 
         This includes all of the Model's Shapes and Boundaries.
@@ -797,6 +991,10 @@ class Model(_Base):
                 raised if a vertex does not lie within the object's plane.
             detailed: Boolean for whether the returned object is a detailed list of
                 dicts with error info or a string with a message. (Default: False).
+            workers: An optional integer for the number of processes across which
+                the checks of the Shapes and Boundaries are distributed. Zero or
+                a negative number will use all CPUs of the machine. None will run
+                all checks in the current process. (Default: None).
 
         Returns:
             A string with the message or a list with a dictionary if detailed is True.
@@ -804,10 +1002,15 @@ class Model(_Base):
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
         msgs = []
-        for shape in self.shapes:
+        for shape in self._shapes_to_check(_non_planar_faces, tolerance, workers):
             msgs.append(shape.check_planar(tolerance, False, detailed))
-        for boundary in self.boundaries:
-            msgs.append(boundary.check_planar(tolerance, False, detailed))
+        # check all boundaries at once and only build messages for those that fail
+        geos = [boundary.geometry for boundary in self._boundaries]
+        failed = map_chunks(
+            _non_planar_boundaries, geos, worker_count(workers), (tolerance,))
+        for boundary, fail in zip(self._boundaries, failed):
+            if fail:
+                msgs.append(boundary.check_planar(tolerance, False, detailed))
         full_msgs = [msg for msg in msgs if msg]
         if detailed:
             return [m for msg in full_msgs for m in msg]
@@ -817,7 +1020,7 @@ class Model(_Base):
         return full_msg
 
     def check_self_intersecting(self, tolerance=None, raise_exception=True,
-                                detailed=False):
+                                detailed=False, workers=None):
         """Check that no edges of the Model's geometry components self-intersect.
 
         This includes all of the Model's Shapes.
@@ -830,6 +1033,10 @@ class Model(_Base):
                 intersects with itself (like a bowtie). (Default: True).
             detailed: Boolean for whether the returned object is a detailed list of
                 dicts with error info or a string with a message. (Default: False).
+            workers: An optional integer for the number of processes across which
+                the checks of the Shapes are distributed. Zero or a negative
+                number will use all CPUs of the machine. None will run all
+                checks in the current process. (Default: None).
 
         Returns:
             A string with the message or a list with a dictionary if detailed is True.
@@ -837,7 +1044,8 @@ class Model(_Base):
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
         msgs = []
-        for shape in self.shapes:
+        shapes = self._shapes_to_check(_self_intersecting_faces, tolerance, workers)
+        for shape in shapes:
             msgs.append(shape.check_self_intersecting(tolerance, False, detailed))
         full_msgs = [msg for msg in msgs if msg]
         if detailed:
@@ -875,26 +1083,9 @@ class Model(_Base):
                 X/Y axes of the planes but is not required and can be removed to
                 keep the dictionary smaller. (Default: True).
         """
-        # write all of the geometry objects and their properties
-        base = {'type': 'Model'}
-        base['identifier'] = self.identifier
-        if self._display_name is not None:
-            base['display_name'] = self.display_name
-        base['units'] = self.units
-        base['properties'] = self.properties.to_dict(included_prop)
-        if self._shapes != []:
-            base['shapes'] = [s.to_dict(True, included_prop, include_plane)
-                              for s in self._shapes]
-        if self._boundaries != []:
-            base['boundaries'] = [b.to_dict(True, included_prop)
-                                  for b in self._boundaries]
-        if self.tolerance != 0:
-            base['tolerance'] = self.tolerance
-        if self.angle_tolerance != 0:
-            base['angle_tolerance'] = self.angle_tolerance
-        # write in the optional keys if they are not None
-        if self.user_data is not None:
-            base['user_data'] = self.user_data
+        base = {}
+        for key, value in self._dict_members(included_prop, include_plane):
+            base[key] = list(value) if key in ('shapes', 'boundaries') else value
         return base
 
     def to_ffjson(self, name=None, folder=None, indent=None, included_prop=None):
@@ -913,8 +1104,6 @@ class Model(_Base):
                 available in properties to_dict. By default all the keys will be
                 included. To exclude all the keys from extensions use an empty list.
         """
-        # create dictionary from the Fairyfly Model
-        hb_dict = self.to_dict(included_prop=included_prop)
         # set up a name and folder for the FFJSON
         if name is None:
             name = clean_string(self.display_name)
@@ -924,9 +1113,22 @@ class Model(_Base):
         if not os.path.isdir(folder):
             os.makedirs(folder)
         hb_file = os.path.join(folder, file_name)
-        # write FFJSON
-        with open(hb_file, 'w') as fp:
-            json.dump(hb_dict, fp, indent=indent)
+        # write FFJSON, converting the shapes and boundaries to JSON one at a time
+        # the JSON is streamed to a temporary file so that an error part way through
+        # does not leave a truncated file or overwrite an existing valid file
+        temp_file = '{}.{}.tmp'.format(hb_file, os.getpid())
+        try:
+            with open(temp_file, 'wb') as fp:
+                dump_json_object(self._dict_members(included_prop), fp, indent)
+        except BaseException:
+            os.remove(temp_file)
+            raise
+        try:
+            os.replace(temp_file, hb_file)
+        except AttributeError:  # we are in Python 2, which has no os.replace
+            if os.path.isfile(hb_file):
+                os.remove(hb_file)
+            os.rename(temp_file, hb_file)
         return hb_file
 
     def to_ffpkl(self, name=None, folder=None, included_prop=None,
@@ -960,6 +1162,35 @@ class Model(_Base):
             pickle.dump(hb_dict, fp)
         return hb_file
 
+    def to_ffbin(self, name=None, folder=None, included_prop=None):
+        """Write Fairyfly model to a compact binary file (FFbin).
+
+        FFbin files store the geometry of the model in flat arrays of numbers
+        and they can be written and read much faster than FFJSON or FFpkl.
+
+        Args:
+            name: A text string for the name of the FFbin file. If None, the model
+                identifier wil be used. (Default: None).
+            folder: A text string for the directory where the FFbin will be written.
+                If unspecified, the default simulation folder will be used. This
+                is usually at "C:\\Users\\USERNAME\\simulation."
+            included_prop: List of properties to filter keys that must be included in
+                output dictionary. For example ['therm'] will include 'therm' key if
+                available in properties to_dict. By default all the keys will be
+                included. To exclude all the keys from extensions use an empty list.
+        """
+        # set up a name and folder for the FFbin
+        if name is None:
+            name = clean_string(self.display_name)
+        file_name = name if name.lower().endswith('.ffbin') \
+            else '{}.ffbin'.format(name)
+        folder = folder if folder is not None else folders.default_simulation_folder
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        ffbin_file = os.path.join(folder, file_name)
+        # write the Model into the file
+        return write_ffbin(self, ffbin_file, included_prop)
+
     @staticmethod
     def check_reasonable_tolerance(units, tolerance):
         """Get a message with a recommended tolerance if it is not reasonable.
@@ -1030,7 +1261,7 @@ class Model(_Base):
         if isinstance(model, str):
             try:
                 if model.startswith('{'):
-                    model = Model.from_dict(json.loads(model))
+                    model = Model.from_dict(json_loads(model))
                 elif os.path.isfile(model):
                     model = Model.from_file(model)
                 else:
@@ -1092,10 +1323,309 @@ class Model(_Base):
                 out_dict['valid'] = False
             return json.dumps(out_dict, indent=4)
 
+    def _dict_members(self, included_prop=None, include_plane=True):
+        """Get an iterator of the (key, value) members of the dictionary of this Model.
+
+        The values for the shapes and boundaries keys are generators of the
+        dictionaries of each object such that they can be converted to JSON one
+        at a time (without having all of them in memory at once).
+
+        Args:
+            included_prop: List of properties to filter keys that must be included
+                in output dictionary. (Default: None).
+            include_plane: Boolean to note wether the planes of the Face3Ds should be
+                included in the output. (Default: True).
+        """
+        # write all of the geometry objects and their properties
+        yield 'type', 'Model'
+        yield 'identifier', self.identifier
+        if self._display_name is not None:
+            yield 'display_name', self.display_name
+        yield 'units', self.units
+        yield 'properties', self.properties.to_dict(included_prop)
+        if self._shapes != []:
+            yield 'shapes', (s.to_dict(True, included_prop, include_plane)
+                             for s in self._shapes)
+        if self._boundaries != []:
+            yield 'boundaries', (b.to_dict(True, included_prop)
+                                 for b in self._boundaries)
+        if self.tolerance != 0:
+            yield 'tolerance', self.tolerance
+        if self.angle_tolerance != 0:
+            yield 'angle_tolerance', self.angle_tolerance
+        # write in the optional keys if they are not None
+        if self.user_data is not None:
+            yield 'user_data', self.user_data
+
+    @classmethod
+    def _from_dict_and_objects(cls, data, shapes, boundaries):
+        """Build a Model from a dictionary and the already-serialized geometry objects.
+
+        Args:
+            data: A dictionary representation of a Model object. The shapes and
+                boundaries within this dictionary are only used to assign the
+                model-level extension properties and so they only need to
+                include the properties of each object.
+            shapes: A list of Shape objects that have been serialized from the
+                shapes in the data. None if the data has no shapes.
+            boundaries: A list of Boundary objects that have been serialized from
+                the boundaries in the data. None if the data has no boundaries.
+        """
+        # import the units and tolerance values
+        units = 'Millimeters' if 'units' not in data or data['units'] is None \
+            else data['units']
+        tol = cls.UNITS_TOLERANCES[units] if 'tolerance' not in data or \
+            data['tolerance'] is None else data['tolerance']
+        angle_tol = 1.0 if 'angle_tolerance' not in data or \
+            data['angle_tolerance'] is None else data['angle_tolerance']
+
+        # build the model object
+        model = Model(shapes, boundaries, units, tol, angle_tol)
+        model.identifier = data['identifier']
+        if 'display_name' in data and data['display_name'] is not None:
+            model.display_name = data['display_name']
+        if 'user_data' in data and data['user_data'] is not None:
+            model.user_data = data['user_data']
+
+        # assign extension properties to the model
+        model.properties.apply_properties_from_dict(data)
+        return model
+
+    @staticmethod
+    def _properties_dict(obj_dict):
+        """Get a copy of a geometry object dictionary with only its properties.
+
+        This is all that is needed to assign model-level extension properties and
+        it allows the (usually much larger) geometry of the object to be discarded.
+        """
+        try:
+            return {
+                'type': obj_dict['type'],
+                'identifier': obj_dict['identifier'],
+                'properties': obj_dict['properties']
+            }
+        except (KeyError, TypeError):  # not a valid object dictionary
+            return obj_dict
+
     def _all_objects(self):
         """Get a single list of all the objects in a Model."""
         return self._shapes + self._boundaries
 
+    @staticmethod
+    def _shape_geometries_from_dicts(shape_dicts):
+        """Get the Face3D geometry of a list of Shape dictionaries.
+
+        Returns:
+            A list with a Face3D for each Shape dictionary. This will be None for
+            any dictionaries whose geometry must be loaded with Shape.from_dict,
+            including those that are not valid (such that the error message is
+            the same as it would be when loading the dictionary on its own).
+        """
+        face_dicts = []
+        for s in shape_dicts:
+            try:
+                face_dicts.append(s['geometry'])
+            except Exception:  # not a valid shape dictionary
+                face_dicts.append(None)
+        return _faces_from_dicts(face_dicts)
+
+    def _shapes_to_check(self, face_check, tolerance, workers):
+        """Get the Shapes of the model that must be checked by a validation method.
+
+        If a number of workers greater than one is specified, the geometry of
+        the Shapes is evaluated across a pool of processes and only the Shapes
+        that fail the check are returned. So the validation method only has to
+        build messages for the invalid Shapes. Otherwise, all Shapes are returned.
+
+        Args:
+            face_check: A top-level function that takes a list of Face3D and a
+                tolerance and returns a list of booleans for whether each Face3D
+                fails the check.
+            tolerance: The tolerance to be passed to the face_check function.
+            workers: The number of processes input by the user.
+        """
+        workers = worker_count(workers)
+        if workers == 1:
+            return self._shapes
+        faces = [shape.geometry for shape in self._shapes]
+        failed = map_chunks(face_check, faces, workers, (tolerance,))
+        return [shape for shape, fail in zip(self._shapes, failed) if fail]
+
+    def _model_bounding_box(self):
+        """Get a tuple with the bounding box around all objects in the model.
+
+        The bounding box is cached and it is only recomputed if the geometry
+        of any object in the model has changed since it was computed or if
+        objects have been removed from the model. Objects increment the
+        geometry counter of the model whenever their geometry is changed such
+        that checking whether the cached bounding box is valid does not
+        depend on the number of objects in the model.
+
+        Returns:
+            A tuple with three values. The first is the geometry counter of
+            the model at which the bounding box was computed. The second and
+            third are Point3Ds for the min and max of the bounding box.
+        """
+        bbox, counter = self._bounding_box, self._geo_counter[0]
+        if bbox is None or bbox[0] != counter:
+            all_objs = self._all_objects()
+            bbox = (counter, self._calculate_min(all_objs), self._calculate_max(all_objs))
+            self._bounding_box = bbox
+        return bbox
+
+    def _track_object(self, obj):
+        """Track the geometry of an object that was added to the model.
+
+        The geometry counter of the model is given to the object such that the
+        counter is incremented whenever the geometry of the object is changed.
+        The cached bounding box of the model is also expanded to include the object.
+        """
+        if obj._model_counters is None:
+            obj._model_counters = [self._geo_counter]
+        else:
+            obj._model_counters.append(self._geo_counter)
+        self._expand_bounding_box(obj)
+
+    def _release_object(self, obj):
+        """Stop tracking the geometry of an object that was removed from the model.
+        """
+        counters = obj._model_counters
+        if counters is not None:
+            for i, counter in enumerate(counters):
+                if counter is self._geo_counter:
+                    counters.pop(i)
+                    break
+
+    def _release_removed(self, objs, kept_objs):
+        """Stop tracking the geometry of objects that are not in a list of kept objects.
+        """
+        if len(objs) != len(kept_objs):
+            kept_ids = set(id(obj) for obj in kept_objs)
+            for obj in objs:
+                if id(obj) not in kept_ids:
+                    self._release_object(obj)
+
+    def _expand_bounding_box(self, obj):
+        """Expand the cached bounding box of the model to include a new object.
+
+        Nothing will happen if there is no cached bounding box or if it is out
+        of date, in which case it will be recomputed when it is next requested.
+        """
+        bbox = self._bounding_box
+        if bbox is None or bbox[0] != self._geo_counter[0]:
+            return
+        mn, mx, o_mn, o_mx = bbox[1], bbox[2], obj.min, obj.max
+        new_min = Point3D(o_mn.x if o_mn.x < mn.x else mn.x,
+                          o_mn.y if o_mn.y < mn.y else mn.y,
+                          o_mn.z if o_mn.z < mn.z else mn.z)
+        new_max = Point3D(o_mx.x if o_mx.x > mx.x else mx.x,
+                          o_mx.y if o_mx.y > mx.y else mx.y,
+                          o_mx.z if o_mx.z > mx.z else mx.z)
+        self._bounding_box = (bbox[0], new_min, new_max)
+
+    def _transform_objects(self, method_name, args, batch_args):
+        """Transform the geometry and extension properties of all objects in the model.
+
+        Shapes and Boundaries that use the transform methods of the Shape and
+        Boundary classes are transformed together in a GeometryBatch. Objects of
+        subclasses that override the transform method are transformed using
+        their own method.
+
+        Args:
+            method_name: Text for the name of the transform method (eg. move,
+                rotate, reflect, scale).
+            args: A tuple with the arguments to be passed to the transform
+                method of the objects and their properties.
+            batch_args: A tuple with the arguments to be passed to the transform
+                method of the GeometryBatch.
+        """
+        batch_objs = []
+        for objs, base_class in ((self._shapes, Shape), (self._boundaries, Boundary)):
+            base_method, overridden = getattr(base_class, method_name), {}
+            in_batch = []
+            for obj in objs:
+                obj_class = obj.__class__
+                try:
+                    is_overridden = overridden[obj_class]
+                except KeyError:
+                    is_overridden = overridden[obj_class] = \
+                        getattr(obj_class, method_name) != base_method
+                if is_overridden:
+                    getattr(obj, method_name)(*args)
+                else:
+                    in_batch.append(obj)
+            batch_objs.append(in_batch)
+        getattr(GeometryBatch(*batch_objs), method_name)(*batch_args)
+        self._transform_properties(method_name, batch_objs, *args)
+
+    def _transform_properties(self, method_name, objects, *args):
+        """Transform the extension properties of objects after a geometry transform.
+
+        Args:
+            method_name: Text for the name of the transform method on the
+                properties (eg. move, rotate, reflect, scale).
+            objects: A list of lists with the Shapes and Boundaries that have
+                had their geometry transformed in a GeometryBatch.
+            args: The arguments to be passed to the transform method.
+        """
+        for objs in objects:
+            # skip the objects of classes with no extension implementing the transform
+            has_hook = {}
+            for obj in objs:
+                obj_class = obj.__class__
+                try:
+                    obj_has_hook = has_hook[obj_class]
+                except KeyError:
+                    obj_has_hook = has_hook[obj_class] = \
+                        bool(obj.properties._hook_attributes(method_name))
+                if obj_has_hook:
+                    getattr(obj.properties, method_name)(*args)
+        if self.properties._hook_attributes(method_name):
+            getattr(self.properties, method_name)(*args)
+
+    def _objects_by_identifier(self, identifiers, index_attr):
+        """Get objects in the model from a list of identifiers using an index.
+
+        The index maps each identifier to the first object in the model with that
+        identifier. Since identifiers can be changed after objects are added to
+        the model, the index is rebuilt (at most once) if it is found to be out
+        of date for any of the identifiers.
+
+        Args:
+            identifiers: A list of identifiers for the objects to be found.
+            index_attr: Text for the attribute of the index on this model
+                (either _shape_index or _boundary_index).
+
+        Returns:
+            A tuple with two lists. The first contains the objects that were found
+            and the second contains the identifiers that were not found.
+        """
+        objs, missing_ids = [], []
+        index, rebuilt = getattr(self, index_attr), False
+        for obj_id in identifiers:
+            obj_id = str(obj_id)  # in case UUID objects were used instead of str
+            obj = index.get(obj_id)
+            if (obj is None or obj.identifier != obj_id) and not rebuilt:
+                all_objs = self._shapes if index_attr == '_shape_index' \
+                    else self._boundaries
+                index = self._identifier_index(all_objs)
+                setattr(self, index_attr, index)
+                rebuilt = True
+                obj = index.get(obj_id)
+            if obj is not None:
+                objs.append(obj)
+            else:
+                missing_ids.append(obj_id)
+        return objs, missing_ids
+
+    @staticmethod
+    def _identifier_index(objs):
+        """Get a dictionary mapping identifiers to the first object with the ID."""
+        index = {}
+        for obj in objs:
+            index.setdefault(obj.identifier, obj)
+        return index
+
     @staticmethod
     def _remove_by_ids(objs, obj_ids):
         """Remove items from a list using a list of object IDs."""
@@ -1119,13 +1649,29 @@ class Model(_Base):
         return self
 
     def __copy__(self):
-        new_model = Model(
-            [shape.duplicate() for shape in self._shapes],
-            [bound.duplicate() for bound in self._boundaries],
-            self.units, self.tolerance, self.angle_tolerance)
-        new_model._identifier = self._identifier
-        new_model._display_name = self._display_name
-        new_model._user_data = None if self.user_data is None else self.user_data.copy()
+        # the immutable ladybug_geometry objects are shared with the new model and
+        # extension properties are only copied if they have been created. however,
+        # the Shape and Boundary objects are always copied since callers can hold
+        # references to them and mutate them (eg. their user_data or extension
+        # properties) in ways that cannot be intercepted to copy them on write
+        # create the model with __new__ to skip re-validating the attributes and
+        # re-computing the bounding box, which is unchanged by the duplication
+        new_model = Model.__new__(Model)
+        self._duplicate_base(new_model)
+        new_model._units = self._units
+        new_model._tolerance = self._tolerance
+        new_model._angle_tolerance = self._angle_tolerance
+        new_model._shapes = [shape.duplicate() for shape in self._shapes]
+        new_model._boundaries = [bound.duplicate() for bound in self._boundaries]
+        new_model._shape_index = self._identifier_index(new_model._shapes)
+        new_model._boundary_index = self._identifier_index(new_model._boundaries)
+        new_model._geo_counter = counter = [0]
+        for obj in new_model._shapes + new_model._boundaries:
+            obj._model_counters = [counter]
+        bbox = self._bounding_box
+        new_model._bounding_box = (0, bbox[1], bbox[2]) \
+            if bbox is not None and bbox[0] == self._geo_counter[0] else None
+        new_model._properties = ModelProperties(new_model)
         new_model._properties._duplicate_extension_attr(self._properties)
         return new_model
 
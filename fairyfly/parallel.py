@@ -0,0 +1,83 @@
+# coding=utf-8
+"""Utilities to distribute independent work across a pool of processes.
+
+The standard library concurrent.futures module is used when it is available.
+Otherwise (eg. in IronPython), work is always run serially in the current process.
+"""
+import os
+
+try:  # check if we are in a Python with concurrent.futures
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # we are in IronPython or Python 2
+    ProcessPoolExecutor = None
+
+
+def worker_count(workers):
+    """Get the number of processes to use from a user-specified workers input.
+
+    Args:
+        workers: An integer for the number of processes. Zero or a negative number
+            indicates that all CPUs of the machine should be used. None
+            indicates that work should run in the current process.
+
+    Returns:
+        An integer for the number of processes, which is 1 when work should run
+        in the current process (including when process pools are not available).
+    """
+    if workers is None or ProcessPoolExecutor is None:
+        return 1
+    workers = int(workers)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def chunk_list(items, chunk_count):
+    """Split a list into a number of sublists with similar lengths.
+
+    Args:
+        items: A list to be split into chunks.
+        chunk_count: An integer for the number of chunks.
+
+    Returns:
+        A list of sublists that, when concatenated, are equal to the input list.
+        Empty sublists are never returned.
+    """
+    chunk_count = max(1, min(chunk_count, len(items)))
+    size, extra = divmod(len(items), chunk_count)
+    chunks, start = [], 0
+    for i in range(chunk_count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return [c for c in chunks if c]
+
+
+def map_chunks(function, items, workers, args=(), chunks_per_worker=4):
+    """Apply a function to chunks of a list across a pool of processes.
+
+    Args:
+        function: A top-level (picklable) function that takes a list of items
+            as its first argument followed by the args. It must return a list
+            with one result for each item in the list.
+        items: A list of picklable items to be processed.
+        workers: An integer for the number of processes to use. If 1 (or process
+            pools are not available), the function is run in this process.
+        args: A tuple of additional arguments to be passed to the function
+            along with each chunk. (Default: ()).
+        chunks_per_worker: An integer for the number of chunks into which the work
+            of each process is split, which helps balance the load between
+            processes when some items take longer than others. (Default: 4).
+
+    Returns:
+        A list with a result for each item, in the same order as the items.
+    """
+    if workers <= 1 or ProcessPoolExecutor is None or len(items) <= 1:
+        return function(items, *args)
+    chunks = chunk_list(items, workers * chunks_per_worker)
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        futures = [executor.submit(function, chunk, *args) for chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+    return results
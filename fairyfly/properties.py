@@ -5,6 +5,11 @@ These objects hold all attributes assigned by extensions like fairyfly-therm.
 Note that these Property objects are not intended to exist on their own and
 should have a host object.
 """
+from fairyfly import _load_extensions
+
+# cache of the extension attribute names and the names that implement each
+# hook (eg. move, rotate) for each properties class
+_EXTENSION_ATTRIBUTES = {}
 
 
 class _Properties(object):
@@ -29,8 +34,63 @@ class _Properties(object):
 
     @property
     def _extension_attributes(self):
-        return (atr for atr in dir(self) if not atr.startswith('_')
-                and atr not in self._exclude)
+        """Get a tuple with the names of the attributes added by extensions.
+
+        The names are computed only once for each properties class and they are
+        recomputed whenever attributes have been added to the class (or any of
+        its parents) since the last time that they were computed, which happens
+        when an extension is registered.
+        """
+        return self._extension_cache()[0]
+
+    def _hook_attributes(self, hook):
+        """Get a tuple with the names of the extension attributes implementing a hook.
+
+        The result is computed once for each properties class using the extension
+        objects of these properties and it is recomputed whenever extensions
+        have been registered.
+
+        Args:
+            hook: Text for the name of the method that the extension objects
+                must have (eg. move, rotate, reflect, scale).
+        """
+        attributes, hooks = self._extension_cache()
+        try:
+            return hooks[hook]
+        except KeyError:  # first time that the hook is requested
+            hook_attr = tuple(
+                atr for atr in attributes if hasattr(getattr(self, atr), hook))
+            hooks[hook] = hook_attr
+            return hook_attr
+
+    def _extension_cache(self):
+        """Get the cached extension attributes and hook table for this class."""
+        cls = self.__class__
+        signature = tuple(len(c.__dict__) for c in cls.__mro__)
+        try:
+            cache = _EXTENSION_ATTRIBUTES[cls]
+            if cache[0] == signature:
+                return cache[1], cache[2]
+        except KeyError:  # first time that the attributes are requested
+            pass
+        if _load_extensions():  # extensions have just registered their attributes
+            signature = tuple(len(c.__dict__) for c in cls.__mro__)
+        attributes = tuple(atr for atr in dir(cls) if not atr.startswith('_')
+                           and atr not in self._exclude)
+        hooks = {}
+        _EXTENSION_ATTRIBUTES[cls] = (signature, attributes, hooks)
+        return attributes, hooks
+
+    def __getattr__(self, name):
+        """Import the installed extensions the first time that an attribute is missing.
+
+        Extensions add their attributes to the properties classes when they are
+        imported, which happens lazily after fairyfly is imported.
+        """
+        if name.startswith('_') or not _load_extensions():
+            raise AttributeError('{} object has no attribute {}'.format(
+                self.__class__.__name__, name))
+        return getattr(self, name)
 
     def move(self, moving_vec):
         """Apply a move transform to extension attributes.
@@ -42,10 +102,8 @@ class _Properties(object):
             moving_vec: A ladybug_geometry Vector3D with the direction and distance
                 to move the face.
         """
-        for atr in self._extension_attributes:
+        for atr in self._hook_attributes('move'):
             var = getattr(self, atr)
-            if not hasattr(var, 'move'):
-                continue
             try:
                 var.move(moving_vec)
             except Exception as e:
@@ -65,10 +123,8 @@ class _Properties(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for atr in self._extension_attributes:
+        for atr in self._hook_attributes('rotate'):
             var = getattr(self, atr)
-            if not hasattr(var, 'rotate'):
-                continue
             try:
                 var.rotate(axis, angle, origin)
             except Exception as e:
@@ -87,10 +143,8 @@ class _Properties(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        for atr in self._extension_attributes:
+        for atr in self._hook_attributes('rotate_xy'):
             var = getattr(self, atr)
-            if not hasattr(var, 'rotate_xy'):
-                continue
             try:
                 var.rotate_xy(angle, origin)
             except Exception as e:
@@ -108,10 +162,8 @@ class _Properties(object):
             plane: A ladybug_geometry Plane across which the object will
                 be reflected.
         """
-        for atr in self._extension_attributes:
+        for atr in self._hook_attributes('reflect'):
             var = getattr(self, atr)
-            if not hasattr(var, 'reflect'):
-                continue
             try:
                 var.reflect(plane)
             except Exception as e:
@@ -130,10 +182,8 @@ class _Properties(object):
             origin: A ladybug_geometry Point3D representing the origin from which
                 to scale. If None, it will be scaled from the World origin (0, 0, 0).
         """
-        for atr in self._extension_attributes:
+        for atr in self._hook_attributes('scale'):
             var = getattr(self, atr)
-            if not hasattr(var, 'scale'):
-                continue
             try:
                 var.scale(factor, origin)
             except Exception as e:
@@ -175,11 +225,18 @@ class _Properties(object):
         the extension properties of the original core object should be passed to
         this method as the original_properties.
 
+        Extension attributes that have not yet been created on the original
+        properties (because they were never requested) are not duplicated. They
+        will be created with their default values when they are first requested
+        from these properties, just like they would be for the original.
+
         Args:
             original_properties: The properties object of the original core
                 object from which the duplicate was derived.
         """
         for atr in self._extension_attributes:
+            if getattr(original_properties, '_' + atr, True) is None:
+                continue  # the attribute has never been created; keep it lazy
             var = getattr(original_properties, atr)
             if not hasattr(var, 'duplicate'):
                 continue
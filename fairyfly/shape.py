@@ -5,14 +5,39 @@ import math
 import re
 
 from ladybug_geometry.geometry2d import Polygon2D
-from ladybug_geometry.geometry3d import Point3D, Plane, Face3D
+from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D
 
 from ._base import _Base
 from .search import get_attr_nested
 from .properties import ShapeProperties
+from .spatial import snap_polygons, intersect_polygon_segments
 import fairyfly.writer.shape as writer
 
 
+def _plane_from_values(n, o, x):
+    """Build a Plane from the values of a Plane that has already been normalized.
+
+    Unlike the Plane constructor, the normal and X-axis are not normalized
+    again such that the resulting Plane is identical to the one that the values
+    came from. All of the slots of the Plane are set here.
+
+    Args:
+        n: A normalized Vector3D for the normal of the plane.
+        o: A Point3D for the origin of the plane.
+        x: A normalized Vector3D for the X-axis of the plane, which is
+            orthogonal to the normal.
+    """
+    plane = Plane.__new__(Plane)
+    plane._n = n
+    plane._o = o
+    plane._x = x
+    plane._k = n.dot(o)
+    plane._y = n.cross(x)
+    plane._altitude = None
+    plane._azimuth = None
+    return plane
+
+
 class Shape(_Base):
     """A single planar shape.
 
@@ -42,7 +67,7 @@ class Shape(_Base):
         * azimuth
         * user_data
     """
-    __slots__ = ('_geometry', '_parent')
+    __slots__ = ('_geo', '_parent', '_bounds', '_model_counters')
 
     def __init__(self, geometry, identifier=None):
         """A single planar shape."""
@@ -51,8 +76,10 @@ class Shape(_Base):
         # process the geometry and basic properties
         assert isinstance(geometry, Face3D), \
             'Expected ladybug_geometry Face3D. Got {}'.format(type(geometry))
-        self._geometry = geometry
+        self._geo = geometry
         self._parent = None  # _parent will be set when the Shape is added to an object
+        self._bounds = None  # cached center and half-extents of the bounding box
+        self._model_counters = None  # geometry counters of Models with the Shape
 
         # initialize properties for extensions
         self._properties = ShapeProperties(self)
@@ -64,12 +91,26 @@ class Shape(_Base):
         Args:
             data: A dictionary representation of an Shape object.
         """
+        return cls._from_dict(data)
+
+    @classmethod
+    def _from_dict(cls, data, geometry=None):
+        """Initialize an Shape from a dictionary and (optionally) its loaded geometry.
+
+        Args:
+            data: A dictionary representation of an Shape object.
+            geometry: An optional Face3D that has already been loaded from the
+                geometry of the dictionary. If None, it will be loaded from the
+                dictionary. (Default: None).
+        """
         try:
             # check the type of dictionary
             assert data['type'] == 'Shape', 'Expected Shape dictionary. ' \
                 'Got {}.'.format(data['type'])
             # serialize the dictionary to an object
-            shape = cls(Face3D.from_dict(data['geometry']), data['identifier'])
+            if geometry is None:
+                geometry = Face3D.from_dict(data['geometry'])
+            shape = cls(geometry, data['identifier'])
             if 'display_name' in data and data['display_name'] is not None:
                 shape.display_name = data['display_name']
             if 'user_data' in data and data['user_data'] is not None:
@@ -113,8 +154,33 @@ class Shape(_Base):
 
     @property
     def geometry(self):
-        """Get a ladybug_geometry Face3D object representing the Shape."""
-        return self._geometry
+        """Get a ladybug_geometry Face3D object representing the Shape.
+
+        If the geometry of the Shape has been packed into an array of coordinates
+        (eg. using Model.pack_geometry), a new Face3D is built from the array
+        each time that this property is accessed.
+        """
+        geo = self._geo
+        return geo if not isinstance(geo, tuple) else self._unpack_geometry(geo)
+
+    @property
+    def _geometry(self):
+        """Get or set the Face3D geometry of this Shape.
+
+        Setting this property increments the geometry counter of each Model
+        that contains this Shape so that the cached bounding box of the Model
+        is recomputed.
+        """
+        geo = self._geo
+        return geo if not isinstance(geo, tuple) else self._unpack_geometry(geo)
+
+    @_geometry.setter
+    def _geometry(self, value):
+        self._geo = value
+        self._bounds = None
+        if self._model_counters is not None:
+            for counter in self._model_counters:
+                counter[0] += 1
 
     @property
     def vertices(self):
@@ -291,25 +357,27 @@ class Shape(_Base):
         if not self._point_overlaps_bound(point, tolerance):
             return None
         # evaluate each boundary segment for whether it can be inserted
+        geo = self._geometry
         insert_i = None
-        for i, seg in enumerate(self.geometry.boundary_segments):
+        for i, seg in enumerate(geo.boundary_segments):
             if seg.distance_to_point(point) <= tolerance:
                 insert_i = i
                 break
         if insert_i is not None:
-            new_bound = list(self.geometry.boundary)
+            new_bound = list(geo.boundary)
             new_bound.insert(insert_i + 1, point)
-            self._geometry = Face3D(new_bound, self._geometry.plane, self._geometry.holes)
+            self._geometry = Face3D(new_bound, geo.plane, geo.holes)
             return None
         # evaluate the holes if they exist
-        if self._geometry.has_holes:
-            for hi, h_segs in enumerate(self._geometry.hole_segments):
+        if geo.has_holes:
+            for hi, h_segs in enumerate(geo.hole_segments):
                 for i, seg in enumerate(h_segs):
                     if seg.distance_to_point(point) <= tolerance:
-                        new_holes = list(self.geometry.holes)
-                        new_holes[hi].insert(i + 1, point)
-                        self._geometry = Face3D(self._geometry.boundary,
-                                                self._geometry.plane, new_holes)
+                        new_holes = list(geo.holes)
+                        new_hole = list(new_holes[hi])
+                        new_hole.insert(i + 1, point)
+                        new_holes[hi] = new_hole
+                        self._geometry = Face3D(geo.boundary, geo.plane, new_holes)
                         return None
 
     def is_geo_equivalent(self, shape, tolerance=0.01):
@@ -329,9 +397,10 @@ class Shape(_Base):
         """
         if self.display_name != shape.display_name:
             return False
-        if abs(self.area - shape.area) > tolerance * self.area:
+        geo, other_geo = self._geometry, shape.geometry
+        if abs(geo.area - other_geo.area) > tolerance * geo.area:
             return False
-        return self.geometry.is_centered_adjacent(shape.geometry, tolerance)
+        return geo.is_centered_adjacent(other_geo, tolerance)
 
     def check_planar(self, tolerance=0.01, raise_exception=True, detailed=False):
         """Check whether all of the Shape's vertices lie within the same plane.
@@ -348,8 +417,9 @@ class Shape(_Base):
         Returns:
             A string with the message or a list with a dictionary if detailed is True.
         """
+        geo = self._geometry
         try:
-            self.geometry.check_planar(tolerance, raise_exception=True)
+            geo.check_planar(tolerance, raise_exception=True)
         except ValueError as e:
             msg = 'Shape "{}" is not planar.\n{}'.format(self.full_id, e)
             full_msg = self._validation_message(
@@ -357,7 +427,7 @@ class Shape(_Base):
                 error_type='Non-Planar Geometry')
             if detailed:  # add the out-of-plane points to helper_geometry
                 help_pts = [
-                    p.to_dict() for p in self.geometry.non_planar_vertices(tolerance)
+                    p.to_dict() for p in geo.non_planar_vertices(tolerance)
                 ]
                 full_msg[0]['helper_geometry'] = help_pts
             return full_msg
@@ -379,10 +449,11 @@ class Shape(_Base):
         Returns:
             A string with the message or a list with a dictionary if detailed is True.
         """
-        if self.geometry.is_self_intersecting:
+        geo = self._geometry
+        if geo.is_self_intersecting:
             msg = 'Shape "{}" has self-intersecting edges.'.format(self.full_id)
             try:  # see if it is self-intersecting because of a duplicate vertex
-                new_geo = self.geometry.remove_duplicate_vertices(tolerance)
+                new_geo = geo.remove_duplicate_vertices(tolerance)
                 if not new_geo.is_self_intersecting:
                     return [] if detailed else ''  # valid with removed dup vertex
             except AssertionError:
@@ -391,7 +462,7 @@ class Shape(_Base):
                 msg, raise_exception, detailed, '200102',
                 error_type='Self-Intersecting Geometry')
             if detailed:  # add the self-intersection points to helper_geometry
-                help_pts = [p.to_dict() for p in self.geometry.self_intersection_points]
+                help_pts = [p.to_dict() for p in geo.self_intersection_points]
                 full_msg[0]['helper_geometry'] = help_pts
             return full_msg
         return [] if detailed else ''
@@ -484,8 +555,8 @@ class Shape(_Base):
                     pts_2d = tuple(master_plane.xyz_to_xy(pt) for pt in hole)
                     polygon_2ds.append(Polygon2D(pts_2d))
 
-        # snap all polygons together
-        polygon_2ds = Polygon2D.snap_polygons(polygon_2ds, tol)
+        # snap all polygons together, only comparing those that are near one another
+        polygon_2ds = snap_polygons(polygon_2ds, tol)
 
         # remove colinear and degenerate geometry
         i_to_remove = []
@@ -499,7 +570,7 @@ class Shape(_Base):
             is_holes.pop(i)
 
         # intersect the Room2D polygons within the 2D space
-        int_poly = Polygon2D.intersect_polygon_segments(polygon_2ds, tol)
+        int_poly = intersect_polygon_segments(polygon_2ds, tol)
 
         # convert the resulting coordinates back to 3D space
         face_pts = []
@@ -512,40 +583,100 @@ class Shape(_Base):
 
         # rebuild all of the geometries to the input Shapes
         for i, face_loops in enumerate(face_pts):
+            plane = shapes[i].geometry.plane
             if len(face_loops[1]) == 0:  # no holes
-                new_geo = Face3D(face_loops[0], shapes[i].geometry.plane)
+                new_geo = Face3D(face_loops[0], plane)
             else:  # ensure holes are included
-                new_geo = Face3D(face_loops[0], shapes[i].geometry.plane, face_loops[1])
+                new_geo = Face3D(face_loops[0], plane, face_loops[1])
             shapes[i]._geometry = new_geo
         return shapes
 
     def _point_overlaps_bound(self, point, distance):
         """Check if a point lies within the bounding box around this shape."""
         # Bounding box check using the Separating Axis Theorem
-        geo1_width = self.max.x - self.min.x
-        dist_btwn_x = abs(self.center.x - point.x)
-        x_gap_btwn_box = dist_btwn_x - (0.5 * geo1_width)
-        if x_gap_btwn_box > distance:
+        bounds = self._bounds
+        if bounds is None:
+            bounds = self._bounds = self._bounding_extents()
+        c_x, c_y, c_z, h_x, h_y, h_z = bounds
+        if abs(c_x - point.x) - h_x > distance:
             return False   # overlap impossible
-
-        geo1_depth = self.max.y - self.min.y
-        dist_btwn_y = abs(self.center.y - point.y)
-        y_gap_btwn_box = dist_btwn_y - (0.5 * geo1_depth)
-        if y_gap_btwn_box > distance:
+        if abs(c_y - point.y) - h_y > distance:
             return False   # overlap impossible
-
-        geo1_height = self.max.z - self.min.z
-        dist_btwn_z = abs(self.center.z - point.z)
-        z_gap_btwn_box = dist_btwn_z - (0.5 * geo1_height)
-        if z_gap_btwn_box > distance:
+        if abs(c_z - point.z) - h_z > distance:
             return False   # overlap impossible
-
         return True  # overlap exists
 
+    def _bounding_extents(self):
+        """Get a tuple with the center and half-extents of the shape's bounding box.
+
+        The tuple has six floats, the first three of which are the X, Y, and Z
+        of the bounding box center and the last three are half of the width,
+        depth and height of the bounding box.
+        """
+        geo = self._geometry
+        s_min, s_max, center = geo.min, geo.max, geo.center
+        return (center.x, center.y, center.z, 0.5 * (s_max.x - s_min.x),
+                0.5 * (s_max.y - s_min.y), 0.5 * (s_max.z - s_min.z))
+
+    def _pack_geometry(self, coords):
+        """Pack the geometry of this Shape into an array of coordinates.
+
+        After this method is run, the Shape holds a tuple with the coordinate
+        array, the index of the Shape in the array and the length of each loop
+        of the geometry instead of a Face3D. The array starts with 9 numbers for
+        the normal, origin and X-axis of the plane followed by the coordinates
+        of the boundary and any holes.
+
+        Args:
+            coords: An array('d') to which the coordinates of this Shape will be
+                appended. This is typically shared among several Shapes.
+        """
+        geo = self._geometry
+        loops = [geo.boundary]
+        if geo.has_holes:
+            loops.extend(geo.holes)
+        start = len(coords)
+        plane = geo.plane
+        coords.extend(plane.n)
+        coords.extend(plane.o)
+        coords.extend(plane.x)
+        for loop in loops:
+            for pt in loop:
+                coords.extend(pt)
+        # the _geometry setter is bypassed on purpose since the geometry does not
+        # change, meaning that the cached bounding boxes stay valid
+        self._geo = (coords, start, tuple(len(loop) for loop in loops))
+
+    @staticmethod
+    def _unpack_geometry(packed):
+        """Build a Face3D from the tuple of a Shape with packed geometry.
+
+        The result is identical to the Face3D that was packed.
+        """
+        coords, i, loop_lengths = packed
+        plane = _plane_from_values(
+            Vector3D(coords[i], coords[i + 1], coords[i + 2]),
+            Point3D(coords[i + 3], coords[i + 4], coords[i + 5]),
+            Vector3D(coords[i + 6], coords[i + 7], coords[i + 8]))
+        i += 9
+        loops = []
+        for loop_len in loop_lengths:
+            end = i + loop_len * 3
+            loops.append(tuple(
+                Point3D(coords[j], coords[j + 1], coords[j + 2])
+                for j in range(i, end, 3)))
+            i = end
+        holes = loops[1:] if len(loops) > 1 else None
+        return Face3D(loops[0], plane, holes, enforce_right_hand=False)
+
     def __copy__(self):
-        new_shape = Shape(self.geometry, self.identifier)
-        new_shape._display_name = self._display_name
-        new_shape._user_data = None if self.user_data is None else self.user_data.copy()
+        new_shape = Shape.__new__(Shape)  # skip validation of the valid identifier
+        self._duplicate_base(new_shape)
+        new_shape._geo = self._geo
+        new_shape._parent = None
+        new_shape._bounds = self._bounds
+        new_shape._model_counters = None
+        new_shape._properties = ShapeProperties(new_shape)
         new_shape._properties._duplicate_extension_attr(self._properties)
         return new_shape
 
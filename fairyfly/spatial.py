@@ -0,0 +1,364 @@
+# coding=utf-8
+"""Spatial indices used to avoid comparing every pair of geometry objects."""
+from __future__ import division
+
+import math
+
+from ladybug_geometry.geometry2d import Polygon2D
+
+
+class PointGrid(object):
+    """A hash grid of 3D points for finding points that are equivalent to one another.
+
+    Points are bucketed into cubic cells that are twice the tolerance in size.
+    So any two points that are equivalent within the tolerance (meaning that
+    none of their coordinate values differ by more than the tolerance) lie
+    within adjacent cells and rounding errors cannot separate them further.
+
+    Args:
+        tolerance: The maximum difference between x, y, and z values at which
+            points are considered equivalent. Zero indicates that only points
+            with identical coordinates are considered equivalent.
+
+    Properties:
+        * tolerance
+    """
+    __slots__ = ('_tolerance', '_cell_size', '_cells')
+
+    def __init__(self, tolerance):
+        """Initialize PointGrid."""
+        self._tolerance = tolerance
+        self._cell_size = tolerance * 2
+        self._cells = {}
+
+    @property
+    def tolerance(self):
+        """Get the tolerance at which points are considered equivalent."""
+        return self._tolerance
+
+    def add(self, point, key):
+        """Add a point to the grid.
+
+        Args:
+            point: A Point3D to be added to the grid.
+            key: An object to be returned by the neighbors method when the
+                point lies in the vicinity. This is typically the index of
+                the point in a list.
+        """
+        try:
+            self._cells[self._cell(point)].append(key)
+        except KeyError:
+            self._cells[self._cell(point)] = [key]
+
+    def neighbors(self, point):
+        """Get a list of keys for all points in the grid that might be equivalent.
+
+        The result is a superset of the points that are equivalent to the input
+        and any equivalency checks should be performed on the result.
+
+        Args:
+            point: A Point3D for which nearby points will be found.
+        """
+        cells = self._cells
+        if self._cell_size == 0:
+            return list(cells.get(self._cell(point), ()))
+        cx, cy, cz = self._cell(point)
+        near_keys = []
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                for z in (cz - 1, cz, cz + 1):
+                    try:
+                        near_keys.extend(cells[(x, y, z)])
+                    except KeyError:
+                        pass  # no points in this cell
+        return near_keys
+
+    def _cell(self, point):
+        """Get a tuple for the cell of the grid in which a point lies."""
+        size = self._cell_size
+        if size == 0:
+            return (point.x, point.y, point.z)
+        return (int(math.floor(point.x / size)), int(math.floor(point.y / size)),
+                int(math.floor(point.z / size)))
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._cells.values())
+
+    def __repr__(self):
+        return 'PointGrid (tolerance: {})'.format(self._tolerance)
+
+
+def equivalent_point_pairs(points, tolerance):
+    """Get the pairs of points in a list that are equivalent within a tolerance.
+
+    This yields the same result as checking every pair of points with
+    Point3D.is_equivalent but it only checks points in neighboring cells of a
+    PointGrid. So the number of checks grows linearly with the number of
+    points rather than quadratically.
+
+    Args:
+        points: A list of Point3D to be checked for equivalency.
+        tolerance: The maximum difference between x, y, and z values at which
+            points are considered equivalent.
+
+    Returns:
+        A sorted list of tuples with two integers (i, j) where i < j. Each tuple
+        denotes the indices of two equivalent points in the input list.
+    """
+    grid, pairs = PointGrid(tolerance), []
+    for j, pt in enumerate(points):
+        for i in grid.neighbors(pt):
+            if points[i].is_equivalent(pt, tolerance):
+                pairs.append((i, j))
+        grid.add(pt, j)
+    pairs.sort()
+    return pairs
+
+
+def unique_points(points, tolerance):
+    """Get a list of the points in a list that are not equivalent to a preceding point.
+
+    This yields the same result as checking each point against all of the
+    previously-collected unique points with Point3D.is_equivalent but it only
+    checks the unique points in neighboring cells of a PointGrid. So the number
+    of checks grows linearly with the number of points rather than quadratically.
+
+    Args:
+        points: A list of Point3D to be checked for equivalency.
+        tolerance: The maximum difference between x, y, and z values at which
+            points are considered equivalent.
+
+    Returns:
+        A list of the unique Point3D in the order that they appear in the input.
+    """
+    grid, unique_pts = PointGrid(tolerance), []
+    for pt in points:
+        for i in grid.neighbors(pt):
+            if unique_pts[i].is_equivalent(pt, tolerance):
+                break
+        else:  # the point is unique
+            grid.add(pt, len(unique_pts))
+            unique_pts.append(pt)
+    return unique_pts
+
+
+class BoundingBoxGrid(object):
+    """A uniform grid of cells for finding bounding boxes that overlap one another.
+
+    Each bounding box is registered in all of the grid cells that it touches.
+    Boxes that would touch a very large number of cells (because they are much
+    larger than the cell size) are instead kept in a separate list, which is
+    always evaluated when the grid is queried. This keeps the number of cells
+    bounded for models with a mix of very large and very small objects.
+
+    Args:
+        cell_size: A positive number for the dimension of each cell of the grid.
+            This should typically be similar to the dimension of the boxes.
+        tolerance: A number by which the boxes in the grid are expanded in all
+            directions when they are added. Boxes that are separated by less
+            than this distance are considered overlapping. (Default: 0).
+
+    Properties:
+        * cell_size
+        * tolerance
+    """
+    __slots__ = ('_cell_size', '_tolerance', '_cells', '_boxes', '_large')
+    MAX_CELLS = 64  # maximum number of cells that a box can occupy in the grid
+
+    def __init__(self, cell_size, tolerance=0):
+        """Initialize BoundingBoxGrid."""
+        assert cell_size > 0, 'BoundingBoxGrid cell_size must be greater than zero.'
+        self._cell_size = cell_size
+        self._tolerance = tolerance
+        self._cells = {}
+        self._boxes = {}
+        self._large = set()
+
+    @classmethod
+    def from_boxes(cls, min_pts, max_pts, tolerance=0):
+        """Create a grid from lists of bounding box corners with a suitable cell size.
+
+        The key of each box in the resulting grid is its index in the input lists.
+
+        Args:
+            min_pts: A list of points for the minimum of each bounding box. Each
+                point can be a Point2D, Point3D or a tuple of numbers.
+            max_pts: A list of points for the maximum of each bounding box, which
+                align with the min_pts.
+            tolerance: A number by which the boxes in the grid are expanded in all
+                directions. (Default: 0).
+        """
+        size, count = 0, 0
+        for mn, mx in zip(min_pts, max_pts):
+            size += max(b - a for a, b in zip(mn, mx))
+            count += 1
+        cell_size = size / count if count != 0 else 0
+        cell_size = max(cell_size, tolerance * 2)
+        grid = cls(cell_size if cell_size > 0 else 1, tolerance)
+        for i, (mn, mx) in enumerate(zip(min_pts, max_pts)):
+            grid.add(mn, mx, i)
+        return grid
+
+    @property
+    def cell_size(self):
+        """Get the dimension of each cell of the grid."""
+        return self._cell_size
+
+    @property
+    def tolerance(self):
+        """Get the distance by which boxes are expanded when added to the grid."""
+        return self._tolerance
+
+    def add(self, min_pt, max_pt, key):
+        """Add a bounding box to the grid.
+
+        Args:
+            min_pt: A point for the minimum of the bounding box. This can be a
+                Point2D, Point3D or a tuple of numbers.
+            max_pt: A point for the maximum of the bounding box.
+            key: A hashable object to identify the bounding box, which will be
+                returned when queries overlap the box. This is typically the
+                index of an object in a list.
+        """
+        tol = self._tolerance
+        box = (tuple(v - tol for v in min_pt), tuple(v + tol for v in max_pt))
+        self._boxes[key] = box
+        cells = self._box_cells(*box)
+        if cells is None:
+            self._large.add(key)
+            return
+        all_cells = self._cells
+        for cell in cells:
+            try:
+                all_cells[cell].append(key)
+            except KeyError:
+                all_cells[cell] = [key]
+
+    def remove(self, key):
+        """Remove a bounding box from the grid using its key."""
+        box = self._boxes.pop(key)
+        if key in self._large:
+            self._large.discard(key)
+            return
+        for cell in self._box_cells(*box):
+            self._cells[cell].remove(key)
+
+    def update(self, min_pt, max_pt, key):
+        """Update the bounding box in the grid that has a given key."""
+        self.remove(key)
+        self.add(min_pt, max_pt, key)
+
+    def query(self, min_pt, max_pt):
+        """Get the keys of all boxes in the grid that overlap a bounding box.
+
+        Args:
+            min_pt: A point for the minimum of the bounding box to be tested.
+            max_pt: A point for the maximum of the bounding box to be tested.
+
+        Returns:
+            A set with the keys of all boxes in the grid that overlap the input
+            box once they have been expanded by the tolerance of the grid.
+        """
+        min_pt, max_pt = tuple(min_pt), tuple(max_pt)
+        cells, candidates = self._box_cells(min_pt, max_pt), set(self._large)
+        if cells is None:  # query box is larger than the grid can handle
+            candidates.update(self._boxes.keys())
+        else:
+            all_cells = self._cells
+            for cell in cells:
+                try:
+                    candidates.update(all_cells[cell])
+                except KeyError:
+                    pass  # no boxes in the cell
+        boxes, overlapping = self._boxes, set()
+        for key in candidates:
+            b_min, b_max = boxes[key]
+            for a, b, c, d in zip(min_pt, max_pt, b_min, b_max):
+                if a > d or c > b:
+                    break
+            else:
+                overlapping.add(key)
+        return overlapping
+
+    def _box_cells(self, min_pt, max_pt):
+        """Get a list of the cells touched by a box or None if the box is too large."""
+        size = self._cell_size
+        ranges, cell_count = [], 1
+        for a, b in zip(min_pt, max_pt):
+            axis_range = range(int(math.floor(a / size)), int(math.floor(b / size)) + 1)
+            cell_count *= len(axis_range)
+            if cell_count > self.MAX_CELLS:
+                return None
+            ranges.append(axis_range)
+        cells = [()]
+        for axis_range in ranges:
+            cells = [cell + (c,) for cell in cells for c in axis_range]
+        return cells
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __repr__(self):
+        return 'BoundingBoxGrid (cell size: {})'.format(self._cell_size)
+
+
+def snap_polygons(polygons, tolerance):
+    """Snap several Polygon2D to each other if they differ less than the tolerance.
+
+    The result is the same as that of Polygon2D.snap_polygons but each polygon is
+    only snapped to the polygons with bounding rectangles that lie within the
+    tolerance of its own. Since snapping moves vertices, the bounding rectangles
+    are updated in a BoundingBoxGrid as the polygons are snapped.
+
+    Args:
+        polygons: A list of Polygon2D, which will be snapped to each other.
+        tolerance: The minimum distance at which points will be snapped.
+
+    Returns:
+        A list of the input polygon2D that have been snapped to one another.
+    """
+    new_polygons = list(polygons)
+    grid = BoundingBoxGrid.from_boxes(
+        [p.min for p in new_polygons], [p.max for p in new_polygons], tolerance)
+    for i, poly_1 in enumerate(new_polygons):
+        grid.remove(i)  # only the polygons after this one are snapped to it
+        for j in sorted(grid.query(*_expanded_rect(poly_1, tolerance))):
+            new_poly = poly_1.snap_to_polygon(new_polygons[j], tolerance)
+            new_polygons[j] = new_poly
+            grid.update(new_poly.min, new_poly.max, j)
+    return new_polygons
+
+
+def intersect_polygon_segments(polygon_list, tolerance):
+    """Intersect the line segments of a Polygon2D array to ensure matching segments.
+
+    The result is the same as that of Polygon2D.intersect_polygon_segments
+    but the segments of each polygon are only intersected with those of the
+    polygons with bounding rectangles that lie within the tolerance of its own.
+
+    Args:
+        polygon_list: List of Polygon2Ds which will have their segments
+            intersected with one another.
+        tolerance: Distance within which two points are considered to be
+            co-located.
+
+    Returns:
+        The input list of Polygon2D objects with extra vertices inserted
+        where necessary.
+    """
+    grid = BoundingBoxGrid.from_boxes(
+        [p.min for p in polygon_list], [p.max for p in polygon_list], tolerance)
+    for i in range(len(polygon_list) - 1):
+        grid.remove(i)  # only the polygons after this one are intersected with it
+        for j in sorted(grid.query(*_expanded_rect(polygon_list[i], tolerance))):
+            polygon_list[i], polygon_list[j] = Polygon2D.intersect_segments(
+                polygon_list[i], polygon_list[j], tolerance)
+    return polygon_list
+
+
+def _expanded_rect(polygon, distance):
+    """Get the min and max of the bounding rectangle of a polygon expanded by a distance.
+    """
+    p_min, p_max = polygon.min, polygon.max
+    return (p_min.x - distance, p_min.y - distance), \
+        (p_max.x + distance, p_max.y + distance)
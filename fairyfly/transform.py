@@ -0,0 +1,310 @@
+# coding=utf-8
+"""Batched geometric transforms of the geometry of many Shapes and Boundaries.
+
+The vertices of all objects are packed into a single coordinate array so that
+each transform is evaluated in one pass over the array (with constants like
+the sine and cosine of rotation angles computed only once). If NumPy is
+installed, the coordinate arrays are transformed as vectorized operations.
+Otherwise, a pure Python implementation is used.
+
+The arithmetic of each transform matches that of the corresponding
+ladybug_geometry transform and so the resulting vertices and planes are
+identical to transforming each object individually. Shapes with holes are
+transformed individually with the public Face3D transform methods since their
+vertices must remain consistent with the transformed boundary and holes.
+"""
+from __future__ import division
+import math
+
+from ladybug_geometry.geometry3d import Point3D, Vector3D, LineSegment3D, Face3D
+
+try:  # NumPy is optional and only used to accelerate the transforms
+    import numpy
+except ImportError:  # NumPy is not installed
+    numpy = None
+
+
+class GeometryBatch(object):
+    """The geometry of several Shapes and Boundaries packed into coordinate arrays.
+
+    Transforming the batch assigns new geometry to each of the Shapes and
+    Boundaries. Note that the transform methods of this object do not transform
+    the extension properties of the objects, which should be transformed
+    separately. Also note that the batch does not call the transform methods
+    of the objects and so objects with overridden transform methods should
+    not be included in the batch.
+
+    Args:
+        shapes: A list of Shape objects to be included in the batch. (Default: ()).
+        boundaries: A list of Boundary objects to be included in the
+            batch. (Default: ()).
+        use_numpy: Boolean to note whether NumPy should be used to transform
+            the coordinates if it is installed. (Default: True).
+
+    Properties:
+        * shapes
+        * boundaries
+        * point_count
+    """
+    __slots__ = ('_shapes', '_boundaries', '_points', '_vectors',
+                 '_shape_counts', '_use_numpy')
+
+    def __init__(self, shapes=(), boundaries=(), use_numpy=True):
+        """Initialize GeometryBatch."""
+        self._shapes = tuple(shapes)
+        self._boundaries = tuple(boundaries)
+        self._use_numpy = use_numpy and numpy is not None
+        points, vectors, shape_counts = [], [], []
+        for shape in self._shapes:
+            geo = shape.geometry
+            if geo.has_holes:  # transformed individually with the Face3D method
+                shape_counts.append(None)
+                continue
+            points.extend((pt.x, pt.y, pt.z) for pt in geo.boundary)
+            shape_counts.append(len(geo.boundary))
+        for bound in self._boundaries:
+            for seg in bound.geometry:
+                points.append((seg.p.x, seg.p.y, seg.p.z))
+                vectors.append((seg.v.x, seg.v.y, seg.v.z))
+        self._points = points
+        self._vectors = vectors
+        self._shape_counts = shape_counts
+
+    @property
+    def shapes(self):
+        """Get a tuple of the Shapes in the batch."""
+        return self._shapes
+
+    @property
+    def boundaries(self):
+        """Get a tuple of the Boundaries in the batch."""
+        return self._boundaries
+
+    @property
+    def point_count(self):
+        """Get the number of points in the coordinate array of the batch."""
+        return len(self._points)
+
+    def move(self, moving_vec):
+        """Move all of the geometry in the batch along a vector.
+
+        Args:
+            moving_vec: A ladybug_geometry Vector3D with the direction and
+                distance to move the geometry.
+        """
+        mx, my, mz = moving_vec.x, moving_vec.y, moving_vec.z
+        if self._use_numpy:
+            points = numpy.array(self._points).reshape(-1, 3)
+            points = (points + numpy.array((mx, my, mz))).tolist()
+        else:
+            points = [(x + mx, y + my, z + mz) for x, y, z in self._points]
+        self._apply(
+            points, self._vectors,
+            lambda plane: plane.move(moving_vec),
+            lambda geo: geo.move(moving_vec))
+
+    def rotate(self, axis, angle, origin):
+        """Rotate all of the geometry in the batch around an axis and origin.
+
+        Args:
+            axis: A ladybug_geometry Vector3D axis representing the axis of rotation.
+            angle: An angle for rotation in radians.
+            origin: A ladybug_geometry Point3D for the origin around which the
+                geometry will be rotated.
+        """
+        points = self._rotate(self._points, axis, angle, origin)
+        vectors = self._rotate(self._vectors, axis, angle)
+        self._apply(
+            points, vectors,
+            lambda plane: plane.rotate(axis, angle, origin),
+            lambda geo: geo.rotate(axis, angle, origin))
+
+    def rotate_xy(self, angle, origin):
+        """Rotate all of the geometry in the batch counterclockwise in the XY plane.
+
+        Args:
+            angle: An angle for rotation in radians.
+            origin: A ladybug_geometry Point3D for the origin around which the
+                geometry will be rotated.
+        """
+        points = self._rotate_xy(self._points, angle, origin)
+        vectors = self._rotate_xy(self._vectors, angle)
+        self._apply(
+            points, vectors,
+            lambda plane: plane.rotate_xy(angle, origin),
+            lambda geo: geo.rotate_xy(angle, origin))
+
+    def reflect(self, normal, origin):
+        """Reflect all of the geometry in the batch across a plane.
+
+        Args:
+            normal: A ladybug_geometry Vector3D representing the normal vector
+                for the plane across which the geometry will be reflected.
+                THIS VECTOR MUST BE NORMALIZED.
+            origin: A ladybug_geometry Point3D representing the origin from
+                which to reflect.
+        """
+        points = self._reflect(self._points, normal, origin)
+        vectors = self._reflect(self._vectors, normal)
+        self._apply(
+            points, vectors,
+            lambda plane: plane.reflect(normal, origin),
+            lambda geo: geo.reflect(normal, origin), reverse=True)
+
+    def scale(self, factor, origin=None):
+        """Scale all of the geometry in the batch by a factor from an origin point.
+
+        Args:
+            factor: A number representing how much the geometry should be scaled.
+            origin: A ladybug_geometry Point3D representing the origin from which
+                to scale. If None, it will be scaled from the World origin (0, 0, 0).
+        """
+        points = self._scale(self._points, factor, origin)
+        vectors = self._scale(self._vectors, factor)
+        self._apply(
+            points, vectors,
+            lambda plane: None,  # the plane is recomputed from the scaled vertices
+            lambda geo: geo.scale(factor, origin))
+
+    def _apply(self, points, vectors, plane_transform, face_transform, reverse=False):
+        """Assign transformed coordinates back to the Shapes and Boundaries.
+
+        Args:
+            points: A list of transformed (x, y, z) point coordinates.
+            vectors: A list of transformed (x, y, z) vector coordinates.
+            plane_transform: A function that takes the Plane of a Face3D and
+                returns the transformed Plane (or None if the plane should be
+                computed from the transformed vertices).
+            face_transform: A function that takes a Face3D and returns the
+                transformed Face3D, which is used for the Shapes with holes.
+            reverse: Boolean to note whether the order of the vertices in each
+                Face3D should be reversed, which is needed to preserve the
+                orientation of reflected faces. (Default: False).
+        """
+        self._points, self._vectors = points, vectors
+        i = 0
+        for shape, count in zip(self._shapes, self._shape_counts):
+            geo = shape.geometry
+            if count is None:  # shape with holes
+                shape._geometry = face_transform(geo)
+                continue
+            if reverse:  # keep the coordinates in the order of the vertices
+                points[i:i + count] = points[i:i + count][::-1]
+            verts = tuple(Point3D(*pt) for pt in points[i:i + count])
+            i += count
+            shape._geometry = Face3D(
+                verts, plane_transform(geo.plane), enforce_right_hand=False)
+        j = 0
+        for bound in self._boundaries:
+            new_geo = []
+            for pt, vec in zip(points[i:i + len(bound)], vectors[j:j + len(bound)]):
+                new_geo.append(LineSegment3D(Point3D(*pt), Vector3D(*vec)))
+            i += len(bound)
+            j += len(bound)
+            bound._geometry = tuple(new_geo)
+
+    def _rotate(self, coords, axis, angle, origin=None):
+        """Rotate coordinates around an axis using the same math as Vector3D._rotate.
+        """
+        ox, oy, oz = (origin.x, origin.y, origin.z) if origin is not None else (0, 0, 0)
+        u, v, w = axis.x, axis.y, axis.z
+        r2 = u ** 2 + v ** 2 + w ** 2
+        r = math.sqrt(r2)
+        ct = math.cos(angle)
+        st = math.sin(angle) / r
+        if self._use_numpy and coords:
+            arr = numpy.array(coords)
+            x, y, z = arr[:, 0] - ox, arr[:, 1] - oy, arr[:, 2] - oz
+            dt = (u * x + v * y + w * z) * (1 - ct) / r2
+            nx = (u * dt + x * ct + (-w * y + v * z) * st)
+            ny = (v * dt + y * ct + (w * x - u * z) * st)
+            nz = (w * dt + z * ct + (-v * x + u * y) * st)
+            if origin is not None:
+                nx, ny, nz = nx + ox, ny + oy, nz + oz
+            return numpy.column_stack((nx, ny, nz)).tolist()
+        new_coords = []
+        for x, y, z in coords:
+            if origin is not None:
+                x, y, z = x - ox, y - oy, z - oz
+            dt = (u * x + v * y + w * z) * (1 - ct) / r2
+            nx = (u * dt + x * ct + (-w * y + v * z) * st)
+            ny = (v * dt + y * ct + (w * x - u * z) * st)
+            nz = (w * dt + z * ct + (-v * x + u * y) * st)
+            if origin is not None:
+                nx, ny, nz = nx + ox, ny + oy, nz + oz
+            new_coords.append((nx, ny, nz))
+        return new_coords
+
+    def _rotate_xy(self, coords, angle, origin=None):
+        """Rotate coordinates in the XY plane using the same math as Vector2D._rotate.
+        """
+        ox, oy, oz = (origin.x, origin.y, origin.z) if origin is not None else (0, 0, 0)
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        if self._use_numpy and coords:
+            arr = numpy.array(coords)
+            x, y, z = arr[:, 0], arr[:, 1], arr[:, 2]
+            if origin is not None:
+                x, y, z = x - ox, y - oy, z - oz
+            nx = cos_a * x - sin_a * y
+            ny = sin_a * x + cos_a * y
+            if origin is not None:
+                nx, ny, z = nx + ox, ny + oy, z + oz
+            return numpy.column_stack((nx, ny, z)).tolist()
+        new_coords = []
+        for x, y, z in coords:
+            if origin is not None:
+                x, y, z = x - ox, y - oy, z - oz
+            nx = cos_a * x - sin_a * y
+            ny = sin_a * x + cos_a * y
+            if origin is not None:
+                nx, ny, z = nx + ox, ny + oy, z + oz
+            new_coords.append((nx, ny, z))
+        return new_coords
+
+    def _reflect(self, coords, normal, origin=None):
+        """Reflect coordinates across a plane using the same math as Vector3D._reflect.
+        """
+        ox, oy, oz = (origin.x, origin.y, origin.z) if origin is not None else (0, 0, 0)
+        n_x, n_y, n_z = normal.x, normal.y, normal.z
+        if self._use_numpy and coords:
+            arr = numpy.array(coords)
+            x, y, z = arr[:, 0], arr[:, 1], arr[:, 2]
+            if origin is not None:
+                x, y, z = x - ox, y - oy, z - oz
+            d = 2 * (x * n_x + y * n_y + z * n_z)
+            nx, ny, nz = x - d * n_x, y - d * n_y, z - d * n_z
+            if origin is not None:
+                nx, ny, nz = nx + ox, ny + oy, nz + oz
+            return numpy.column_stack((nx, ny, nz)).tolist()
+        new_coords = []
+        for x, y, z in coords:
+            if origin is not None:
+                x, y, z = x - ox, y - oy, z - oz
+            d = 2 * (x * n_x + y * n_y + z * n_z)
+            nx, ny, nz = x - d * n_x, y - d * n_y, z - d * n_z
+            if origin is not None:
+                nx, ny, nz = nx + ox, ny + oy, nz + oz
+            new_coords.append((nx, ny, nz))
+        return new_coords
+
+    def _scale(self, coords, factor, origin=None):
+        """Scale coordinates from an origin using the same math as Point3D.scale."""
+        if self._use_numpy and coords:
+            arr = numpy.array(coords)
+            if origin is None:
+                return (arr * factor).tolist()
+            o_arr = numpy.array((origin.x, origin.y, origin.z))
+            return ((arr - o_arr) * factor + o_arr).tolist()
+        if origin is None:
+            return [(x * factor, y * factor, z * factor) for x, y, z in coords]
+        ox, oy, oz = origin.x, origin.y, origin.z
+        return [((x - ox) * factor + ox, (y - oy) * factor + oy, (z - oz) * factor + oz)
+                for x, y, z in coords]
+
+    def __len__(self):
+        return len(self._shapes) + len(self._boundaries)
+
+    def __repr__(self):
+        return 'GeometryBatch: [{} shapes] [{} boundaries]'.format(
+            len(self._shapes), len(self._boundaries))
@@ -5,3 +5,24 @@ Use this package to extend fairyfly's geometry writers for new extensions.
 Functions added to the respective module of a given geometry object
 will show up under the `to` method of the given object.
 """
+import sys
+
+from fairyfly import _load_extensions
+
+
+def _extension_getattr(module_name):
+    """Get a module __getattr__ function that imports extensions to find writers.
+
+    Extensions add their writers to the writer modules when they are imported.
+    So the returned function imports the extensions the first time that a writer
+    is not found in the module and then looks for the writer again.
+
+    Args:
+        module_name: Text for the name of the writer module.
+    """
+    def __getattr__(name):
+        if not name.startswith('_') and _load_extensions():
+            return getattr(sys.modules[module_name], name)
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(module_name, name))
+    return __getattr__
@@ -4,3 +4,7 @@ Note to developers:
 Use this module to extend fairyfly's Model writer for new extensions.
 (eg. adding `therm` to this module adds the method `Model.to.therm`)
 """
+from fairyfly.writer import _extension_getattr
+
+# import the extensions the first time that a writer is not found in this module
+__getattr__ = _extension_getattr(__name__)
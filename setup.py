@@ -19,6 +19,9 @@ setuptools.setup(
     packages=setuptools.find_packages(exclude=["tests"]),
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        'json': ['orjson;python_version>=\'3.8\'']
+    },
     entry_points={
         "console_scripts": ["fairyfly = fairyfly.cli:main"]
     },
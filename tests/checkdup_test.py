@@ -0,0 +1,66 @@
+"""Test the duplicate identifier checking utilities."""
+import uuid
+import pytest
+
+from ladybug_geometry.geometry3d import Point3D, Face3D
+
+from fairyfly.shape import Shape
+from fairyfly.checkdup import check_duplicate_identifiers, \
+    check_duplicate_identifiers_parent
+
+
+def _shapes_with_duplicates():
+    """Get a list of shapes where some of the identifiers are duplicated."""
+    geo = Face3D((Point3D(0, 0, 0), Point3D(1, 0, 0), Point3D(1, 1, 0)))
+    id_1, id_2 = str(uuid.uuid4()), str(uuid.uuid4())
+    shapes = [Shape(geo, id_1), Shape(geo), Shape(geo, id_2), Shape(geo, id_1),
+              Shape(geo, id_2), Shape(geo, id_1)]
+    for i, shape in enumerate(shapes):
+        shape.display_name = 'Shape {}'.format(i)
+    return shapes, id_1, id_2
+
+
+def test_check_duplicate_identifiers():
+    """Test the check_duplicate_identifiers function."""
+    shapes, id_1, id_2 = _shapes_with_duplicates()
+    assert check_duplicate_identifiers(shapes[:3], False) == ''
+    assert check_duplicate_identifiers(shapes[:3], False, detailed=True) == []
+    msg = check_duplicate_identifiers(shapes, False, 'Shape')
+    assert msg == 'The following duplicated Shape identifiers were found:\n' \
+        '{}\n{}'.format(id_1, id_2)
+    with pytest.raises(ValueError):
+        check_duplicate_identifiers(shapes, True, 'Shape')
+
+    errors = check_duplicate_identifiers(shapes, False, 'Shape', True, '200001')
+    assert len(errors) == 2
+    assert errors[0]['element_id'] == [id_1]
+    assert errors[0]['element_name'] == ['Shape 5']
+    assert errors[0]['code'] == '200001'
+    assert errors[1]['element_id'] == [id_2]
+    assert errors[1]['element_name'] == ['Shape 4']
+    assert errors[1]['message'] == \
+        'There is a duplicated Shape identifier: {}'.format(id_2)
+
+
+def test_check_duplicate_identifiers_parent():
+    """Test the check_duplicate_identifiers_parent function."""
+    shapes, id_1, id_2 = _shapes_with_duplicates()
+    parent = Shape(shapes[0].geometry)
+    parent.display_name = 'Parent'
+    shapes[3]._parent = parent
+    shapes[5]._parent = parent
+
+    msg = check_duplicate_identifiers_parent(shapes, False, 'Shape')
+    par_line = '    Shape "{}"\n'.format(parent.full_id)
+    assert msg == 'The following duplicated Shape identifiers were found:\n' \
+        '{}\n  Relevant Top-Level Parents:\n{}{}{}'.format(
+            id_1, par_line, par_line, id_2)
+
+    errors = check_duplicate_identifiers_parent(shapes, False, 'Shape', True)
+    assert len(errors) == 2
+    assert errors[0]['element_name'] == ['Shape 5']
+    assert len(errors[0]['top_parents']) == 2
+    assert errors[0]['top_parents'][0]['id'] == parent.identifier
+    assert errors[0]['message'] == 'There is a duplicated Shape identifier: {}\n' \
+        '  Relevant Top-Level Parents:\n{}{}'.format(id_1, par_line, par_line)
+    assert 'top_parents' not in errors[1]
@@ -1,5 +1,8 @@
 # coding=utf-8
-from fairyfly.config import folders
+import sys
+import pytest
+
+from fairyfly.config import folders, Folders
 
 
 def test_config_init():
@@ -12,3 +15,27 @@ def test_config_init():
     assert isinstance(folders.python_package_path, str)
     assert hasattr(folders, 'python_exe_path')
     assert isinstance(folders.python_exe_path, str)
+
+
+def test_config_lazy():
+    """Test that the folders are loaded from the config file when first requested."""
+    from fairyfly.config import Folders
+    new_folders = Folders()
+    assert new_folders._default_simulation_folder is None
+    assert not new_folders._fairyfly_core_version_found
+    assert new_folders.default_simulation_folder == folders.default_simulation_folder
+    new_folders.default_simulation_folder = 'C:/my_sim_folder'
+    assert new_folders.default_simulation_folder == 'C:/my_sim_folder'
+    new_folders.config_file = None  # reload the folders from the config file
+    assert new_folders.default_simulation_folder == folders.default_simulation_folder
+    assert new_folders.fairyfly_core_version == folders.fairyfly_core_version
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='requires importlib.metadata')
+def test_package_version_fallback(tmpdir, monkeypatch):
+    """Test that the package folder is searched when there is no package metadata."""
+    tmpdir.mkdir('fairyfly_mock-1.2.3.dist-info')
+    monkeypatch.setattr(Folders, 'python_package_path', str(tmpdir))
+    new_folders = Folders()
+    assert new_folders._find_package_version('fairyfly_mock') == (1, 2, 3)
+    assert new_folders._find_package_version('fairyfly_missing') is None
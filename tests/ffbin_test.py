@@ -0,0 +1,108 @@
+"""Test the FFbin format and the memory-mapped ModelView."""
+import os
+import struct
+import pytest
+from array import array
+
+from ladybug_geometry.geometry3d import Point3D, Face3D
+
+from fairyfly.model import Model
+from fairyfly.shape import Shape
+from fairyfly.boundary import Boundary
+from fairyfly.ffbin import ModelView, is_ffbin, read_ffbin, read_header, read_array, \
+    INT32, SHAPE_FIELDS, LOOP_FIELDS
+
+
+def _sample_model_file(name):
+    """Write a sample model with a holed shape and a boundary to a FFbin file."""
+    model = Model.from_layers([15, 5, 100, 15], units='Millimeters')
+    model.display_name = 'Layered Construction'
+    bound_pts = (Point3D(0, 0, 0), Point3D(4, 0, 0), Point3D(4, 4, 0), Point3D(0, 4, 0))
+    hole_pts = (Point3D(1, 1, 0), Point3D(3, 1, 0), Point3D(3, 3, 0), Point3D(1, 3, 0))
+    holed_shape = Shape(Face3D(bound_pts, holes=[hole_pts]))
+    holed_shape.display_name = 'Frame'
+    model.add_shape(holed_shape)
+    line = (Point3D(-10, 0, 0), Point3D(2, -5, 3))
+    model.add_boundary(Boundary.from_vertices((line,)))
+    return model, model.to_ffbin(name, './tests/json')
+
+
+def test_model_view():
+    """Test the properties of ModelView."""
+    model, ffbin_file = _sample_model_file('view_test')
+    assert is_ffbin(ffbin_file)
+    with ModelView(ffbin_file) as view:
+        assert view.identifier == model.identifier
+        assert view.display_name == 'Layered Construction'
+        assert view.units == 'Millimeters'
+        assert view.tolerance == model.tolerance
+        assert view.shape_count == len(model.shapes)
+        assert view.boundary_count == len(model.boundaries)
+        assert len(view) == len(model.shapes) + len(model.boundaries)
+        assert view.shape_identifiers == [s.identifier for s in model.shapes]
+        assert view.boundary_identifiers == [b.identifier for b in model.boundaries]
+        assert view.min == tuple(model.min)
+        assert view.max == tuple(model.max)
+        assert view.shape_area == pytest.approx(model.shape_area, rel=1e-9)
+    os.remove(ffbin_file)
+
+
+def test_int32_tables():
+    """Test that the integer tables are written as little-endian int32."""
+    assert array(INT32).itemsize == 4
+    model, ffbin_file = _sample_model_file('int32_test')
+    with open(ffbin_file, 'rb') as f:
+        content = f.read()
+    header = read_header(content)
+    shape_count = header['shape_count'] * SHAPE_FIELDS
+    loop_count = header['loop_count'] * LOOP_FIELDS
+    st = header['shape_table']
+    shape_table = struct.unpack_from('<{}i'.format(shape_count), content, st)
+    assert list(read_array(content, header, 'shape_table', INT32)) == \
+        list(shape_table)
+    assert shape_table[SHAPE_FIELDS * 4 + 5] == 2  # the holed shape has two loops
+    assert header['loop_table'] - st < shape_count * 4 + 8  # 4 bytes per value
+    assert header['plane_array'] - header['loop_table'] < loop_count * 4 + 8
+    os.remove(ffbin_file)
+
+
+def test_model_view_shapes():
+    """Test the per-shape geometry of ModelView."""
+    model, ffbin_file = _sample_model_file('view_shape_test')
+    with ModelView(ffbin_file) as view:
+        for i, shape in enumerate(model.shapes):
+            geo = shape.geometry
+            loops = view.shape_loops(i)
+            assert len(loops) == (1 if not geo.has_holes else 1 + len(geo.holes))
+            assert len(loops[0]) == len(geo.boundary) * 3
+            assert tuple(loops[0][:3]) == tuple(geo.boundary[0])
+            assert view.shape_area_at(i) == pytest.approx(shape.area, rel=1e-9)
+            s_min, s_max = view.shape_bounds(i)
+            assert s_min == tuple(shape.min)
+            assert s_max == tuple(shape.max)
+            new_shape = view.shape(i)
+            assert new_shape.to_dict() == shape.to_dict()
+        assert view.shape_areas() == [view.shape_area_at(i) for i in range(5)]
+        assert view.shapes_in_bounding_box((0, 0, 0), (1, 1, 0)) == [0, 4]
+        assert view.shapes_in_bounding_box((200, 0, 0), (300, 1, 0)) == []
+        assert view.boundary(0).to_dict() == model.boundaries[0].to_dict()
+        assert len(view.boundary_segments(0)) == 6 * len(model.boundaries[0].geometry)
+        with pytest.raises(IndexError):
+            view.shape(5)
+    os.remove(ffbin_file)
+
+
+def test_read_ffbin_dicts_not_shared():
+    """Test that objects with identical properties do not share property dictionaries.
+    """
+    model, ffbin_file = _sample_model_file('shared_dict_test')
+    data, shapes, boundaries = read_ffbin(ffbin_file)
+    shape_props = [shp_dict['properties'] for shp_dict in data['shapes']]
+    assert shape_props[0] == shape_props[1]
+    prop_type = shape_props[0].pop('type')  # extensions may mutate the dictionaries
+    assert shape_props[1]['type'] == prop_type
+    with ModelView(ffbin_file) as view:
+        view.attributes['properties'].pop('type')
+        assert view.attributes['properties']['type'] == 'ModelProperties'
+        assert view.shape(0).to_dict() == model.shapes[0].to_dict()
+    os.remove(ffbin_file)
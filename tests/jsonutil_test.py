@@ -0,0 +1,148 @@
+# coding=utf-8
+"""Test the JSON utilities."""
+import io
+import json
+import math
+import pytest
+
+from fairyfly.config import folders
+from fairyfly.jsonutil import stream_json_object, dump_json_object, json_backend, \
+    json_dumps, json_loads, JSON_BACKENDS
+
+
+def test_stream_json_object():
+    """Test the stream_json_object function with several chunk sizes."""
+    data = {
+        'type': 'Model',
+        'identifier': 'test',
+        'shapes': [{'value': 1.123456789}, {'value': [1, 2, 3]}, {'value': 'a, b]'}],
+        'boundaries': [],
+        'tolerance': 1234567.5,
+        'user_data': {'nested': [{'key': None}, True, False]},
+        'units': None
+    }
+    for indent in (None, 2):
+        text = json.dumps(data, indent=indent)
+        for chunk_size in (1, 3, 7, 65536):
+            members = stream_json_object(
+                io.StringIO(text), ('shapes', 'boundaries', 'units'), chunk_size)
+            shapes, new_data = [], {}
+            for key, value in members:
+                if key == 'shapes':
+                    shapes.append(value)
+                else:
+                    new_data[key] = value
+            assert shapes == data['shapes']
+            assert 'boundaries' not in new_data
+            assert new_data['units'] is None
+            assert new_data['tolerance'] == data['tolerance']
+            assert new_data['user_data'] == data['user_data']
+
+
+def test_stream_json_object_invalid():
+    """Test that stream_json_object raises errors for invalid JSON."""
+    assert list(stream_json_object(io.StringIO(u'{}'))) == []
+    with pytest.raises(ValueError):
+        list(stream_json_object(io.StringIO(u'[1, 2]')))
+    with pytest.raises(ValueError):
+        list(stream_json_object(io.StringIO(u'{"shapes": [1, 2'), ('shapes',), 2))
+
+
+def test_json_backends():
+    """Test that all installed JSON backends write the same data as the json module."""
+    data = {
+        'type': 'Model',
+        'display_name': u'Caf\u00e9 Wall',
+        'numbers': [0.1, 1e16, 1e-07, 123456789.12345679, 2.0 / 3.0, -0.0, 7],
+        'shapes': [{'boundary': ((0.1, 0.2, 0.3), (1.5, 2.5, 3.5))}],
+        'user_data': {'nested': [None, True, False]}
+    }
+    std_data = json.loads(json.dumps(data))
+    original_backend = folders.json_backend
+    try:
+        for name in JSON_BACKENDS:
+            try:
+                folders.json_backend = name
+                assert json_backend() == name
+            except ImportError:  # backend is not installed
+                continue
+            for indent in (None, 2, 4):
+                json_str = json_dumps(data, indent)
+                assert json_loads(json_str) == std_data
+                assert json.loads(json_str) == std_data
+        folders.json_backend = None
+        assert json_backend() in JSON_BACKENDS
+        with pytest.raises(AssertionError):
+            folders.json_backend = 'simplejson'
+    finally:
+        folders.json_backend = original_backend
+
+
+def test_json_dumps_non_finite():
+    """Test that all installed JSON backends write NaN and Infinity like json."""
+    data = {'values': [float('nan'), float('inf'), -float('inf'), None, 1.5]}
+    std_str = json.dumps(data)
+    original_backend = folders.json_backend
+    try:
+        for name in JSON_BACKENDS:
+            try:
+                folders.json_backend = name
+                json_backend()
+            except ImportError:  # backend is not installed
+                continue
+            json_str = json_dumps(data)
+            assert json.loads(json_str)['values'][1:] == \
+                [float('inf'), -float('inf'), None, 1.5]
+            assert math.isnan(json.loads(json_str)['values'][0])
+            assert json_str.replace(' ', '') == std_str.replace(' ', '')
+            assert json_dumps({'value': None}).replace(' ', '') == '{"value":null}'
+    finally:
+        folders.json_backend = original_backend
+
+
+def test_json_backend_cached():
+    """Test that the JSON backend is only looked up again when the config changes."""
+    original_backend = folders.json_backend
+    try:
+        folders.json_backend = 'json'
+        assert json_backend() == 'json'
+        folders._json_backend = 'not_a_backend'  # bypass the setter
+        assert json_backend() == 'json'
+        folders.json_backend = None
+        assert json_backend() in JSON_BACKENDS
+    finally:
+        folders.json_backend = original_backend
+
+
+def test_dump_json_object():
+    """Test that dump_json_object writes the same JSON as json_dumps."""
+    shapes = [{'type': 'Shape', 'boundary': [[0.1, 0.2], [1.5, 2.5]]},
+              {'type': 'Shape', 'display_name': u'Caf\u00e9', 'data': {}}]
+    members = [
+        ('type', 'Model'), ('display_name', u'Caf\u00e9'),
+        ('properties', {'type': 'ModelProperties', 'therm': {'a': [1, 2]}}),
+        ('shapes', shapes), ('boundaries', []), ('tolerance', 0.01)
+    ]
+    data = dict(members)
+    original_backend = folders.json_backend
+    try:
+        for name in JSON_BACKENDS:
+            try:
+                folders.json_backend = name
+                json_backend()
+            except ImportError:  # backend is not installed
+                continue
+            for indent in (None, 2, 4):
+                stream_members = [(k, iter(v)) if isinstance(v, list) else (k, v)
+                                  for k, v in members]
+                out_file = io.BytesIO()
+                dump_json_object(stream_members, out_file, indent)
+                assert out_file.getvalue().decode('utf-8') == json_dumps(data, indent)
+                if name == 'json':
+                    assert out_file.getvalue().decode('utf-8') == \
+                        json.dumps(data, indent=indent)
+            out_file = io.BytesIO()
+            dump_json_object([], out_file)
+            assert out_file.getvalue() == b'{}'
+    finally:
+        folders.json_backend = original_backend
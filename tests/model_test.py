@@ -9,6 +9,7 @@ from ladybug_geometry.geometry3d import Point3D, Vector3D, LineSegment3D, Plane,
 from fairyfly.model import Model
 from fairyfly.shape import Shape
 from fairyfly.boundary import Boundary
+from fairyfly.config import folders
 
 
 def test_model_init():
@@ -97,10 +98,24 @@ def test_shapes_by_identifier():
     with pytest.raises(ValueError):
         model.shapes_by_identifier([str(uuid.uuid4())])
 
-    model.remove_shapes()
+    model.remove_shapes([str(shape1_id)])
+    assert model.shapes_by_identifier([shape2_id])[0] is shape2
+    with pytest.raises(ValueError):
+        model.shapes_by_identifier([shape1_id])
+
+    new_id = str(uuid.uuid4())
+    shape2.identifier = new_id
+    assert model.shapes_by_identifier([new_id])[0] is shape2
     with pytest.raises(ValueError):
         model.shapes_by_identifier([shape2_id])
 
+    model.add_model(Model(shapes=[shape1]))
+    assert model.shapes_by_identifier([shape1_id, new_id]) == [shape1, shape2]
+
+    model.remove_shapes()
+    with pytest.raises(ValueError):
+        model.shapes_by_identifier([new_id])
+
 
 def test_boundaries_by_identifier():
     """Test the boundaries_by_identifier method."""
@@ -123,6 +138,80 @@ def test_boundaries_by_identifier():
         model.boundaries_by_identifier([bnd2_id])
 
 
+def test_min_max():
+    """Test that the cached Model min and max stay up to date."""
+    pts1 = (Point3D(0, 0, 0), Point3D(0, 0, 3), Point3D(1, 0, 3), Point3D(1, 0, 0))
+    pts2 = (Point3D(1, 0, 0), Point3D(1, 0, 3), Point3D(2, 0, 3), Point3D(2, 0, 0))
+    shape1, shape2 = Shape(Face3D(pts1)), Shape(Face3D(pts2))
+    model = Model(shapes=[shape1])
+    assert model.min == Point3D(0, 0, 0)
+    assert model.max == Point3D(1, 0, 3)
+
+    model.add_shape(shape2)
+    assert model.max == Point3D(2, 0, 3)
+    boundary = Boundary.from_vertices(((Point3D(-1, -1, 0), Point3D(0, 0, 5)),))
+    model.add_boundary(boundary)
+    assert model.min == Point3D(-1, -1, 0)
+    assert model.max == Point3D(2, 0, 5)
+
+    model.remove_boundaries()
+    assert model.min == Point3D(0, 0, 0)
+    assert model.max == Point3D(2, 0, 3)
+
+    shape2.move(Vector3D(0, 0, 1))  # transform a shape outside of the model
+    assert model.max == Point3D(2, 0, 4)
+    model.move(Vector3D(1, 1, 1))
+    assert model.min == Point3D(1, 1, 1)
+    assert model.max == Point3D(3, 1, 5)
+    assert model.center == Point3D(2, 1, 3)
+
+    model.remove_shapes([shape2.identifier])
+    assert model.max == Point3D(2, 1, 4)
+
+
+def test_min_max_other_model():
+    """Test that a Model's cached bounding box survives edits to another Model."""
+    pts = (Point3D(0, 0, 0), Point3D(0, 0, 3), Point3D(1, 0, 3), Point3D(1, 0, 0))
+    model_1, model_2 = Model([Shape(Face3D(pts))]), Model([Shape(Face3D(pts))])
+    bbox = model_1._model_bounding_box()
+    model_2.move(Vector3D(1, 0, 0))
+    assert model_1._model_bounding_box() is bbox
+    assert model_2.max == Point3D(2, 0, 3)
+
+    new_model = model_1.duplicate()
+    assert new_model._model_bounding_box()[1:] == bbox[1:]
+    new_model.shapes[0].move(Vector3D(0, 1, 0))
+    assert new_model.max == Point3D(1, 1, 3)
+    assert model_1._model_bounding_box() is bbox
+
+
+def test_min_max_cache_invalidation():
+    """Test that objects invalidate the cached bounding box of the Models with them."""
+    pts = (Point3D(0, 0, 0), Point3D(0, 0, 3), Point3D(1, 0, 3), Point3D(1, 0, 0))
+    shape_1, shape_2 = Shape(Face3D(pts)), Shape(Face3D(pts))
+    bound = Boundary([LineSegment3D.from_end_points(Point3D(0, 0, 0), Point3D(1, 0, 0))])
+    model_1, model_2 = Model([shape_1, shape_2], [bound]), Model([shape_1])
+    bbox_1, bbox_2 = model_1._model_bounding_box(), model_2._model_bounding_box()
+    assert model_1._model_bounding_box() is bbox_1
+
+    shape_1.move(Vector3D(0, 0, 1))  # shared by both models
+    assert model_1.max == Point3D(1, 0, 4)
+    assert model_2.max == Point3D(1, 0, 4)
+    bbox_2 = model_2._model_bounding_box()
+    bound.move(Vector3D(0, 0, -1))
+    assert model_1.min == Point3D(0, 0, -1)
+    assert model_2._model_bounding_box() is bbox_2
+
+    model_1.remove_shapes([shape_2.identifier])
+    bbox_1 = model_1._model_bounding_box()
+    shape_2.move(Vector3D(5, 0, 0))  # no longer in the model
+    assert model_1._model_bounding_box() is bbox_1
+    assert shape_2._model_counters == []
+    model_1.shapes = [shape_2]
+    assert shape_1._model_counters == [model_2._geo_counter]
+    assert model_1.max == Point3D(6, 0, 3)
+
+
 def test_move():
     """Test the Model move method."""
     pts_1 = (Point3D(0, 0, 0), Point3D(2, 0, 0), Point3D(2, 2, 0), Point3D(0, 2, 0))
@@ -282,6 +371,11 @@ def test_check_planar():
     with pytest.raises(ValueError):
         model_2.check_planar(0.01, True)
 
+    model_3 = Model([shape_1], [boundary_1, boundary_2, boundary_1.duplicate()])
+    detailed = model_3.check_planar(0.01, False, True)
+    assert len(detailed) == 1
+    assert detailed[0]['element_id'] == [boundary_2.identifier]
+
 
 def test_check_self_intersecting():
     """Test the check_self_intersecting method."""
@@ -299,6 +393,30 @@ def test_check_self_intersecting():
         model_2.check_self_intersecting(0.01, True)
 
 
+def test_check_all_workers():
+    """Test that checks distributed across processes match serial checks."""
+    plane = Plane(Vector3D(0, 0, 1))
+    pts_1 = (Point3D(0, 0), Point3D(2, 0), Point3D(2, 2), Point3D(0, 2))
+    pts_2 = (Point3D(0, 0), Point3D(0, 2), Point3D(2, 0), Point3D(2, 2))
+    pts_3 = (Point3D(0, 0, 0), Point3D(2, 0, 2), Point3D(2, 2, 2), Point3D(0, 2, 2))
+    shapes = []
+    for i in range(12):
+        pts = pts_2 if i % 5 == 1 else pts_3 if i % 4 == 2 else pts_1
+        shapes.append(Shape(Face3D(pts, plane)))
+    model = Model(shapes)
+
+    assert model.check_planar(0.01, False, workers=2) == \
+        model.check_planar(0.01, False)
+    assert model.check_self_intersecting(0.01, False, True, workers=2) == \
+        model.check_self_intersecting(0.01, False, True)
+    serial_msg = model.check_all(False)
+    assert serial_msg != ''
+    assert model.check_all(False, workers=2) == serial_msg
+    assert model.check_all(False, True, workers=2) == model.check_all(False, True)
+    with pytest.raises(ValueError):
+        model.check_all(True, workers=2)
+
+
 def test_check_reasonable_tolerance():
     """Check the check_reasonable_tolerance method."""
     assert isinstance(Model.check_reasonable_tolerance('Millimeters', 10), str)
@@ -352,6 +470,44 @@ def test_to_from_dict_methods():
     assert isinstance(new_model.boundaries[0], Boundary)
 
 
+def test_from_dict_geometry():
+    """Test that Model.from_dict loads the same geometry as Shape.from_dict."""
+    ccw = [Point3D(0, 0, 0), Point3D(2, 0, 0), Point3D(2, 1, 0), Point3D(0, 1, 0)]
+    tilted = [Point3D(0, 0, 0), Point3D(2, 0, 1), Point3D(2, 1, 1), Point3D(0, 1, 0)]
+    hole = [Point3D(0.5, 0.25, 0), Point3D(1, 0.25, 0), Point3D(1, 0.75, 0)]
+    shape_dicts = []
+    for verts in (ccw, tilted):
+        shape_dicts.append(Shape(Face3D(verts)).to_dict())
+        shape_dicts.append(Shape(Face3D(verts)).to_dict(include_plane=False))
+        cw_dict = Shape(Face3D(verts)).to_dict()  # clockwise relative to the plane
+        cw_dict['geometry']['boundary'].reverse()
+        shape_dicts.append(cw_dict)
+    hole_dict = Shape(Face3D(ccw, holes=[hole])).to_dict()
+    hole_dict['geometry']['boundary'].reverse()
+    shape_dicts.append(hole_dict)
+    model_dict = Model(shapes=[]).to_dict()
+    model_dict['shapes'] = shape_dicts
+
+    model = Model.from_dict(model_dict)
+    for shape, shape_dict in zip(model.shapes, shape_dicts):
+        base_shape = Shape.from_dict(shape_dict)
+        assert shape.to_dict() == base_shape.to_dict()
+        assert shape.geometry.vertices == base_shape.geometry.vertices
+        assert shape.geometry.plane == base_shape.geometry.plane
+        assert not shape.geometry.is_clockwise
+
+    invalid_dict = Shape(Face3D(ccw)).to_dict()
+    invalid_dict['geometry']['boundary'] = [[0, 0, 0], [1, 0]]
+    model_dict['shapes'] = [shape_dicts[0], invalid_dict]
+    with pytest.raises(ValueError) as model_error:
+        Model.from_dict(model_dict)
+    with pytest.raises(ValueError) as shape_error:
+        Shape.from_dict(invalid_dict)
+    assert str(model_error.value).endswith(str(shape_error.value))
+    assert 'Shape "{}" is invalid'.format(invalid_dict['identifier']) in \
+        str(model_error.value)
+
+
 def test_to_ffjson():
     """Test the Model to_ffjson method."""
     model = Model.from_layers([15, 5, 100, 15])
@@ -374,8 +530,58 @@ def test_to_ffjson():
 
     new_model = Model.from_ffjson(model_ffjson)
     assert isinstance(new_model, Model)
+    assert new_model.to_dict() == model.to_dict()
     os.remove(model_ffjson)
 
+    model_ffjson = model.to_ffjson("test", path, indent=4)
+    new_model = Model.from_ffjson(model_ffjson)
+    assert new_model.to_dict() == model.to_dict()
+    new_model = Model.from_file(model_ffjson)
+    assert new_model.to_dict() == model.to_dict()
+    os.remove(model_ffjson)
+
+    original_backend = folders.json_backend
+    try:  # the streamed file should be identical to one written by json.dump
+        folders.json_backend = 'json'
+        for indent in (None, 4):
+            model_ffjson = model.to_ffjson("test", path, indent=indent)
+            with open(model_ffjson) as f:
+                assert f.read() == json.dumps(model.to_dict(), indent=indent)
+            os.remove(model_ffjson)
+    finally:
+        folders.json_backend = original_backend
+
+
+class _UnserializableShape(Shape):
+    """A Shape subclass that fails to be converted to a dictionary."""
+    __slots__ = ()
+
+    def to_dict(self, *args, **kwargs):
+        raise ValueError('Shape cannot be serialized.')
+
+
+def test_to_ffjson_error():
+    """Test that to_ffjson does not leave a partial file when to_dict raises."""
+    model = Model.from_layers([15, 5, 100, 15])
+    path = './tests/json'
+    model_ffjson = model.to_ffjson('test_error', path)
+    with open(model_ffjson) as f:
+        original_content = f.read()
+
+    model.add_shape(_UnserializableShape(model.shapes[0].geometry))
+    with pytest.raises(ValueError):
+        model.to_ffjson('test_error', path)
+    with open(model_ffjson) as f:  # the previous file is intact
+        assert f.read() == original_content
+    assert os.listdir(path).count('test_error.ffjson') == 1
+    assert not any(f.endswith('.tmp') for f in os.listdir(path))
+    os.remove(model_ffjson)
+
+    with pytest.raises(ValueError):
+        model.to_ffjson('test_error', path)
+    assert not os.path.isfile(model_ffjson)
+    assert not any(f.endswith('.tmp') for f in os.listdir(path))
+
 
 def test_to_ffpkl():
     """Test the Model to_ffpkl method."""
@@ -390,6 +596,39 @@ def test_to_ffpkl():
     os.remove(model_ffpkl)
 
 
+def test_to_ffbin():
+    """Test the Model to_ffbin method."""
+    model = Model.from_layers([15, 5, 100, 15])
+    model.display_name = 'Layered Construction'
+    model.user_data = {'site': 'north wall'}
+    bound_pts = (Point3D(0, 0, 0), Point3D(4, 0, 0), Point3D(4, 4, 0), Point3D(0, 4, 0))
+    hole_pts = (Point3D(1, 1, 0), Point3D(3, 1, 0), Point3D(3, 3, 0), Point3D(1, 3, 0))
+    holed_shape = Shape(Face3D(bound_pts, holes=[hole_pts]))
+    holed_shape.display_name = 'Frame \u00e9'
+    holed_shape.user_data = {'layer': 1}
+    model.add_shape(holed_shape)
+    line_1 = (Point3D(0, 0, 0), Point3D(2, 0.1, 0))
+    line_2 = (Point3D(2, 0.1, 0), Point3D(0.3, 2, 0))
+    model.add_boundary(Boundary.from_vertices((line_1, line_2)))
+
+    path = './tests/json'
+    model_ffbin = model.to_ffbin('test', path)
+    assert os.path.isfile(model_ffbin)
+    assert model_ffbin.endswith('.ffbin')
+    new_model = Model.from_ffbin(model_ffbin)
+    assert new_model.to_dict() == model.to_dict()
+    assert new_model.shapes[-1].geometry.holes == holed_shape.geometry.holes
+    new_model = Model.from_file(model_ffbin)
+    assert new_model.to_dict() == model.to_dict()
+    os.remove(model_ffbin)
+
+    empty_model = Model()
+    model_ffbin = empty_model.to_ffbin('empty', path)
+    new_model = Model.from_file(model_ffbin)
+    assert new_model.to_dict() == empty_model.to_dict()
+    os.remove(model_ffbin)
+
+
 def test_writer():
     """Test the Model writer object."""
     model = Model.from_layers([15, 5, 100, 15])
@@ -398,3 +637,118 @@ def test_writer():
     writers = [mod for mod in dir(model.to) if not mod.startswith('_')]
     for writer in writers:
         assert callable(getattr(model.to, writer))
+
+
+def test_duplicate_shape_geometry():
+    """Test the duplicate_shape_geometry property."""
+    model = Model.from_layers([15, 5, 100, 15])
+    assert model.duplicate_shape_geometry == []
+
+    dup_shapes = [model.shapes[1].duplicate(), model.shapes[3].duplicate()]
+    dup_shapes[1].move(Vector3D(0.005, 0, 0))
+    for shape in dup_shapes:
+        shape.identifier = str(uuid.uuid4())
+    model.add_shapes(dup_shapes)
+    model.add_shape(model.shapes[1].duplicate())
+    expected = []
+    for i, shape_1 in enumerate(model.shapes):
+        for shape_2 in model.shapes[i + 1:]:
+            if shape_1.geometry.is_centered_adjacent(shape_2.geometry, model.tolerance):
+                expected.append(shape_2.geometry)
+    duplicates = model.duplicate_shape_geometry
+    assert len(duplicates) == 3
+    assert all(dup is exp for dup, exp in zip(duplicates, expected))
+
+
+def test_duplicate_boundary_geometry():
+    """Test the duplicate_boundary_geometry property."""
+    model = Model.from_layers([15, 5, 100, 15])
+    assert model.duplicate_boundary_geometry == []
+
+    pts = [Point3D(0, 0, 0), Point3D(0, 200, 0), Point3D(15, 200, 0),
+           Point3D(15, 0, 0), Point3D(0, 0, 0)]
+    boundary = Boundary.from_vertices([pts])
+    model.add_boundaries([boundary, boundary.duplicate()])
+    half_line = LineSegment3D.from_end_points(Point3D(0, 50, 0), Point3D(0, 100, 0.005))
+    model.add_boundary(Boundary((half_line,)))
+    lines = [line for bound in model.boundaries for line in bound.geometry]
+    expected = []
+    for i, line_1 in enumerate(lines):
+        for line_2 in lines[i + 1:]:
+            if line_1.distance_to_point(line_2.p1) <= model.tolerance and \
+                    line_1.distance_to_point(line_2.p2) <= model.tolerance:
+                expected.append(line_2)
+    duplicates = model.duplicate_boundary_geometry
+    assert len(duplicates) == len(expected) == 9
+    assert all(dup is exp for dup, exp in zip(duplicates, expected))
+
+
+def test_insert_vertices():
+    """Test that insert_vertices matches the result of Shape.insert_vertex."""
+    model = Model.from_layers([15, 5, 100, 15])
+    points = [Point3D(15, 50, 0), Point3D(15, 20, 0), Point3D(15.005, 120, 0),
+              Point3D(70, 0, 0), Point3D(500, 0, 0), Point3D(60, 100, 0)]
+    expected = model.duplicate()
+    for pt in points:
+        for shape in expected.shapes:
+            shape.insert_vertex(pt, model.tolerance)
+    model.insert_vertices(points)
+    for shape, exp_shape in zip(model.shapes, expected.shapes):
+        assert shape.vertices == exp_shape.vertices
+    assert len(model.shapes[0].vertices) == 7
+    assert len(model.shapes[1].vertices) == 7
+    assert len(model.shapes[2].vertices) == 5
+
+    bound_pts = (Point3D(0, 0, 0), Point3D(4, 0, 0), Point3D(4, 4, 0), Point3D(0, 4, 0))
+    hole_pts = (Point3D(1, 1, 0), Point3D(3, 1, 0), Point3D(3, 3, 0), Point3D(1, 3, 0))
+    model = Model([Shape(Face3D(bound_pts, holes=[hole_pts]))])
+    model.insert_vertices([Point3D(2, 1, 0), Point3D(2, 0, 0)])
+    geo = model.shapes[0].geometry
+    assert geo.boundary[1] == Point3D(2, 0, 0)
+    assert len(geo.holes[0]) == 5
+
+
+def test_pack_geometry():
+    """Test the pack_geometry method."""
+    model = Model.from_layers([15, 5, 100, 15])
+    bound_pts = (Point3D(0, 0, 0), Point3D(4, 0, 0), Point3D(4, 4, 0), Point3D(0, 4, 0))
+    hole_pts = (Point3D(1, 1, 0), Point3D(3, 1, 0), Point3D(3, 3, 0), Point3D(1, 3, 0))
+    model.add_shape(Shape(Face3D(bound_pts, holes=[hole_pts])))
+    model.rotate(Vector3D(1, 1, 1), 30, Point3D(1, 2, 3))
+    model_dict = model.to_dict()
+    model_min, model_max = model.min, model.max
+
+    model.pack_geometry()
+    coords = model.shapes[0]._geo[0]
+    assert all(shape._geo[0] is coords for shape in model.shapes)
+    assert len(coords) == 4 * 9 + 4 * 4 * 3 + 9 + 8 * 3
+    assert model.to_dict() == model_dict
+    assert model.min == model_min
+    assert model.max == model_max
+    assert model.shapes[4].geometry.has_holes
+
+    new_model = model.duplicate()
+    assert new_model.shapes[0]._geo[0] is coords
+    model.move(Vector3D(1, 0, 0))
+    assert isinstance(model.shapes[0]._geo, Face3D)
+    assert new_model.to_dict() == model_dict
+
+
+def test_duplicate_shares_geometry():
+    """Test that Model duplicates share geometry but not Shapes and Boundaries."""
+    model = Model.from_layers([15, 5, 100, 15])
+    line = (Point3D(-10, 0, 0), Point3D(2, -5, 3))
+    model.add_boundary(Boundary.from_vertices((line,)))
+    model.shapes[0].user_data = {'layer': 0}
+    new_model = model.duplicate()
+    for shape, new_shape in zip(model.shapes, new_model.shapes):
+        assert new_shape is not shape
+        assert new_shape.geometry is shape.geometry
+    assert new_model.boundaries[0].geometry is model.boundaries[0].geometry
+
+    new_model.shapes[0].user_data['layer'] = 1
+    new_model.shapes[1].display_name = 'Changed'
+    new_model.shapes[2].move(Vector3D(1, 0, 0))
+    assert model.shapes[0].user_data == {'layer': 0}
+    assert model.shapes[1].display_name != 'Changed'
+    assert model.shapes[2].geometry is not new_model.shapes[2].geometry
@@ -0,0 +1,33 @@
+"""Test the utilities to distribute work across processes."""
+from fairyfly.parallel import worker_count, chunk_list, map_chunks
+
+
+def _squares(numbers, offset):
+    """Get the squares of a list of numbers plus an offset."""
+    return [n ** 2 + offset for n in numbers]
+
+
+def test_worker_count():
+    """Test the worker_count function."""
+    assert worker_count(None) == 1
+    assert worker_count(1) == 1
+    assert worker_count(3) == 3
+    assert worker_count(0) >= 1
+
+
+def test_chunk_list():
+    """Test the chunk_list function."""
+    items = list(range(10))
+    chunks = chunk_list(items, 3)
+    assert chunks == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert chunk_list(items, 20) == [[i] for i in items]
+    assert chunk_list([], 4) == []
+
+
+def test_map_chunks():
+    """Test the map_chunks function."""
+    items = list(range(25))
+    expected = [n ** 2 + 1 for n in items]
+    assert map_chunks(_squares, items, 1, (1,)) == expected
+    assert map_chunks(_squares, items, 2, (1,)) == expected
+    assert map_chunks(_squares, [], 2, (1,)) == []
@@ -0,0 +1,202 @@
+"""Test the extension properties of fairyfly objects."""
+import os
+import sys
+import subprocess
+import pkgutil
+
+from ladybug_geometry.geometry3d import Point3D, Vector3D, Face3D
+
+import fairyfly
+from fairyfly.shape import Shape
+from fairyfly.model import Model
+from fairyfly.properties import ShapeProperties
+
+
+class _MockShapeExtension(object):
+    """A mock extension for shape properties that tracks how it has been moved."""
+
+    def __init__(self, host):
+        self.host = host
+        self.moves = []
+
+    def move(self, moving_vec):
+        self.moves.append(moving_vec)
+
+    def duplicate(self, new_host=None):
+        new_ext = _MockShapeExtension(new_host)
+        new_ext.moves = list(self.moves)
+        return new_ext
+
+    def to_dict(self, abridged=False):
+        return {'mock': {'type': 'MockShapeProperties', 'moves': len(self.moves)}}
+
+
+def _mock_property(self):
+    """Get the mock extension properties, creating them if they do not exist."""
+    if getattr(self, '_mock', None) is None:
+        self._mock = _MockShapeExtension(self.host)
+    return self._mock
+
+
+def _sample_shape():
+    pts = (Point3D(0, 0, 0), Point3D(1, 0, 0), Point3D(1, 1, 0), Point3D(0, 1, 0))
+    return Shape(Face3D(pts))
+
+
+def test_extension_attributes():
+    """Test that extension attributes are recomputed when an extension is added."""
+    shape = _sample_shape()
+    assert shape.properties._extension_attributes == ()
+    assert shape.properties.to_dict() == {'type': 'ShapeProperties'}
+
+    ShapeProperties.mock = property(_mock_property)
+    try:
+        assert shape.properties._extension_attributes == ('mock',)
+        shape.move(Vector3D(1, 0, 0))
+        assert len(shape.properties.mock.moves) == 1
+        assert shape.properties.to_dict()['mock']['moves'] == 1
+    finally:
+        del ShapeProperties.mock
+    assert shape.properties._extension_attributes == ()
+
+
+def test_hook_attributes():
+    """Test the table of extension attributes implementing each transform hook."""
+    shapes = [_sample_shape(), _sample_shape()]
+    model = Model(shapes)
+    assert shapes[0].properties._hook_attributes('move') == ()
+    model.move(Vector3D(1, 0, 0))
+
+    ShapeProperties.mock = property(_mock_property)
+    try:
+        assert shapes[0].properties._hook_attributes('move') == ('mock',)
+        assert shapes[0].properties._hook_attributes('rotate') == ()
+        model.move(Vector3D(1, 0, 0))
+        model.rotate_xy(90, Point3D())
+        for shape in shapes:
+            assert len(shape.properties.mock.moves) == 1
+    finally:
+        del ShapeProperties.mock
+    assert shapes[0].properties._hook_attributes('move') == ()
+
+
+class _HookedShapeProperties(ShapeProperties):
+    """Shape properties with an extension attribute that implements the move hook."""
+    mock = property(_mock_property)
+
+
+class _HookedShape(Shape):
+    """A Shape subclass that uses the _HookedShapeProperties."""
+    __slots__ = ()
+
+    def __init__(self, geometry, identifier=None):
+        Shape.__init__(self, geometry, identifier)
+        self._properties = _HookedShapeProperties(self)
+
+
+def test_hook_attributes_mixed_classes():
+    """Test that transform hooks are found for each class in a list of objects."""
+    hooked_shape = _HookedShape(_sample_shape().geometry)
+    model = Model([_sample_shape(), hooked_shape])
+    model.move(Vector3D(1, 0, 0))
+    assert len(hooked_shape.properties.mock.moves) == 1
+    assert model.shapes[0].properties._hook_attributes('move') == ()
+
+
+def test_duplicate_extension_attributes():
+    """Test that only extension attributes that have been created are duplicated."""
+    model = Model([_sample_shape()])
+    ShapeProperties._mock = None
+    ShapeProperties.mock = property(_mock_property)
+    try:
+        new_model = model.duplicate()
+        new_shape = new_model.shapes[0]
+        assert new_shape.properties._mock is None
+        assert new_shape.properties.mock.host is new_shape
+        assert model.shapes[0].properties._mock is None
+
+        model.shapes[0].properties.mock.moves.append(Vector3D(1, 0, 0))
+        new_model = model.duplicate()
+        new_ext = new_model.shapes[0].properties._mock
+        assert new_ext is not None
+        assert new_ext.host is new_model.shapes[0]
+        assert len(new_ext.moves) == 1
+        assert new_model.min == model.min
+        assert new_model.shapes_by_identifier([new_shape.identifier]) == \
+            [new_model.shapes[0]]
+    finally:
+        del ShapeProperties.mock
+        del ShapeProperties._mock
+
+
+_EXTENSION_INIT = """
+from fairyfly.properties import ShapeProperties
+import fairyfly.writer.model as model_writer
+
+
+def _mock_property(self):
+    return 'mock properties'
+
+
+def model_to_mock(model):
+    return 'mock model {}'.format(len(model.shapes))
+
+
+ShapeProperties.mock = property(_mock_property)
+model_writer.mock = model_to_mock
+"""
+
+_EXTENSION_CHECK = """
+import sys
+import fairyfly
+from ladybug_geometry.geometry3d import Point3D, Face3D
+from fairyfly.shape import Shape
+assert 'fairyfly_mock' not in sys.modules
+shape = Shape(Face3D((Point3D(0, 0, 0), Point3D(1, 0, 0), Point3D(1, 1, 0))))
+assert shape.properties.mock == 'mock properties'
+assert 'fairyfly_mock' in fairyfly.extensions
+"""
+
+
+_WRITER_CHECK = """
+import sys
+from fairyfly.model import Model
+assert 'fairyfly_mock' not in sys.modules
+assert Model().to.mock(Model()) == 'mock model 0'
+model = Model.from_layers([15, 5, 100])
+assert model.to.mock(model) == 'mock model 3'
+assert not hasattr(model.to, 'not_a_writer')
+"""
+
+
+def test_lazy_extensions(tmpdir):
+    """Test that extensions are imported the first time that they are needed."""
+    ext_folder = tmpdir.mkdir('fairyfly_mock')
+    ext_folder.join('__init__.py').write(_EXTENSION_INIT)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [str(tmpdir), os.getcwd(), env.get('PYTHONPATH', '')])
+    subprocess.check_call([sys.executable, '-c', _EXTENSION_CHECK], env=env)
+    subprocess.check_call([sys.executable, '-c', _WRITER_CHECK], env=env)
+
+
+def test_extension_manifest(tmpdir, monkeypatch):
+    """Test that the names of extensions are cached until sys.path changes."""
+    monkeypatch.setattr(fairyfly, '_get_log_folder', lambda: str(tmpdir))
+    path_folder = tmpdir.mkdir('site')
+    monkeypatch.syspath_prepend(str(path_folder))
+    names = fairyfly._extension_names()
+    assert os.path.isfile(str(tmpdir.join('extensions.json')))
+    assert 'fairyfly_mock' not in names
+
+    def _no_scan(*args, **kwargs):
+        raise AssertionError('sys.path should not be scanned.')
+    original_iter_modules = pkgutil.iter_modules
+    monkeypatch.setattr(pkgutil, 'iter_modules', _no_scan)
+    assert fairyfly._extension_names() == names
+
+    # installing an extension changes the folder and the names are scanned again
+    monkeypatch.setattr(pkgutil, 'iter_modules', original_iter_modules)
+    path_folder.mkdir('fairyfly_mock').join('__init__.py').write('')
+    os.utime(str(path_folder), (0, 0))
+    assert fairyfly._extension_names() == ['fairyfly_mock'] + names
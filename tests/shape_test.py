@@ -2,7 +2,7 @@
 import pytest
 import uuid
 from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D
-from fairyfly.shape import Shape
+from fairyfly.shape import Shape, _plane_from_values
 
 
 def test_shape_init():
@@ -49,12 +49,18 @@ def test_shape_duplicate():
     pts = (Point3D(0, 0, 0), Point3D(0, 0, 3), Point3D(1, 0, 3), Point3D(1, 0, 0))
     shp_1 = Shape(Face3D(pts))
     shp_1.display_name = 'TestShape'
+    shp_1.user_data = {'layer': 'frame'}
     shp_2 = shp_1.duplicate()
 
     assert shp_1 is not shp_2
     for i, pt in enumerate(shp_1.vertices):
         assert pt == shp_2.vertices[i]
     assert shp_1.identifier == shp_2.identifier
+    assert shp_2.display_name == 'TestShape'
+    assert shp_2.user_data == shp_1.user_data
+    assert shp_2.user_data is not shp_1.user_data
+    assert shp_2.properties.host is shp_2
+    assert not shp_2.has_parent
 
     shp_2.move(Vector3D(0, 1, 0))
     for i, pt in enumerate(shp_1.vertices):
@@ -228,6 +234,51 @@ def test_insert_vertex():
     assert len(shape.geometry.vertices) == 5
 
 
+def test_insert_vertex_hole():
+    """Test the insert_vertex method with a point on the hole of a shape."""
+    bound = (Point3D(0, 0), Point3D(4, 0), Point3D(4, 4), Point3D(0, 4))
+    hole = (Point3D(1, 1), Point3D(1, 3), Point3D(3, 3), Point3D(3, 1))
+    shape = Shape(Face3D(bound, holes=[hole]))
+    shape.insert_vertex(Point3D(1, 2))
+    assert len(shape.geometry.boundary) == 4
+    assert len(shape.geometry.holes[0]) == 5
+    assert Point3D(1, 2) in shape.geometry.holes[0]
+
+
+def test_plane_from_values():
+    """Test that _plane_from_values builds the same Plane as the Plane constructor."""
+    base_plane = Plane(Vector3D(1, 2, 3), Point3D(4, 5, 6), Vector3D(2, -1, 0))
+    plane = _plane_from_values(base_plane.n, base_plane.o, base_plane.x)
+    for slot in Plane.__slots__:  # all slots of the Plane must be set
+        assert getattr(plane, slot) == getattr(base_plane, slot)
+    assert plane.n == base_plane.n
+    assert plane.o == base_plane.o
+    assert plane.x == base_plane.x
+    assert plane.y == base_plane.y
+    assert plane.k == base_plane.k
+    assert plane.altitude == base_plane.altitude
+    assert plane.azimuth == base_plane.azimuth
+    assert plane.to_dict() == base_plane.to_dict()
+
+
+def test_point_overlaps_bound():
+    """Test that the cached bounding box of _point_overlaps_bound follows the geometry.
+    """
+    pts = (Point3D(0, 0), Point3D(2, 0), Point3D(2, 2), Point3D(0, 2))
+    shape = Shape(Face3D(pts))
+    assert shape._point_overlaps_bound(Point3D(2.005, 1), 0.01)
+    assert not shape._point_overlaps_bound(Point3D(3, 1), 0.01)
+    assert shape._bounds == (1, 1, 0, 1, 1, 0)
+
+    new_shape = shape.duplicate()
+    shape.move(Vector3D(1, 0, 0))
+    assert shape._bounds is None
+    assert shape._point_overlaps_bound(Point3D(3, 1), 0.01)
+    assert not new_shape._point_overlaps_bound(Point3D(3, 1), 0.01)
+    shape.insert_vertex(Point3D(3, 1))
+    assert shape._bounds is None
+
+
 def test_check_planar():
     """Test the check_planar method."""
     pts_1 = (Point3D(0, 0, 2), Point3D(2, 0, 2), Point3D(2, 2, 2), Point3D(0, 2, 2))
@@ -0,0 +1,129 @@
+# coding=utf-8
+"""Test the spatial indices."""
+import random
+
+from ladybug_geometry.geometry2d import Point2D, Polygon2D
+from ladybug_geometry.geometry3d import Point3D
+
+from fairyfly.spatial import PointGrid, equivalent_point_pairs, unique_points, \
+    BoundingBoxGrid, snap_polygons, intersect_polygon_segments
+
+
+def test_point_grid():
+    """Test the PointGrid class."""
+    grid = PointGrid(0.01)
+    grid.add(Point3D(0, 0, 0), 0)
+    grid.add(Point3D(0.015, 0, 0), 1)
+    grid.add(Point3D(1, 1, 1), 2)
+    str(grid)  # test the string representation
+
+    assert len(grid) == 3
+    assert grid.tolerance == 0.01
+    assert sorted(grid.neighbors(Point3D(0.005, 0, -0.005))) == [0, 1]
+    assert grid.neighbors(Point3D(1, 1, 1.005)) == [2]
+    assert grid.neighbors(Point3D(-1, 0, 0)) == []
+
+    grid = PointGrid(0)
+    grid.add(Point3D(0, 0, 0), 0)
+    assert grid.neighbors(Point3D(0, 0, 0)) == [0]
+    assert grid.neighbors(Point3D(0, 0, 0.0001)) == []
+
+
+def test_equivalent_point_pairs():
+    """Test that equivalent_point_pairs matches a check of every pair of points."""
+    rand = random.Random(0)
+    points = [Point3D(rand.randint(0, 20) / 100, rand.randint(0, 20) / 100, 0)
+              for _ in range(200)]
+    for tol in (0, 0.01, 0.05):
+        expected = [
+            (i, j) for i, pt_1 in enumerate(points) for j, pt_2 in enumerate(points)
+            if i < j and pt_1.is_equivalent(pt_2, tol)
+        ]
+        assert equivalent_point_pairs(points, tol) == expected
+
+
+def test_unique_points():
+    """Test that unique_points matches a check against every unique point."""
+    rand = random.Random(0)
+    points = [Point3D(rand.randint(0, 20) / 100, rand.randint(0, 20) / 100, 0)
+              for _ in range(200)]
+    for tol in (0, 0.01, 0.05):
+        expected = []
+        for pt in points:
+            if not any(pt.is_equivalent(o_pt, tol) for o_pt in expected):
+                expected.append(pt)
+        assert unique_points(points, tol) == expected
+
+
+def test_bounding_box_grid():
+    """Test the BoundingBoxGrid class."""
+    min_pts = [(0, 0), (1, 1), (10, 10), (-100, -100)]
+    max_pts = [(1, 1), (2, 2), (11, 11), (100, 100)]
+    grid = BoundingBoxGrid.from_boxes(min_pts, max_pts, 0.01)
+    str(grid)  # test the string representation
+
+    assert len(grid) == 4
+    assert grid.tolerance == 0.01
+    assert grid.query((0.5, 0.5), (0.5, 0.5)) == {0, 3}
+    assert grid.query((2.005, 2.005), (3, 3)) == {1, 3}
+    assert grid.query((2.02, 2.02), (3, 3)) == {3}
+    assert grid.query((-1000, -1000), (1000, 1000)) == {0, 1, 2, 3}
+
+    grid.update((5, 5), (6, 6), 0)
+    assert grid.query((0.5, 0.5), (0.5, 0.5)) == {3}
+    assert grid.query((5.5, 5.5), (5.5, 5.5)) == {0, 3}
+    grid.remove(3)
+    assert grid.query((-1000, -1000), (1000, 1000)) == {0, 1, 2}
+
+
+def test_bounding_box_grid_random():
+    """Test that BoundingBoxGrid queries match a check of every box."""
+    rand = random.Random(0)
+    min_pts, max_pts = [], []
+    for _ in range(300):
+        x, y, z = rand.uniform(0, 100), rand.uniform(0, 100), rand.uniform(0, 1)
+        size = rand.choice((0.5, 2, 50))
+        min_pts.append(Point3D(x, y, z))
+        max_pts.append(Point3D(x + rand.uniform(0, size), y + rand.uniform(0, size), z))
+    grid = BoundingBoxGrid.from_boxes(min_pts, max_pts, 0.1)
+    for mn, mx in zip(min_pts, max_pts):
+        expected = set(
+            i for i, (o_mn, o_mx) in enumerate(zip(min_pts, max_pts))
+            if all(a <= d + 0.1 and c - 0.1 <= b
+                   for a, b, c, d in zip(mn, mx, o_mn, o_mx))
+        )
+        assert grid.query(mn, mx) == expected
+
+
+def _adjacent_polygons():
+    """Get a list of slightly misaligned polygons that are adjacent to one another."""
+    rand = random.Random(0)
+    polygons = []
+    for i in range(6):
+        for j in range(6):
+            x, y = i + rand.uniform(-0.004, 0.004), j + rand.uniform(-0.004, 0.004)
+            width = 1 if j % 2 == 0 else 0.5
+            for k in range(int(1 / width)):
+                x_k = x + k * width
+                pts = (Point2D(x_k, y), Point2D(x_k + width, y),
+                       Point2D(x_k + width, y + 1), Point2D(x_k, y + 1))
+                polygons.append(Polygon2D(pts))
+    return polygons
+
+
+def test_snap_polygons():
+    """Test that snap_polygons matches the result of Polygon2D.snap_polygons."""
+    polygons = _adjacent_polygons()
+    expected = Polygon2D.snap_polygons(polygons, 0.01)
+    result = snap_polygons(polygons, 0.01)
+    assert [p.vertices for p in result] == [p.vertices for p in expected]
+    assert snap_polygons([], 0.01) == []
+
+
+def test_intersect_polygon_segments():
+    """Test that intersect_polygon_segments matches that of Polygon2D."""
+    polygons = Polygon2D.snap_polygons(_adjacent_polygons(), 0.01)
+    expected = Polygon2D.intersect_polygon_segments(list(polygons), 0.01)
+    result = intersect_polygon_segments(list(polygons), 0.01)
+    assert [p.vertices for p in result] == [p.vertices for p in expected]
+    assert sum(len(p) for p in result) > sum(len(p) for p in polygons)
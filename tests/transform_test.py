@@ -0,0 +1,170 @@
+"""Test the batched geometry transforms."""
+import math
+import pytest
+
+from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D
+
+from fairyfly.shape import Shape
+from fairyfly.boundary import Boundary
+from fairyfly.model import Model
+from fairyfly.transform import GeometryBatch
+
+
+def _sample_objects():
+    """Get a list of shapes (one with a hole) and a list of boundaries."""
+    bound_pts = (Point3D(0, 0, 1), Point3D(4, 0, 1), Point3D(4, 4, 1), Point3D(0, 4, 1))
+    hole_pts = (Point3D(1, 1, 1), Point3D(3, 1, 1), Point3D(3, 3, 1), Point3D(1, 3, 1))
+    shapes = [
+        Shape(Face3D(bound_pts, holes=[hole_pts])),
+        Shape(Face3D((Point3D(0.1, 0.2, 0.3), Point3D(5.7, 0.3, 0.1),
+                      Point3D(4.3, 3.3, 2.9)))),
+    ]
+    boundaries = [
+        Boundary.from_vertices(((Point3D(0, 0, 0), Point3D(2.5, 0.1, 0.7)),
+                                (Point3D(2.5, 0.1, 0.7), Point3D(0.3, 6.1, 1.3)))),
+    ]
+    return shapes, boundaries
+
+
+def _assert_same_geometry(batch_objs, single_objs):
+    """Assert that shapes and boundaries have exactly the same geometry."""
+    for b_obj, s_obj in zip(batch_objs, single_objs):
+        if isinstance(b_obj, Shape):
+            b_geo, s_geo = b_obj.geometry, s_obj.geometry
+            assert b_geo.vertices == s_geo.vertices
+            assert b_geo.boundary == s_geo.boundary
+            assert b_geo.holes == s_geo.holes
+            assert b_geo.plane.n == s_geo.plane.n
+            assert b_geo.plane.o == s_geo.plane.o
+            assert b_geo.area == pytest.approx(s_geo.area, rel=1e-12)
+        else:
+            for b_seg, s_seg in zip(b_obj.geometry, s_obj.geometry):
+                assert b_seg.p == s_seg.p
+                assert b_seg.v == s_seg.v
+
+
+def test_geometry_batch_init():
+    """Test the initialization of GeometryBatch."""
+    shapes, boundaries = _sample_objects()
+    batch = GeometryBatch(shapes, boundaries)
+    assert len(batch) == 3
+    assert batch.point_count == 3 + 2  # shapes with holes are not in the array
+    assert batch.shapes == tuple(shapes)
+    assert batch.boundaries == tuple(boundaries)
+    assert len(GeometryBatch()) == 0
+
+
+def test_geometry_batch_transforms():
+    """Test that GeometryBatch transforms match transforming objects individually."""
+    axis, origin = Vector3D(0.3, -0.2, 1), Point3D(1.5, -2.5, 0.5)
+    plane = Plane(Vector3D(1, 1, 0.5), origin)
+    transforms = [
+        ('move', (Vector3D(2.1, -3.7, 0.4),), (Vector3D(2.1, -3.7, 0.4),)),
+        ('rotate', (axis, math.radians(37), origin), (axis, 37, origin)),
+        ('rotate_xy', (math.radians(-52), origin), (-52, origin)),
+        ('reflect', (plane.n, plane.o), (plane,)),
+        ('scale', (2.7, origin), (2.7, origin)),
+        ('scale', (0.3,), (0.3,)),
+    ]
+    for use_numpy in (True, False):
+        for method, batch_args, obj_args in transforms:
+            shapes, boundaries = _sample_objects()
+            batch = GeometryBatch(shapes, boundaries, use_numpy)
+            getattr(batch, method)(*batch_args)
+            single_shapes, single_bounds = _sample_objects()
+            single_objs = single_shapes + single_bounds
+            for obj in single_objs:
+                getattr(obj, method)(*obj_args)
+            _assert_same_geometry(shapes + boundaries, single_objs)
+
+
+def test_model_transforms():
+    """Test that Model transforms match transforming objects individually."""
+    shapes, boundaries = _sample_objects()
+    model = Model(shapes, boundaries)
+    axis, origin = Vector3D(0, 1, 1), Point3D(-1, 2, 3)
+    plane = Plane(Vector3D(0, 1, 0), Point3D(0, 2, 0))
+    model.move(Vector3D(1, 2, 3))
+    model.rotate(axis, 30, origin)
+    model.rotate_xy(45, origin)
+    model.reflect(plane)
+    model.scale(1.5, origin)
+    model.convert_to_units('Centimeters')
+    model.reset_coordinate_system()
+
+    shapes, boundaries = _sample_objects()
+    single_objs = shapes + boundaries
+    for obj in single_objs:
+        obj.move(Vector3D(1, 2, 3))
+        obj.rotate(axis, 30, origin)
+        obj.rotate_xy(45, origin)
+        obj.reflect(plane)
+        obj.scale(1.5, origin)
+        obj.scale(0.1)
+    min_pt, max_pt = Model(shapes, boundaries).min, Model(shapes, boundaries).max
+    for obj in single_objs:
+        obj.move(Vector3D(-min_pt.x, -max_pt.y, -max_pt.z))
+    _assert_same_geometry(model.shapes + model.boundaries, single_objs)
+
+
+def test_geometry_batch_double_reflect():
+    """Test that a batch reflected twice matches objects reflected twice."""
+    plane = Plane(Vector3D(1, 0, 0), Point3D(2, 0, 0))
+    shapes, boundaries = _sample_objects()
+    batch = GeometryBatch(shapes, boundaries)
+    batch.reflect(plane.n, plane.o)
+    batch.reflect(plane.n, plane.o)
+    single_shapes, single_bounds = _sample_objects()
+    single_objs = single_shapes + single_bounds
+    for obj in single_objs:
+        obj.reflect(plane)
+        obj.reflect(plane)
+    _assert_same_geometry(shapes + boundaries, single_objs)
+
+
+def test_geometry_batch_numpy():
+    """Test that the NumPy transforms match the pure Python transforms."""
+    pytest.importorskip('numpy')
+    axis, origin = Vector3D(0.3, -0.2, 1), Point3D(1.5, -2.5, 0.5)
+    transforms = [
+        ('move', (Vector3D(2.1, -3.7, 0.4),)),
+        ('rotate', (axis, math.radians(37), origin)),
+        ('rotate_xy', (math.radians(-52), origin)),
+        ('reflect', (Vector3D(1, 0, 0), origin)),
+        ('scale', (2.7, origin)),
+    ]
+    for method, args in transforms:
+        np_shapes, np_bounds = _sample_objects()
+        np_batch = GeometryBatch(np_shapes, np_bounds, use_numpy=True)
+        assert np_batch._use_numpy
+        getattr(np_batch, method)(*args)
+        shapes, boundaries = _sample_objects()
+        getattr(GeometryBatch(shapes, boundaries, use_numpy=False), method)(*args)
+        _assert_same_geometry(np_shapes + np_bounds, shapes + boundaries)
+
+
+class _TrackedShape(Shape):
+    """A Shape subclass that tracks the number of times that it has been moved."""
+    __slots__ = ('move_count',)
+
+    def move(self, moving_vec):
+        self.move_count = getattr(self, 'move_count', 0) + 1
+        Shape.move(self, moving_vec)
+
+
+def test_model_transforms_overridden():
+    """Test that Model transforms use the transform methods overridden by subclasses.
+    """
+    shapes, boundaries = _sample_objects()
+    tracked = _TrackedShape(shapes[1].geometry)
+    model = Model([shapes[0], tracked], boundaries)
+    model.move(Vector3D(1, 2, 3))
+    model.rotate_xy(45, Point3D())
+    assert tracked.move_count == 1
+
+    shapes, boundaries = _sample_objects()
+    single_objs = shapes + boundaries
+    for obj in single_objs:
+        obj.move(Vector3D(1, 2, 3))
+        obj.rotate_xy(45, Point3D())
+    _assert_same_geometry(model.shapes + model.boundaries, single_objs)
@@ -1,7 +1,9 @@
 """Test the typing functions."""
 import uuid
 
+import fairyfly.typing
 from fairyfly.typing import valid_uuid, therm_id_from_uuid, uuid_from_therm_id, \
+    generate_uuid, set_uuid_seed, \
     float_in_range, int_in_range, float_positive, int_positive, \
     tuple_with_length, list_with_length, \
     float_in_range_excl, float_in_range_excl_incl, float_in_range_incl_excl, \
@@ -24,6 +26,51 @@ def test_valid_uuid():
     correct_uuid = str(uuid.uuid4())
     assert valid_uuid(correct_uuid) == correct_uuid
 
+    # other forms that are accepted by the uuid module remain valid
+    upper_str = correct_str.upper()
+    assert valid_uuid(upper_str) == upper_str
+    braced_str = '{' + correct_str + '}'
+    assert valid_uuid(braced_str) == braced_str
+    with pytest.raises(ValueError):
+        valid_uuid(correct_str + '0')
+    with pytest.raises(ValueError):
+        valid_uuid(correct_str.replace('c', 'g'))
+
+
+def test_generate_uuid():
+    """Test the generate_uuid method."""
+    new_ids = [generate_uuid() for _ in range(1000)]
+    assert len(set(new_ids)) == 1000
+    for new_id in new_ids:
+        assert str(uuid.UUID(new_id)) == new_id
+        assert uuid.UUID(new_id).version == 4
+
+    # the pool is refilled when used in a different process
+    try:
+        set_uuid_seed(7)
+        seeded_ids = [generate_uuid() for _ in range(2)]
+        set_uuid_seed(7)
+        assert generate_uuid() == seeded_ids[0]
+        fairyfly.typing._uuid_pool_pid = -1  # simulate a forked process
+        assert generate_uuid() != seeded_ids[1]
+    finally:
+        set_uuid_seed(None)
+
+
+def test_set_uuid_seed():
+    """Test the set_uuid_seed method."""
+    try:
+        set_uuid_seed(42)
+        ids_1 = [generate_uuid() for _ in range(300)]
+        set_uuid_seed(42)
+        ids_2 = [generate_uuid() for _ in range(300)]
+        assert ids_1 == ids_2
+        for new_id in ids_1:
+            assert uuid.UUID(new_id).version == 4
+    finally:
+        set_uuid_seed(None)
+    assert generate_uuid() not in ids_1
+
 
 def test_therm_id():
     """Test the functions that convert back and forth between THERM and UUID."""